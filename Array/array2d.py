@@ -0,0 +1,274 @@
+from typing import Any
+from array import array
+from itertools import islice
+import operator
+
+from arrayadt import Array, ArrayView
+
+
+class Array2D:
+    """ Class Array2D - representing 2D data using one Array in row-major order
+            Stipulations:
+            1. Must store every cell in a single flat Array, so a grid is one object and one buffer
+            2. Must adhere to the docstring requirements per method, including raising
+               raising appropriate exceptions where indicated.
+            3. Slicing, row, column, blocks and transpose return views that share the storage.
+    """
+
+    #Number of rows __str__ shows before summarising the rest
+    _STR_LIMIT = 100
+
+    def __init__(self, rows: int, columns: int, typecode: str = None) -> None:
+        """ Constructor
+            Usages:  1. matrix = Array2D(3, 4)
+                     2. matrix = Array2D(3, 4, typecode='d')
+            @:param rows the number of rows
+            @:param columns the number of columns
+            @:param typecode optional array module typecode for typed storage (cells start at 0)
+            @:return none
+            @:raises ValueError if rows or columns is negative
+        """
+        if rows < 0 or columns < 0:
+            raise ValueError('Dimensions cannot be negative')
+
+        self._array = Array(size=rows * columns, typecode=typecode)
+        self._rows = rows
+        self._columns = columns
+        #Cell (row, column) is stored at _offset + row * _row_stride + column * _column_stride
+        self._offset = 0
+        self._row_stride = columns
+        self._column_stride = 1
+
+    @staticmethod
+    def from_rows(rows: list, typecode: str = None) -> 'Array2D':
+        """ Build an Array2D from a list of equally long rows
+            Usage: matrix = Array2D.from_rows([[1, 2], [3, 4]])
+            @:param rows a list of rows, each a list or tuple of cells
+            @:param typecode optional array module typecode for typed storage
+            @:return a new Array2D holding a copy of the cells
+            @:raises ValueError if the rows are not all the same length
+            @:raises TypeError if a cell does not fit the typecode
+        """
+        columns = len(rows[0]) if rows else 0
+        if any(len(row) != columns for row in rows):
+            raise ValueError('Rows must all be the same length')
+
+        instance = Array2D(0, 0, typecode)
+        cells = [cell for row in rows for cell in row]
+        #Typed cells are converted as Array does, so a cell that does not fit raises
+        storage = cells if typecode is None else array(typecode, cells)
+        instance._array = Array._from_storage(storage, typecode)
+        instance._rows = len(rows)
+        instance._columns = columns
+        instance._row_stride = columns
+        return instance
+
+    @staticmethod
+    def _view(array: Array, rows: int, columns: int, offset: int, row_stride: int,
+              column_stride: int) -> 'Array2D':
+        """ This is a private helper function that makes an Array2D over existing storage.
+        """
+        instance = Array2D(0, 0)
+        instance._array = array
+        instance._rows = rows
+        instance._columns = columns
+        instance._offset = offset
+        instance._row_stride = row_stride
+        instance._column_stride = column_stride
+        return instance
+
+    @staticmethod
+    def clone(array2d_instance: 'Array2D') -> 'Array2D':
+        """ Clone the Array2D into new contiguous storage
+            Usage:  matrix = Array2D.clone(instance)
+            @:param array2d_instance an Array2D instance (or view) to copy data from.
+            @:return a copy of the cells in a new, independent Array2D
+            @:raises TypeError if instance is provided and it is not an Array2D instance
+        """
+        if not isinstance(array2d_instance, Array2D):
+            raise TypeError('Instance is not an Array2D')
+
+        instance = Array2D(0, 0)
+        instance._array = Array._from_values(list(array2d_instance._cells()), array2d_instance.typecode)
+        instance._rows = array2d_instance._rows
+        instance._columns = array2d_instance._columns
+        instance._row_stride = array2d_instance._columns
+        return instance
+
+    @staticmethod
+    def _check_index(index: int, size: int, axis: str) -> int:
+        """ This is a private helper function that bounds checks an index along one axis and returns it
+            with negative indices counted back from the end.
+        """
+        position = index + size if index < 0 else index
+        if not 0 <= position < size:
+            raise IndexError(f'Array2D {axis} index {index} is out of range')
+
+        return position
+
+    def _axis_range(self, index: Any, size: int, axis: str) -> range:
+        """ This is a private helper function that turns an index or slice along one axis into a range.
+        """
+        if isinstance(index, slice):
+            return range(size)[index]
+
+        position = Array2D._check_index(index, size, axis)
+        return range(position, position + 1)
+
+    def __getitem__(self, key: tuple) -> Any:
+        """ Bracket operator for getting a cell or a view
+            Usage: 1. val = matrix[row, column]
+                   2. sub_matrix = matrix[0:2, 1:3]
+            @:param key a (row, column) pair of indices or slices
+            @:return the cell at (row, column), or an Array2D view sharing the storage if either is a slice
+            @:raises IndexError if an index is out of bounds
+        """
+        row, column = key
+        if isinstance(row, slice) or isinstance(column, slice):
+            rows = self._axis_range(row, self._rows, 'row')
+            columns = self._axis_range(column, self._columns, 'column')
+            offset = self._offset + rows.start * self._row_stride + columns.start * self._column_stride
+            return Array2D._view(self._array, len(rows), len(columns), offset,
+                                 self._row_stride * rows.step, self._column_stride * columns.step)
+
+        row = Array2D._check_index(row, self._rows, 'row')
+        column = Array2D._check_index(column, self._columns, 'column')
+        return self._array._items[self._offset + row * self._row_stride + column * self._column_stride]
+
+    def __setitem__(self, key: tuple, item: Any) -> None:
+        """ Bracket operator for setting a cell or a block of cells
+            Usage: 1. matrix[row, column] = val
+                   2. matrix[0:2, 0:2] = [[1, 2], [3, 4]]
+            @:param key a (row, column) pair of indices or slices
+            @:param item the cell to set, or a list of rows of cells when key has a slice
+            @:raises IndexError if an index is out of bounds
+            @:raises ValueError if the rows given do not match the shape of the sliced block
+            @:return none
+        """
+        row, column = key
+        if isinstance(row, slice) or isinstance(column, slice):
+            view = self[key]
+            item = list(item)
+            if len(item) != view._rows:
+                raise ValueError(f'Cannot assign {len(item)} rows to a block of {view._rows} rows')
+            for index, cells in enumerate(item):
+                view.row(index)[:] = cells
+            return
+
+        row = Array2D._check_index(row, self._rows, 'row')
+        column = Array2D._check_index(column, self._columns, 'column')
+        position = self._offset + row * self._row_stride + column * self._column_stride
+        self._array._own()
+        old = self._array._items[position]
+        #Store first, so a cell that does not fit the typecode leaves the ranges untouched
+        self._array._items[position] = item
+        if self._array._range_indexes:
+            self._array._update_ranges(position, old, self._array._items[position])
+
+    def row(self, index: int) -> ArrayView:
+        """ Get a row as a view
+            Usage: row = matrix.row(0)
+            @:param index the desired row
+            @:return an ArrayView of the row's cells sharing the storage
+            @:raises IndexError if the index is out of bounds
+        """
+        start = self._offset + Array2D._check_index(index, self._rows, 'row') * self._row_stride
+        return ArrayView(self._array, range(start, start + self._columns * self._column_stride,
+                                            self._column_stride))
+
+    def column(self, index: int) -> ArrayView:
+        """ Get a column as a view
+            Usage: column = matrix.column(0)
+            @:param index the desired column
+            @:return an ArrayView of the column's cells sharing the storage
+            @:raises IndexError if the index is out of bounds
+        """
+        start = self._offset + Array2D._check_index(index, self._columns, 'column') * self._column_stride
+        return ArrayView(self._array, range(start, start + self._rows * self._row_stride, self._row_stride))
+
+    def transpose(self) -> 'Array2D':
+        """ Get the transpose as a view, without moving any cells
+            Usage: transposed = matrix.transpose()
+            @:return an Array2D view whose cell (column, row) is this Array2D's cell (row, column)
+        """
+        return Array2D._view(self._array, self._columns, self._rows, self._offset, self._column_stride,
+                             self._row_stride)
+
+    def blocks(self, block_rows: int, block_columns: int) -> Any:
+        """ Iterate the Array2D in tiles, row of tiles by row of tiles
+            Usage: for block in matrix.blocks(8, 8):
+            @:param block_rows the number of rows per tile
+            @:param block_columns the number of columns per tile
+            @:return yields Array2D views of each tile; tiles at the edges may be smaller
+            @:raises ValueError if a block dimension is less than 1
+        """
+        if block_rows < 1 or block_columns < 1:
+            raise ValueError('Block dimensions must be at least 1')
+
+        for row in range(0, self._rows, block_rows):
+            for column in range(0, self._columns, block_columns):
+                yield self[row:row + block_rows, column:column + block_columns]
+
+    def _cells(self) -> Any:
+        """ This is a private helper function that iterates every cell in row-major order.
+        """
+        for row in range(self._rows):
+            yield from self.row(row)
+
+    @property
+    def shape(self) -> tuple:
+        """ Get the dimensions
+            Usage: rows, columns = matrix.shape
+            @:return a (rows, columns) tuple
+        """
+        return self._rows, self._columns
+
+    @property
+    def typecode(self) -> str:
+        """ Get the typecode of the backing storage
+            Usage: typecode = matrix.typecode
+            @:return the array module typecode, or None if the cells are Python objects
+        """
+        return self._array.typecode
+
+    def __len__(self) -> int:
+        """ len operator for getting the number of rows
+            Usage: rows = len(matrix)
+            @:return the number of rows
+        """
+        return self._rows
+
+    def __iter__(self) -> Any:
+        """ Iterator operator, row by row
+            Usage: for row in matrix:
+            @:return yields an ArrayView of each row in order
+        """
+        for row in range(self._rows):
+            yield self.row(row)
+
+    def __eq__(self, other: 'Array2D') -> bool:
+        """ Equality operator ==
+            Usage: are_equal = matrix1 == matrix2
+            @:param other the instance to compare self to
+            @:return true if the shapes and every cell are equal
+        """
+        if type(other) != type(self):
+            return False
+
+        if self.shape != other.shape:
+            return False
+
+        return all(map(operator.eq, self._cells(), other._cells()))
+
+    def __str__(self) -> str:
+        """ Return a string representation of the data and structure, one row per line. Only the first
+            _STR_LIMIT rows are shown, followed by a count of the rest.
+            Usage: print(matrix):
+            @:return str the string representation of the data and structure
+        """
+        lines = [str(row) for row in islice(self, Array2D._STR_LIMIT)]
+        hidden = self._rows - Array2D._STR_LIMIT
+        if hidden > 0:
+            lines.append(f'... {hidden} more rows')
+
+        return '\n'.join(lines)
@@ -0,0 +1,52 @@
+""" Compare Array.sort, partial_sort and nth_element against copying the items out to a list, sorting the
+    list and copying each item back through __setitem__.
+    Usage: python benchmark_sort.py [length]
+"""
+import random
+import sys
+import timeit
+
+from arrayadt import Array
+
+
+def copy_out_sort(array: Array) -> None:
+    """ The approach Array.sort replaces: sort a copy, then write it back one item at a time.
+    """
+    values = sorted(array)
+    for index, value in enumerate(values):
+        array[index] = value
+
+
+def main(length: int) -> None:
+    cases = [
+        ('object', None, lambda: random.random()),
+        ('int16', 'h', lambda: random.randrange(-2 ** 15, 2 ** 15)),
+        ('uint8', 'B', lambda: random.randrange(2 ** 8)),
+        ('int64', 'q', lambda: random.randrange(-2 ** 63, 2 ** 63)),
+        ('float64', 'd', lambda: random.random()),
+    ]
+    k = max(1, length // 100)
+    print(f'{length} items, best of 3, seconds; partial sorts the smallest {k}')
+    print(f'{"storage":10}{"copy-out":>12}{"sort":>12}{"partial":>12}{"nth":>12}')
+    for name, typecode, make in cases:
+        values = [make() for _ in range(length)]
+
+        def timed(operation) -> float:
+            return min(timeit.repeat(operation, setup=reset, number=1, repeat=3))
+
+        def reset() -> None:
+            nonlocal array
+            array = Array(values, typecode=typecode)
+
+        array = None
+        results = [
+            timed(lambda: copy_out_sort(array)),
+            timed(lambda: array.sort()),
+            timed(lambda: array.partial_sort(k)),
+            timed(lambda: array.nth_element(length // 2)),
+        ]
+        print(f'{name:10}' + ''.join(f'{result:12.4f}' for result in results))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
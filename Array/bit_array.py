@@ -0,0 +1,324 @@
+from typing import Any
+from collections.abc import Iterable
+from itertools import islice
+
+
+class BitArray:
+    """ Class BitArray - representing 1D flags using one bit per element in a bytearray
+            Stipulations:
+            1. Must pack eight flags per byte, padded to whole 64 bit words, with every bit past the
+               length kept clear
+            2. Must adhere to the docstring requirements per method, including raising
+               raising appropriate exceptions where indicated.
+            3. Bulk operations work on whole words rather than bit by bit.
+    """
+
+    #Number of bytes in the machine word the storage is padded to and scanned by
+    _WORD = 8
+
+    #Number of bits __str__ shows before summarising the rest
+    _STR_LIMIT = 100
+
+    def __init__(self, *items, size: int = 0) -> None:
+        """ Constructor
+            Usages:  1. bits = BitArray(size=1000)
+                     2. bits = BitArray(1, 0, 1)
+                     3. bits = BitArray([True, False, True])
+            @:param *items the flags, or a single iterable of them; each is stored as its truth value
+            @:param size the desired number of bits, all clear (use 0 if providing initialization items)
+            @:return none
+            @:raises ValueError if size is negative
+        """
+        if size < 0:
+            raise ValueError('Size cannot be negative')
+
+        if len(items) == 1 and isinstance(items[0], Iterable):
+            items = list(items[0])
+
+        self._size = len(items) if items else size
+        self._bits = bytearray(BitArray._storage_size(self._size))
+        for index, item in enumerate(items):
+            if item:
+                self._bits[index >> 3] |= 1 << (index & 7)
+
+    @staticmethod
+    def _storage_size(size: int) -> int:
+        """ This is a private helper function that returns the bytes needed for size bits, rounded up to
+            whole words.
+        """
+        words = (size + BitArray._WORD * 8 - 1) // (BitArray._WORD * 8)
+        return words * BitArray._WORD
+
+    @staticmethod
+    def clone(bit_array_instance: 'BitArray') -> 'BitArray':
+        """ Clone the BitArray
+            Usage:  bits = BitArray.clone(instance)
+            @:param bit_array_instance a BitArray instance to copy data from.
+            @:return a copy of the BitArray
+            @:raises TypeError if instance is provided and it is not a BitArray instance
+        """
+        if not isinstance(bit_array_instance, BitArray):
+            raise TypeError('Instance is not a BitArray')
+
+        return BitArray._from_bits(bytearray(bit_array_instance._bits), bit_array_instance._size)
+
+    @staticmethod
+    def _from_bits(bits: bytearray, size: int) -> 'BitArray':
+        """ This is a private helper function that wraps existing padded storage without copying it.
+        """
+        instance = BitArray()
+        instance._bits = bits
+        instance._size = size
+        return instance
+
+    def _check_index(self, index: int) -> int:
+        """ This is a private helper function that bounds checks an index and returns it with negative
+            indices counted back from the end.
+        """
+        position = index + self._size if index < 0 else index
+        if not 0 <= position < self._size:
+            raise IndexError(f'BitArray index {index} is out of range')
+
+        return position
+
+    def __getitem__(self, index: int) -> bool:
+        """ Bracket operator for getting a flag
+            Usage: is_set = bits[0]
+            @:param index the desired index
+            @:return true if the bit at the index is set
+            @:raises IndexError if the index is out of bounds
+        """
+        position = self._check_index(index)
+        return bool(self._bits[position >> 3] >> (position & 7) & 1)
+
+    def __setitem__(self, index: int, item: Any) -> None:
+        """ Bracket operator for setting a flag
+            Usage: bits[index] = True
+            @:param index the desired index to set
+            @:param item the flag to set at index, stored as its truth value
+            @:raises IndexError if the index is out of bounds
+            @:return none
+        """
+        position = self._check_index(index)
+        if item:
+            self._bits[position >> 3] |= 1 << (position & 7)
+        else:
+            self._bits[position >> 3] &= ~(1 << (position & 7)) & 0xFF
+
+    def __len__(self) -> int:
+        """ len operator for getting the number of bits
+            Usage: for i in range(len(bits))
+            @:return the number of bits
+        """
+        return self._size
+
+    def _clear_tail(self) -> None:
+        """ This is a private helper function that clears the bits past the length in the last used byte,
+            so bulk operations never see them.
+        """
+        if self._size & 7:
+            self._bits[self._size >> 3] &= (1 << (self._size & 7)) - 1
+
+    def resize(self, new_size: int) -> None:
+        """ Resize a BitArray. New bits are clear.
+            Usage: bits.resize(5)
+            @:param new_size the desired new number of bits
+            @:return none
+            @:raises ValueError if new_size is negative
+        """
+        if new_size < 0:
+            raise ValueError('Size cannot be negative')
+
+        storage_size = BitArray._storage_size(new_size)
+        if storage_size > len(self._bits):
+            self._bits.extend(bytes(storage_size - len(self._bits)))
+        elif storage_size < len(self._bits):
+            del self._bits[storage_size:]
+
+        if new_size < self._size:
+            #Clear the dropped bits still inside the kept words
+            used = (new_size + 7) >> 3
+            self._bits[used:] = bytes(len(self._bits) - used)
+            self._size = new_size
+            self._clear_tail()
+        else:
+            self._size = new_size
+
+    def _as_int(self) -> int:
+        """ This is a private helper function that reads the storage as one little endian integer, so the
+            bitwise operators run over whole words in C.
+        """
+        return int.from_bytes(self._bits, 'little')
+
+    def _combine(self, result: int) -> 'BitArray':
+        """ This is a private helper function that wraps the result of a bulk operation.
+        """
+        return BitArray._from_bits(bytearray(result.to_bytes(len(self._bits), 'little')), self._size)
+
+    def _check_other(self, other: 'BitArray') -> None:
+        """ This is a private helper function that checks the other operand of a bulk operation.
+        """
+        if not isinstance(other, BitArray):
+            raise TypeError('Operand is not a BitArray')
+        if other._size != self._size:
+            raise ValueError(f'Cannot combine BitArrays of {self._size} and {other._size} bits')
+
+    def __and__(self, other: 'BitArray') -> 'BitArray':
+        """ Bitwise and operator &, a word at a time
+            Usage: both = bits1 & bits2
+            @:param other a BitArray of the same length
+            @:return a new BitArray with the bits set in both
+            @:raises TypeError if other is not a BitArray
+            @:raises ValueError if the lengths differ
+        """
+        self._check_other(other)
+        return self._combine(self._as_int() & other._as_int())
+
+    def __or__(self, other: 'BitArray') -> 'BitArray':
+        """ Bitwise or operator |, a word at a time
+            Usage: either = bits1 | bits2
+            @:param other a BitArray of the same length
+            @:return a new BitArray with the bits set in either
+            @:raises TypeError if other is not a BitArray
+            @:raises ValueError if the lengths differ
+        """
+        self._check_other(other)
+        return self._combine(self._as_int() | other._as_int())
+
+    def __xor__(self, other: 'BitArray') -> 'BitArray':
+        """ Bitwise exclusive or operator ^, a word at a time
+            Usage: differ = bits1 ^ bits2
+            @:param other a BitArray of the same length
+            @:return a new BitArray with the bits set in exactly one of the two
+            @:raises TypeError if other is not a BitArray
+            @:raises ValueError if the lengths differ
+        """
+        self._check_other(other)
+        return self._combine(self._as_int() ^ other._as_int())
+
+    def __invert__(self) -> 'BitArray':
+        """ Bitwise not operator ~, a word at a time
+            Usage: unset = ~bits
+            @:return a new BitArray with every bit flipped
+        """
+        return self._combine(self._as_int() ^ ((1 << self._size) - 1))
+
+    def popcount(self) -> int:
+        """ Count the set bits, a word at a time
+            Usage: count = bits.popcount()
+            @:return the number of set bits
+        """
+        return self._as_int().bit_count()
+
+    def find_first_set(self, start: int = 0) -> int:
+        """ Find the first set bit at or after start, skipping clear words without looking at their bits
+            Usage: index = bits.find_first_set()
+            @:param start the index to start searching from
+            @:return the index of the first set bit, or -1 if there is none
+        """
+        if start >= self._size:
+            return -1
+
+        start = max(start, 0)
+        word_bits = BitArray._WORD * 8
+        view = memoryview(self._bits)
+        offset = start - start % word_bits
+        #Mask off the bits before start in the first word only
+        mask = ~((1 << (start % word_bits)) - 1)
+        for byte in range(offset // 8, len(self._bits), BitArray._WORD):
+            word = int.from_bytes(view[byte:byte + BitArray._WORD], 'little') & mask
+            if word:
+                return byte * 8 + (word & -word).bit_length() - 1
+            mask = -1
+
+        return -1
+
+    def set_range(self, start: int, stop: int, item: Any = True) -> None:
+        """ Set or clear every bit in the half-open range [start, stop). Whole bytes are filled in one
+            slice assignment and only the partial bytes at the ends are masked.
+            Usage: bits.set_range(10, 20)
+            @:param start the first index to set
+            @:param stop the index to stop before
+            @:param item the flag to set, stored as its truth value
+            @:raises IndexError if the range is outside the BitArray
+            @:return none
+        """
+        if not 0 <= start <= stop <= self._size:
+            raise IndexError(f'BitArray range [{start}, {stop}) is out of range')
+
+        first, last = (start + 7) >> 3, stop >> 3
+        if first > last:
+            #The range lies inside a single byte
+            self._set_byte_bits(start >> 3, start & 7, stop & 7, item)
+            return
+
+        self._bits[first:last] = (b'\xff' if item else b'\x00') * (last - first)
+        if start & 7:
+            self._set_byte_bits(start >> 3, start & 7, 8, item)
+        if stop & 7:
+            self._set_byte_bits(last, 0, stop & 7, item)
+
+    def _set_byte_bits(self, byte: int, low: int, high: int, item: Any) -> None:
+        """ This is a private helper function that sets or clears bits [low, high) of one byte.
+        """
+        mask = ((1 << high) - 1) & ~((1 << low) - 1)
+        if item:
+            self._bits[byte] |= mask
+        else:
+            self._bits[byte] &= ~mask & 0xFF
+
+    def __iter__(self) -> Any:
+        """ Iterator operator
+            Usage: for is_set in bits:
+            @:return yields each flag in order as a bool
+        """
+        remaining = self._size
+        for byte in self._bits:
+            for shift in range(min(8, remaining)):
+                yield bool(byte >> shift & 1)
+            remaining -= 8
+            if remaining <= 0:
+                return
+
+    def __contains__(self, item: Any) -> bool:
+        """ Contains operator (in)
+            Usage: if True in bits:
+            @:param item the flag to look for, compared by its truth value
+            @:return true if any bit has that value
+        """
+        if item:
+            return self.find_first_set() != -1
+
+        return self.popcount() < self._size
+
+    def __eq__(self, other: 'BitArray') -> bool:
+        """ Equality operator ==
+            Usage: are_equal = bits1 == bits2
+            @:param other the instance to compare self to
+            @:return true if the lengths and every bit are equal
+        """
+        if type(other) != type(self):
+            return False
+
+        return self._size == other._size and self._bits == other._bits
+
+    def __ne__(self, other: 'BitArray') -> bool:
+        """ Non-equality operator !=
+            Usage: are_equal = bits1 != bits2
+            @:param other the instance to compare self to
+            @:return true if the lengths or any bit differ
+        """
+        return not self == other
+
+    def __str__(self) -> str:
+        """ Return a string representation of the data and structure, with bits shown as 0 and 1. Only
+            the first _STR_LIMIT bits are shown, followed by a count of the rest.
+            Usage: print(bits):
+            @:return str the string representation of the data and structure
+        """
+        shown = ', '.join([str(int(i)) for i in islice(self, BitArray._STR_LIMIT)])
+        hidden = self._size - BitArray._STR_LIMIT
+        if hidden > 0:
+            return '[' + shown + f', ... {hidden} more]'
+
+        return '[' + shown + ']'
@@ -0,0 +1,351 @@
+from typing import Any
+from array import array
+from collections import OrderedDict
+from itertools import islice
+import lzma
+import operator
+import pickle
+import zlib
+
+from arrayadt import Array
+
+
+class CompressedArray:
+    """ Class CompressedArray - representing large, rarely touched 1D data as compressed fixed-size chunks
+            Stipulations:
+            1. Must keep every chunk compressed with zlib or lzma, except the few most recently used
+               ones, which are held decompressed in a small LRU cache
+            2. Must adhere to the docstring requirements per method, including raising
+               raising appropriate exceptions where indicated.
+            3. Must offer the same indexing and iteration interface as Array.
+    """
+
+    #Compression modules by codec name
+    _CODECS = {'zlib': zlib, 'lzma': lzma}
+
+    #Number of items __str__ shows before summarising the rest
+    _STR_LIMIT = 100
+
+    def __init__(self, *items, size: int = 0, typecode: str = None, chunk_size: int = 4096,
+                 codec: str = 'zlib', cache_size: int = 8) -> None:
+        """ Constructor
+            Usages:  1. compressed = CompressedArray(range(1000000), typecode='i')
+                     2. compressed = CompressedArray(size=1000000, typecode='d', codec='lzma')
+            @:param *items the items, flattened as for Array
+            @:param size the desired size (use 0 if providing initialization items)
+            @:param typecode optional array module typecode; typed chunks compress the raw buffer,
+                     object chunks compress a pickle
+            @:param chunk_size the number of items per chunk
+            @:param codec 'zlib' (faster) or 'lzma' (smaller)
+            @:param cache_size the number of decompressed chunks kept in the LRU cache
+            @:return none
+            @:raises ValueError if codec is unknown, or chunk_size or cache_size is less than 1
+        """
+        if codec not in CompressedArray._CODECS:
+            raise ValueError(f'Unknown codec {codec}, use one of {", ".join(CompressedArray._CODECS)}')
+        if chunk_size < 1 or cache_size < 1:
+            raise ValueError('Chunk size and cache size must be at least 1')
+
+        self._typecode = typecode
+        self._chunk_size = chunk_size
+        self._codec = CompressedArray._CODECS[codec]
+        self._cache_size = cache_size
+        #Maps chunk number to [decompressed storage, dirty flag], least recently used first
+        self._cache = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+        self._length = 0
+        self._chunks = []
+        if items:
+            #Chunks are compressed as they fill, so the uncompressed items are never all in memory
+            writer = _ChunkWriter(self)
+            Array._flatten_into(writer, items)
+            writer.close()
+        else:
+            self.resize(size)
+
+    @staticmethod
+    def from_array(array_instance: Array, chunk_size: int = 4096, codec: str = 'zlib',
+                   cache_size: int = 8) -> 'CompressedArray':
+        """ Compress an Array
+            Usage:  compressed = CompressedArray.from_array(array, codec='lzma')
+            @:param array_instance the Array to copy the items from
+            @:param chunk_size the number of items per chunk
+            @:param codec 'zlib' (faster) or 'lzma' (smaller)
+            @:param cache_size the number of decompressed chunks kept in the LRU cache
+            @:return a new CompressedArray holding the items
+            @:raises TypeError if array_instance is not an Array
+        """
+        if not isinstance(array_instance, Array):
+            raise TypeError('Instance is not an Array')
+
+        compressed = CompressedArray(typecode=array_instance.typecode, chunk_size=chunk_size, codec=codec,
+                                     cache_size=cache_size)
+        #Whole slices of the storage are compressed as they are, so items are never flattened again
+        for chunk in array_instance.iter_chunks(chunk_size):
+            compressed._chunks.append(compressed._compress(chunk))
+            compressed._length += len(chunk)
+
+        return compressed
+
+    def to_array(self) -> Array:
+        """ Decompress into an ordinary Array
+            Usage:  array = compressed.to_array()
+            @:return a new Array holding the items
+        """
+        storage = Array._allocate(0, self._typecode)
+        for chunk in range(len(self._chunks)):
+            storage.extend(self._peek(chunk))
+
+        return Array._from_storage(storage, self._typecode)
+
+    def _compress(self, storage) -> bytes:
+        """ This is a private helper function that compresses one chunk of storage.
+        """
+        if self._typecode is None:
+            return self._codec.compress(pickle.dumps(storage, protocol=pickle.HIGHEST_PROTOCOL))
+
+        return self._codec.compress(storage.tobytes())
+
+    def _decompress(self, chunk: int):
+        """ This is a private helper function that decompresses one chunk into storage.
+        """
+        data = self._codec.decompress(self._chunks[chunk])
+        if self._typecode is None:
+            return pickle.loads(data)
+
+        storage = array(self._typecode)
+        storage.frombytes(data)
+        return storage
+
+    def _peek(self, chunk: int):
+        """ This is a private helper function that returns a chunk's storage for reading only. A chunk
+            that is not cached is decompressed without being cached, so one scan does not evict the
+            hot chunks.
+        """
+        entry = self._cache.get(chunk)
+        if entry is not None:
+            self._hits += 1
+            return entry[0]
+
+        self._misses += 1
+        return self._decompress(chunk)
+
+    def _load(self, chunk: int) -> list:
+        """ This is a private helper function that returns a chunk's cache entry, decompressing it and
+            evicting the least recently used chunk (recompressing it if it was changed) on a miss.
+        """
+        entry = self._cache.get(chunk)
+        if entry is not None:
+            self._hits += 1
+            self._cache.move_to_end(chunk)
+            return entry
+
+        self._misses += 1
+        if len(self._cache) >= self._cache_size:
+            evicted, (storage, dirty) = self._cache.popitem(last=False)
+            if dirty:
+                self._chunks[evicted] = self._compress(storage)
+
+        entry = [self._decompress(chunk), False]
+        self._cache[chunk] = entry
+        return entry
+
+    def _check_index(self, index: int) -> int:
+        """ This is a private helper function that bounds checks an index and returns it with negative
+            indices counted back from the end.
+        """
+        position = index + self._length if index < 0 else index
+        if not 0 <= position < self._length:
+            raise IndexError(f'CompressedArray index {index} is out of range')
+
+        return position
+
+    def __getitem__(self, index: int) -> Any:
+        """ Bracket operator for getting an item
+            Usage: val = compressed[0]
+            @:param index the desired index
+            @:return the item at the index
+            @:raises IndexError if the index is out of bounds
+        """
+        chunk, offset = divmod(self._check_index(index), self._chunk_size)
+        return self._load(chunk)[0][offset]
+
+    def __setitem__(self, index: int, item: Any) -> None:
+        """ Bracket operator for setting an item. The chunk is recompressed when it leaves the cache.
+            Usage: compressed[index] = val
+            @:param index the desired index to set
+            @:param item the desired item to set at index
+            @:raises IndexError if the index is out of bounds
+            @:raises TypeError if the item does not fit the typecode
+            @:return none
+        """
+        chunk, offset = divmod(self._check_index(index), self._chunk_size)
+        entry = self._load(chunk)
+        entry[0][offset] = item
+        entry[1] = True
+
+    def __len__(self) -> int:
+        """ len operator for getting length of the array
+            Usage: for i in range(len(compressed))
+            @:return the length of the CompressedArray
+        """
+        return self._length
+
+    def resize(self, new_size: int) -> None:
+        """ Resize a CompressedArray. New slots are empty (None, or 0 when typed).
+            Usage: compressed.resize(5)
+            @:param new_size the desired new size
+            @:return none
+            @:raises ValueError if new_size is negative
+        """
+        if new_size < 0:
+            raise ValueError('Size cannot be negative')
+
+        self.flush()
+        self._cache.clear()
+        chunks = -(-new_size // self._chunk_size)
+        del self._chunks[chunks:]
+        if self._chunks:
+            #Only the last kept chunk changes length; the whole chunks after it are all the same
+            last = self._decompress(len(self._chunks) - 1)
+            used = min(new_size - (len(self._chunks) - 1) * self._chunk_size, self._chunk_size)
+            del last[used:]
+            last.extend(Array._allocate(used - len(last), self._typecode))
+            self._chunks[-1] = self._compress(last)
+
+        if chunks > len(self._chunks):
+            empty = self._compress(Array._allocate(self._chunk_size, self._typecode))
+            self._chunks.extend([empty] * (chunks - len(self._chunks) - 1))
+            self._chunks.append(self._compress(Array._allocate(new_size - (chunks - 1) * self._chunk_size,
+                                                               self._typecode)))
+
+        self._length = new_size
+
+    def flush(self) -> None:
+        """ Recompress every changed chunk in the cache, keeping them cached
+            Usage: compressed.flush()
+            @:return none
+        """
+        for chunk, entry in self._cache.items():
+            if entry[1]:
+                self._chunks[chunk] = self._compress(entry[0])
+                entry[1] = False
+
+    def cache_stats(self) -> dict:
+        """ Report how well the chunk cache and the compression are working
+            Usage: stats = compressed.cache_stats()
+            @:return a dict with the cache 'hits' and 'misses', the 'hit_ratio', the number of 'chunks'
+                     and 'cached' chunks, and the 'compressed_bytes' of the stored chunks
+        """
+        lookups = self._hits + self._misses
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'hit_ratio': self._hits / lookups if lookups else 0.0,
+            'chunks': len(self._chunks),
+            'cached': len(self._cache),
+            'compressed_bytes': sum(map(len, self._chunks)),
+        }
+
+    @property
+    def typecode(self) -> str:
+        """ Get the typecode of the chunks
+            Usage: typecode = compressed.typecode
+            @:return the array module typecode, or None if the chunks hold Python objects
+        """
+        return self._typecode
+
+    def __iter__(self) -> Any:
+        """ Iterator operator, decompressing one chunk at a time without disturbing the cache
+            Usage: for item in compressed:
+            @:return yields the items in order
+        """
+        for chunk in range(len(self._chunks)):
+            yield from self._peek(chunk)
+
+    def __contains__(self, item: Any) -> bool:
+        """ Contains operator (in)
+            Usage: if 3 in compressed:
+            @:param item the desired item to check whether it's in the array
+            @:return true if the array contains the item
+        """
+        return any(candidate == item for candidate in self)
+
+    def __eq__(self, other: 'CompressedArray') -> bool:
+        """ Equality operator ==
+            Usage: are_equal = compressed1 == compressed2
+            @:param other the instance to compare self to
+            @:return true if the arrays are equal (deep check)
+        """
+        if type(other) != type(self):
+            return False
+
+        return len(self) == len(other) and all(map(operator.eq, self, other))
+
+    def __ne__(self, other: 'CompressedArray') -> bool:
+        """ Non-equality operator !=
+            Usage: are_equal = compressed1 != compressed2
+            @:param other the instance to compare self to
+            @:return true if the arrays are not equal (deep check)
+        """
+        return not self == other
+
+    def __str__(self) -> str:
+        """ Return a string representation of the data and structure. Only the first _STR_LIMIT items
+            are shown, followed by a count of the rest.
+            Usage: print(compressed):
+            @:return str the string representation of the data and structure
+        """
+        shown = ', '.join([str(i) for i in islice(self, CompressedArray._STR_LIMIT)])
+        hidden = self._length - CompressedArray._STR_LIMIT
+        if hidden > 0:
+            return '[' + shown + f', ... {hidden} more]'
+
+        return '[' + shown + ']'
+
+
+class _ChunkWriter:
+    """ Class _ChunkWriter - a private sink for Array._flatten_into that compresses each chunk of a
+            CompressedArray as soon as it fills.
+    """
+
+    def __init__(self, compressed: CompressedArray) -> None:
+        """ Constructor
+            @:param compressed the empty CompressedArray to fill
+        """
+        self._compressed = compressed
+        self._storage = Array._allocate(0, compressed._typecode)
+
+    def _emit(self) -> None:
+        """ This is a private helper function that compresses the pending chunk and starts a new one.
+        """
+        self._compressed._chunks.append(self._compressed._compress(self._storage))
+        self._compressed._length += len(self._storage)
+        self._storage = Array._allocate(0, self._compressed._typecode)
+
+    def append(self, item: Any) -> None:
+        """ Add one item to the pending chunk.
+        """
+        self._storage.append(item)
+        if len(self._storage) == self._compressed._chunk_size:
+            self._emit()
+
+    def extend(self, items: Any) -> None:
+        """ Add several items to the pending chunk, a slice at a time.
+        """
+        items = list(items)
+        start = 0
+        while start < len(items):
+            stop = start + self._compressed._chunk_size - len(self._storage)
+            self._storage.extend(items[start:stop])
+            start = stop
+            if len(self._storage) == self._compressed._chunk_size:
+                self._emit()
+
+    def close(self) -> None:
+        """ Compress the last, partly filled chunk.
+        """
+        if self._storage:
+            self._emit()
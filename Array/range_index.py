@@ -0,0 +1,194 @@
+from typing import Any
+
+from arrayadt import Array
+
+
+class RangeIndex:
+    """ Class RangeIndex - answering range sum, min and max queries over an Array in O(log n)
+            Stipulations:
+            1. Must keep a Fenwick tree of prefix sums, and optionally segment trees of minimums and
+               maximums, updated in O(log n) whenever an item is set through the Array
+            2. Must adhere to the docstring requirements per method, including raising
+               raising appropriate exceptions where indicated.
+            3. Any other change to the Array (resize, del, slice assignment, fill, sort) marks the trees
+               stale and the next query rebuilds them in O(n).
+    """
+
+    def __init__(self, array: Array, min_max: bool = False) -> None:
+        """ Constructor, which attaches the RangeIndex to the Array
+            Usages:  1. ranges = RangeIndex(array)
+                     2. ranges = RangeIndex(array, min_max=True)
+            @:param array the Array to index; every item must be a number
+            @:param min_max use True to also keep segment trees for min and max queries
+            @:return none
+            @:raises TypeError if array is not an Array
+        """
+        if not isinstance(array, Array):
+            raise TypeError('Instance is not an Array')
+
+        self._array = array
+        self._min_max = min_max
+        self._size = 0
+        #_sums[i] holds the sum of the (i & -i) items ending at item i - 1 (1-based Fenwick layout)
+        self._sums = [0]
+        #Segment trees with the items in the leaves from _leaves on and each parent at i // 2
+        self._leaves = 1
+        self._mins = None
+        self._maxs = None
+        self._stale = True
+        array._range_indexes.append(self)
+
+    def detach(self) -> None:
+        """ Stop tracking the Array, so setting items no longer pays for the updates
+            Usage: ranges.detach()
+            @:return none
+        """
+        if self in self._array._range_indexes:
+            self._array._range_indexes.remove(self)
+        self._stale = True
+
+    def rebuild(self) -> None:
+        """ Rebuild the trees from the Array in O(n)
+            Usage: ranges.rebuild()
+            @:return none
+            @:raises TypeError if an item is not a number
+        """
+        values = list(self._array._live())
+        self._size = len(values)
+        self._sums = [0] + values
+        for i in range(1, self._size + 1):
+            parent = i + (i & -i)
+            if parent <= self._size:
+                self._sums[parent] += self._sums[i]
+
+        if self._min_max:
+            self._leaves = 1
+            while self._leaves < self._size:
+                self._leaves *= 2
+            self._mins = RangeIndex._build_tree(values, self._leaves, min)
+            self._maxs = RangeIndex._build_tree(values, self._leaves, max)
+
+        self._stale = False
+
+    @staticmethod
+    def _build_tree(values: list, leaves: int, combine) -> list:
+        """ This is a private helper function that builds a segment tree bottom up. Unused leaves hold
+            None and are skipped when combining.
+        """
+        tree = [None] * leaves + values + [None] * (leaves - len(values))
+        for i in range(leaves - 1, 0, -1):
+            left, right = tree[2 * i], tree[2 * i + 1]
+            tree[i] = left if right is None else right if left is None else combine(left, right)
+
+        return tree
+
+    def _update(self, index: int, old: Any, item: Any) -> None:
+        """ This is a private helper function that the Array calls when item replaces old at index.
+        """
+        if self._stale:
+            return
+
+        delta = item - old
+        i = index + 1
+        while i <= self._size:
+            self._sums[i] += delta
+            i += i & -i
+
+        if self._min_max:
+            RangeIndex._update_tree(self._mins, self._leaves + index, item, min)
+            RangeIndex._update_tree(self._maxs, self._leaves + index, item, max)
+
+    @staticmethod
+    def _update_tree(tree: list, leaf: int, item: Any, combine) -> None:
+        """ This is a private helper function that sets a leaf and recombines its ancestors.
+        """
+        tree[leaf] = item
+        i = leaf // 2
+        while i:
+            left, right = tree[2 * i], tree[2 * i + 1]
+            tree[i] = left if right is None else right if left is None else combine(left, right)
+            i //= 2
+
+    def _check_range(self, lo: int, hi: int) -> tuple:
+        """ This is a private helper function that rebuilds stale trees and bounds checks a half-open
+            range, with hi defaulting to the length.
+        """
+        if self._stale:
+            self.rebuild()
+
+        hi = self._size if hi is None else hi
+        if not 0 <= lo <= hi <= self._size:
+            raise IndexError(f'RangeIndex range [{lo}, {hi}) is out of range')
+
+        return lo, hi
+
+    def _prefix(self, end: int) -> Any:
+        """ This is a private helper function that sums the first end items.
+        """
+        total = 0
+        while end:
+            total += self._sums[end]
+            end -= end & -end
+
+        return total
+
+    def sum(self, lo: int = 0, hi: int = None) -> Any:
+        """ Sum of the items in the half-open range [lo, hi)
+            Usage: total = ranges.sum(10, 20)
+            @:param lo the first index to include
+            @:param hi the index to stop before (use None for the length)
+            @:return the sum of the items in the range (0 for an empty range)
+            @:raises IndexError if the range is outside the Array
+        """
+        lo, hi = self._check_range(lo, hi)
+        return self._prefix(hi) - self._prefix(lo)
+
+    def _query_tree(self, lo: int, hi: int, combine) -> Any:
+        """ This is a private helper function that combines the items in [lo, hi) from a segment tree,
+            walking up from both ends.
+        """
+        if not self._min_max:
+            raise ValueError('RangeIndex was not built with min_max')
+
+        lo, hi = self._check_range(lo, hi)
+        if lo == hi:
+            raise ValueError(f'{combine.__name__} of an empty range')
+
+        #Looked up only now, as _check_range may have rebuilt the trees
+        tree = self._mins if combine is min else self._maxs
+        result = None
+        lo += self._leaves
+        hi += self._leaves
+        while lo < hi:
+            if lo & 1:
+                result = tree[lo] if result is None else combine(result, tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                result = tree[hi] if result is None else combine(result, tree[hi])
+            lo //= 2
+            hi //= 2
+
+        return result
+
+    def min(self, lo: int = 0, hi: int = None) -> Any:
+        """ Smallest item in the half-open range [lo, hi)
+            Usage: smallest = ranges.min(10, 20)
+            @:param lo the first index to include
+            @:param hi the index to stop before (use None for the length)
+            @:return the smallest item in the range
+            @:raises IndexError if the range is outside the Array
+            @:raises ValueError if the range is empty or the RangeIndex was not built with min_max
+        """
+        return self._query_tree(lo, hi, min)
+
+    def max(self, lo: int = 0, hi: int = None) -> Any:
+        """ Largest item in the half-open range [lo, hi)
+            Usage: largest = ranges.max(10, 20)
+            @:param lo the first index to include
+            @:param hi the index to stop before (use None for the length)
+            @:return the largest item in the range
+            @:raises IndexError if the range is outside the Array
+            @:raises ValueError if the range is empty or the RangeIndex was not built with min_max
+        """
+        return self._query_tree(lo, hi, max)
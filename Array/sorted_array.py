@@ -0,0 +1,162 @@
+from typing import Any
+from array import array
+from bisect import bisect_left, bisect_right
+
+from arrayadt import Array
+
+
+class SortedArray(Array):
+    """ Class SortedArray - representing 1D data kept in ascending order using an Array
+            Stipulations:
+            1. Must keep the items sorted after every operation, so lookups can use binary search
+            2. Must adhere to the docstring requirements per method, including raising
+               raising appropriate exceptions where indicated.
+            3. Items can only be added with insert; assigning to a slot raises TypeError.
+    """
+
+    def __init__(self, *items, typecode: str = None, growth_factor: float = 2.0,
+                 shrink_ratio: float = 0.25) -> None:
+        """ Constructor
+            Usages:  1. sorted_array = SortedArray()
+                     2. sorted_array = SortedArray(3, 1, 2)
+                     3. sorted_array = SortedArray([3, 1, 2], typecode='i')
+            @:param *items a variable list of arguments that contain the items, flattened as for Array
+            @:param typecode optional array module typecode for typed storage
+            @:param growth_factor how much the capacity is multiplied by when it is outgrown
+            @:param shrink_ratio spare capacity is released once the length drops below this fraction
+            @:return none
+            @:raises TypeError if the items cannot be compared with each other
+        """
+        super().__init__(*items, typecode=typecode, growth_factor=growth_factor, shrink_ratio=shrink_ratio)
+
+        if typecode is None:
+            self._items.sort()
+        else:
+            self._items = array(typecode, sorted(self._items))
+
+    def lower_bound(self, item: Any) -> int:
+        """ Find the first position whose item is not less than item
+            Usage: index = sorted_array.lower_bound(5)
+            @:param item the item to search for
+            @:return the index item would be inserted at before any equal items
+        """
+        return bisect_left(self._items, item, 0, self._length)
+
+    def upper_bound(self, item: Any) -> int:
+        """ Find the first position whose item is greater than item
+            Usage: index = sorted_array.upper_bound(5)
+            @:param item the item to search for
+            @:return the index item would be inserted at after any equal items
+        """
+        return bisect_right(self._items, item, 0, self._length)
+
+    def __contains__(self, item: Any) -> bool:
+        """ Contains operator (in), using binary search
+            Usage: if 3 in sorted_array:
+            @:param item the desired item to check whether it's in the array
+            @:return true if the array contains the item
+        """
+        try:
+            index = self.lower_bound(item)
+        except TypeError:
+            #An item that cannot be compared with the contents cannot be among them
+            return False
+
+        return index < self._length and self._items[index] == item
+
+    def index_of(self, item: Any) -> int:
+        """ Find the index of the first occurrence of an item, using binary search
+            Usage: index = sorted_array.index_of(5)
+            @:param item the item to search for
+            @:return the index of the first occurrence of item
+            @:raises KeyError if item is not found
+        """
+        try:
+            index = self.lower_bound(item)
+        except TypeError:
+            index = self._length
+        if index == self._length or self._items[index] != item:
+            raise KeyError(f'Item {item} not found in the array.')
+
+        return index
+
+    def count(self, item: Any) -> int:
+        """ Count the occurrences of an item, using binary search
+            Usage: occurrences = sorted_array.count(5)
+            @:param item the item to count
+            @:return the number of items equal to item
+        """
+        try:
+            return self.upper_bound(item) - self.lower_bound(item)
+        except TypeError:
+            return 0
+
+    def range(self, low: Any, high: Any) -> Any:
+        """ Iterate the items in the half-open range [low, high)
+            Usage: for item in sorted_array.range(10, 20):
+            @:param low the smallest item to include
+            @:param high the item to stop before
+            @:return yields the items from low up to but not including high, in order
+        """
+        #Indexing by position starts at low in O(1), where islice would step over every earlier item
+        yield from map(self._items.__getitem__, range(self.lower_bound(low), self.lower_bound(high)))
+
+    def insert(self, item: Any) -> None:
+        """ Insert an item at its sorted position, after any equal items. Later items are moved up
+            with a single shift of the storage.
+            Usage: sorted_array.insert(5)
+            @:param item the desired item to insert
+            @:return none
+        """
+        index = self.upper_bound(item)
+        self._own()
+        self._invalidate_ranges()
+        self._items.insert(index, item)
+        #The shift pushed an empty spare slot past the capacity, drop it so the capacity is unchanged
+        if len(self._items) > self._length + 1:
+            del self._items[-1]
+
+        self._length += 1
+
+    def remove(self, item: Any) -> None:
+        """ Remove the first occurrence of an item. Later items are moved down with a single shift.
+            Usage: sorted_array.remove(5)
+            @:param item the desired item to remove
+            @:return none
+            @:raises KeyError if item is not found
+        """
+        del self[self.index_of(item)]
+
+    def __setitem__(self, index: int, item: Any) -> None:
+        """ Bracket operator for setting an item is not supported, as it could break the order
+            @:raises TypeError always
+        """
+        raise TypeError('SortedArray items can only be changed with insert and remove')
+
+    def _assign_range(self, indices: range, items: Any) -> None:
+        """ This is a private helper function that blocks slice assignment through views.
+        """
+        raise TypeError('SortedArray items can only be changed with insert and remove')
+
+    def _write_live(self, values) -> None:
+        """ This is a private helper function that blocks reordering by sort, nth_element and partial_sort.
+        """
+        raise TypeError('SortedArray items can only be changed with insert and remove')
+
+    def _options(self) -> dict:
+        """ This is a private helper function that collects the constructor options clone and pickle
+            carry over, which for a SortedArray are only the capacity policy.
+        """
+        return {'growth_factor': self._growth_factor, 'shrink_ratio': self._shrink_ratio}
+
+    def resize(self, new_size: int) -> None:
+        """ Resize a SortedArray. It can only be truncated, as empty slots would break the order.
+            Usage: sorted_array.resize(5)
+            @:param new_size the desired new size
+            @:return none
+            @:raises ValueError if new_size is negative or greater than the length
+        """
+        if new_size > self._length:
+            raise ValueError('SortedArray can only grow through insert')
+
+        super().resize(new_size)
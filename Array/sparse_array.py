@@ -0,0 +1,200 @@
+from typing import Any
+from itertools import islice
+import operator
+
+
+class SparseArray:
+    """ Class SparseArray - representing mostly empty 1D data using a dict of the occupied slots
+            Stipulations:
+            1. Must only store the slots that hold something other than the fill value, so memory
+               scales with occupancy rather than with size
+            2. Must adhere to the docstring requirements per method, including raising
+               raising appropriate exceptions where indicated.
+            3. Must offer the same indexing interface as Array.
+    """
+
+    #Number of items __str__ shows before summarising the rest
+    _STR_LIMIT = 100
+
+    def __init__(self, size: int = 0, fill: Any = None) -> None:
+        """ Constructor
+            Usages:  1. sparse_array = SparseArray(1000000)
+                     2. sparse_array = SparseArray(1000000, fill=0)
+            @:param size the desired size of the SparseArray
+            @:param fill the value of every slot that has not been set
+            @:return none
+            @:raises ValueError if size is negative
+        """
+        if size < 0:
+            raise ValueError('Size cannot be negative')
+
+        self._size = size
+        self._fill = fill
+        #Maps the index of each occupied slot to its item
+        self._items = {}
+
+    @staticmethod
+    def clone(sparse_array_instance: 'SparseArray') -> 'SparseArray':
+        """ Clone the SparseArray
+            Usage:  sparse_array = SparseArray.clone(instance)
+            @:param sparse_array_instance a SparseArray instance to copy data from.
+            @:return a copy of the SparseArray
+            @:raises TypeError if instance is provided and it is not a SparseArray instance
+        """
+        if not isinstance(sparse_array_instance, SparseArray):
+            raise TypeError('Instance is not a SparseArray')
+
+        sparse_array = SparseArray(sparse_array_instance._size, sparse_array_instance._fill)
+        sparse_array._items = dict(sparse_array_instance._items)
+        return sparse_array
+
+    def _check_index(self, index: int) -> int:
+        """ This is a private helper function that bounds checks an index and returns it with negative
+            indices counted back from the end.
+        """
+        position = index + self._size if index < 0 else index
+        if not 0 <= position < self._size:
+            raise IndexError(f'SparseArray index {index} is out of range')
+
+        return position
+
+    def __getitem__(self, index: int) -> Any:
+        """ Bracket operator for getting an item
+            Usage: val = sparse_array[0]
+            @:param index the desired index
+            @:return the item at the index, or the fill value if the slot has not been set
+            @:raises IndexError if the index is out of bounds
+        """
+        return self._items.get(self._check_index(index), self._fill)
+
+    def __setitem__(self, index: int, item: Any) -> None:
+        """ Bracket operator for setting an item. Setting the fill value frees the slot.
+            Usage: sparse_array[index] = val
+            @:param index the desired index to set
+            @:param item the desired item to set at index
+            @:raises IndexError if the index is out of bounds
+            @:return none
+        """
+        position = self._check_index(index)
+        if item == self._fill:
+            self._items.pop(position, None)
+        else:
+            self._items[position] = item
+
+    def __delitem__(self, index: int) -> None:
+        """ Delete an item, moving the later occupied slots down by one and shrinking the size by one.
+            Only the occupied slots are touched.
+            Usage: del sparse_array[0]
+            @:param index the desired index to delete
+            @:raises IndexError if the index is out of bounds
+            @:return none
+        """
+        position = self._check_index(index)
+        self._items = {i - 1 if i > position else i: item
+                       for i, item in self._items.items() if i != position}
+        self._size -= 1
+
+    def __len__(self) -> int:
+        """ len operator for getting length of the array
+            Usage: for i in range(len(sparse_array))
+            @:return the length of the SparseArray, occupied or not
+        """
+        return self._size
+
+    @property
+    def occupied(self) -> int:
+        """ Get the number of slots holding something other than the fill value
+            Usage: count = sparse_array.occupied
+            @:return the number of occupied slots
+        """
+        return len(self._items)
+
+    @property
+    def fill(self) -> Any:
+        """ Get the fill value
+            Usage: fill = sparse_array.fill
+            @:return the value of every slot that has not been set
+        """
+        return self._fill
+
+    def resize(self, new_size: int) -> None:
+        """ Resize a SparseArray. Growing is O(1); shrinking only visits the occupied slots.
+            Usage: sparse_array.resize(5)
+            @:param new_size the desired new size
+            @:return none
+            @:raises ValueError if new_size is negative
+        """
+        if new_size < 0:
+            raise ValueError('Size cannot be negative')
+
+        if new_size < self._size and self._items:
+            self._items = {i: item for i, item in self._items.items() if i < new_size}
+
+        self._size = new_size
+
+    def items(self) -> Any:
+        """ Iterate the occupied slots only
+            Usage: for index, item in sparse_array.items():
+            @:return yields (index, item) pairs of the occupied slots in index order
+        """
+        for index in sorted(self._items):
+            yield index, self._items[index]
+
+    def __iter__(self) -> Any:
+        """ Iterator operator
+            Usage: for item in sparse_array:
+            @:return yields the item at every index, the fill value for slots that have not been set
+        """
+        get = self._items.get
+        for index in range(self._size):
+            yield get(index, self._fill)
+
+    def __contains__(self, item: Any) -> bool:
+        """ Contains operator (in), which only searches the occupied slots
+            Usage: if 3 in sparse_array:
+            @:param item the desired item to check whether it's in the array
+            @:return true if the array contains the item
+        """
+        if item == self._fill and len(self._items) < self._size:
+            return True
+
+        return any(candidate == item for candidate in self._items.values())
+
+    def __eq__(self, other: 'SparseArray') -> bool:
+        """ Equality operator ==
+            Usage: are_equal = sparse_array1 == sparse_array2
+            @:param other the instance to compare self to
+            @:return true if the arrays are equal (deep check)
+        """
+        if type(other) != type(self):
+            return False
+
+        if len(self) != len(other):
+            return False
+
+        #With the same fill value the occupied slots decide equality
+        if self._fill == other._fill:
+            return self._items == other._items
+
+        return all(map(operator.eq, self, other))
+
+    def __ne__(self, other: 'SparseArray') -> bool:
+        """ Non-equality operator !=
+            Usage: are_equal = sparse_array1 != sparse_array2
+            @:param other the instance to compare self to
+            @:return true if the arrays are not equal (deep check)
+        """
+        return not self == other
+
+    def __str__(self) -> str:
+        """ Return a string representation of the data and structure. Only the first _STR_LIMIT items
+            are shown, followed by a count of the rest.
+            Usage: print(sparse_array):
+            @:return str the string representation of the data and structure
+        """
+        shown = ', '.join([str(i) for i in islice(self, SparseArray._STR_LIMIT)])
+        hidden = self._size - SparseArray._STR_LIMIT
+        if hidden > 0:
+            return '[' + shown + f', ... {hidden} more]'
+
+        return '[' + shown + ']'
@@ -1,8 +1,19 @@
+import io
+import operator
+import os
+import pickle
+import tempfile
 import unittest
+from unittest import mock
 # from tests.gradescope import *
+import arrayadt
 from arrayadt import Array
 
 
+def square(item):
+    return item * item
+
+
 class ArrayTest(unittest.TestCase):
 
     def setUp(self):
@@ -75,5 +86,656 @@ class ArrayTest(unittest.TestCase):
 
         for i in range(old_length):
             assert i == self._array[i]
-    
-    
\ No newline at end of file
+
+    def test_11_typed_array_should_start_zero_filled(self):
+        array = Array(size=5, typecode='d')
+
+        assert len(array) == 5
+        for i in range(len(array)):
+            assert array[i] == 0.0
+
+    def test_12_typed_array_should_store_and_resize(self):
+        array = Array(size=3, typecode='i')
+        for i in range(len(array)):
+            array[i] = i * 2
+
+        array.resize(5)
+        assert array.typecode == 'i'
+        assert list(array) == [0, 2, 4, 0, 0]
+        assert 4 in array
+
+        array.resize(2)
+        assert list(array) == [0, 2]
+
+    def test_13_typed_array_should_equal_object_array_with_same_items(self):
+        typed = Array(1, 2, 3, typecode='i')
+
+        assert typed == Array(1, 2, 3, typecode='i')
+        assert typed == Array(1, 2, 3)
+        assert typed != Array(1, 2, 4, typecode='i')
+
+    def test_14_typed_array_should_reject_items_of_wrong_type(self):
+        array = Array(size=1, typecode='i')
+
+        with self.assertRaises(TypeError):
+            array[0] = 'A'
+
+    def test_15_add_and_multiply_should_work_with_scalars_and_arrays(self):
+        array = Array(1, 2, 3, typecode='i')
+
+        assert list(array.add(1)) == [2, 3, 4]
+        assert list(array.multiply(array)) == [1, 4, 9]
+        assert list(Array(1, 2, 3).add(Array(1, 1, 1))) == [2, 3, 4]
+
+        with self.assertRaises(ValueError):
+            array.add(Array(1, 2))
+
+    def test_16_reductions_should_match_builtins(self):
+        array = Array(4, 1, 3, 1, typecode='i')
+
+        assert array.sum() == 9
+        assert array.min() == 1
+        assert array.max() == 4
+        assert array.argmin() == 1
+
+        with self.assertRaises(ValueError):
+            Array().min()
+
+    def test_17_fill_should_set_every_slot(self):
+        typed = Array(size=4, typecode='d')
+        typed.fill(1.5)
+        boxed = Array(size=3)
+        boxed.fill('A')
+
+        assert list(typed) == [1.5] * 4
+        assert list(boxed) == ['A'] * 3
+
+    def test_18_mask_and_where_should_select_items(self):
+        array = Array(5, 12, 7, 20, typecode='i')
+        mask = array.greater(6)
+
+        assert list(mask) == [0, 1, 1, 1]
+        assert list(array.mask(mask)) == [12, 7, 20]
+        assert list(array.where(array.less(10), 10)) == [5, 10, 7, 10]
+        assert list(array.where(array.equal(12), Array(0, 0, 0, 0))) == [0, 12, 0, 0]
+
+    def test_19_slice_should_return_view_sharing_storage(self):
+        view = self._array[2:8:2]
+
+        assert len(view) == 3
+        assert list(view) == [2, 4, 6]
+
+        self._array[4] = 40
+        assert view[1] == 40
+
+        view[0] = 20
+        assert self._array[2] == 20
+
+    def test_20_view_slice_assignment_should_write_through(self):
+        array = Array(size=6, typecode='i')
+        array[1:4] = [7, 8, 9]
+        array[::-1][:2] = [1, 2]
+
+        assert list(array) == [0, 7, 8, 9, 2, 1]
+        assert list(array[::-2]) == [1, 9, 7]
+
+        with self.assertRaises(ValueError):
+            array[0:2] = [1, 2, 3]
+
+    def test_21_from_view_should_materialize_an_independent_copy(self):
+        typed = Array(0, 1, 2, 3, 4, 5, typecode='d')
+        copy = Array.from_view(typed[1::2])
+        typed[1] = 100.0
+
+        assert copy == Array(1.0, 3.0, 5.0, typecode='d')
+        assert Array.from_view(self._array[:3]) == Array(0, 1, 2)
+
+        with self.assertRaises(TypeError):
+            Array.from_view(typed)
+
+    def test_22_resize_should_grow_capacity_geometrically(self):
+        array = Array()
+        capacities = set()
+        for i in range(100):
+            array.append(i)
+            capacities.add(array.capacity)
+
+        assert list(array) == list(range(100))
+        assert len(capacities) <= 8
+        assert array.capacity >= len(array)
+
+    def test_23_resize_smaller_then_larger_should_not_revive_truncated_items(self):
+        array = Array(size=10, shrink_ratio=0)
+        for i in range(10):
+            array[i] = i
+        array.resize(3)
+        array.resize(6)
+
+        assert array.capacity == 10
+        assert list(array) == [0, 1, 2, None, None, None]
+        assert 5 not in array
+
+        with self.assertRaises(IndexError):
+            array[6]
+
+    def test_24_reserve_and_shrink_to_fit_should_set_capacity(self):
+        array = Array(1, 2, 3, typecode='i')
+        array.reserve(50)
+
+        assert array.capacity == 50
+        assert len(array) == 3
+        assert array == Array(1, 2, 3)
+
+        array.shrink_to_fit()
+        assert array.capacity == 3
+
+    def test_25_shrink_ratio_should_release_spare_capacity(self):
+        array = Array(size=100)
+        array.resize(50)
+        assert array.capacity == 100
+
+        array.resize(10)
+        assert array.capacity == 20
+        assert self._array[-1] == 9
+
+    def test_26_mmap_array_should_persist_items_to_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'data.bin')
+            array = Array.create_mmap(path, 'd', 4)
+            array[1:3] = [1.5, 2.5]
+            array.close()
+
+            reopened = Array.open_mmap(path, 'd')
+            assert list(reopened) == [0.0, 1.5, 2.5, 0.0]
+            assert 2.5 in reopened
+            assert list(reopened[::2]) == [0.0, 2.5]
+            reopened.close()
+
+    def test_27_mmap_resize_and_delete_should_resize_the_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'data.bin')
+            array = Array.create_mmap(path, 'i', 3)
+            array[2] = 7
+            array.resize(6)
+            array[5] = 9
+            del array[0]
+            array.flush()
+
+            assert list(array) == [0, 7, 0, 0, 9]
+            assert os.path.getsize(path) == 5 * 4
+            array.resize(0)
+            assert len(array) == 0
+            assert 0 not in array
+            array.close()
+
+    def test_28_constructor_should_flatten_nested_lists_and_tuples(self):
+        array = Array(1, [2, (3, [4, 5]), 'AB'], (), [[6]])
+
+        assert list(array) == [1, 2, 3, 4, 5, 'AB', 6]
+        assert list(Array(['A', 'B', 'C'])) == ['A', 'B', 'C']
+
+    def test_29_constructor_should_stream_iterables_and_generators(self):
+        array = Array(range(3), (i * i for i in range(3)), typecode='i')
+
+        assert list(array) == [0, 1, 2, 0, 1, 4]
+
+    def test_30_constructor_should_flatten_deep_nesting_without_recursion(self):
+        nested = [0]
+        for i in range(1, 5000):
+            nested = [nested, i]
+
+        assert list(Array(nested)) == list(range(5000))
+
+    def test_31_clone_should_share_storage_until_mutated(self):
+        clone = Array.clone(self._array)
+
+        assert clone == self._array
+        assert clone._items is self._array._items
+
+        clone[0] = 100
+        assert self._array[0] == 0
+        assert clone._items is not self._array._items
+
+    def test_32_mutating_the_source_should_not_change_the_clone(self):
+        clone = Array.clone(self._array)
+        self._array.resize(3)
+        del self._array[0]
+
+        assert list(clone) == list(range(10))
+        assert list(self._array) == [1, 2]
+
+    def test_33_deep_clone_should_copy_items(self):
+        array = Array(size=2)
+        array[0] = ['A']
+        clone = Array.clone(array, deep=True)
+        clone[0].append('B')
+
+        assert array[0] == ['A']
+
+        with self.assertRaises(TypeError):
+            Array.clone([1, 2])
+
+    def test_34_index_of_and_count_should_search_unindexed_arrays(self):
+        array = Array(3, 1, 3, 2)
+
+        assert array.index_of(3) == 0
+        assert array.count(3) == 2
+        assert not array.indexed
+
+        with self.assertRaises(KeyError):
+            array.index_of(4)
+
+    def test_35_indexed_array_should_track_assignment_and_deletion(self):
+        array = Array('A', 'B', 'A', 'C', indexed=True)
+        array[0] = 'C'
+        del array[1]
+
+        assert list(array) == ['C', 'A', 'C']
+        assert array.index_of('A') == 1
+        assert array.count('C') == 2
+        assert 'B' not in array
+        assert [1] not in array
+
+        with self.assertRaises(TypeError):
+            array[0] = [1]
+        assert array.count('C') == 2
+
+    def test_36_indexed_array_should_track_resize_and_slices(self):
+        array = Array(size=3, typecode='i', indexed=True)
+        array[0:3] = [5, 6, 7]
+        array.resize(5)
+        array.append(8)
+
+        assert array.count(0) == 2
+        assert array.index_of(8) == 5
+
+        array.resize(2)
+        assert 7 not in array
+        assert array.index_stats()['positions'] == 2
+
+        with self.assertRaises(ValueError):
+            Array().index_stats()
+
+    def test_37_indexed_clone_should_not_share_index_updates(self):
+        array = Array(1, 2, 3, indexed=True)
+        clone = Array.clone(array)
+        clone[0] = 4
+
+        assert 1 in array and 4 not in array
+        assert 4 in clone and 1 not in clone
+        assert Array.clone(array, deep=True).index_of(3) == 2
+
+    def test_38_lazy_delete_should_skip_tombstones(self):
+        array = Array(range(10), lazy_delete=True, compact_ratio=1)
+        del array[0]
+        del array[4]
+        del array[-1]
+
+        assert len(array) == 7
+        assert array[0] == 1
+        assert array[4] == 6
+        assert array[-1] == 8
+        assert array.capacity == 10
+
+        array[4] = 60
+        assert list(array) == [1, 2, 3, 4, 60, 7, 8]
+
+    def test_39_lazy_delete_should_compact_at_the_ratio(self):
+        array = Array(range(8), lazy_delete=True, compact_ratio=0.5)
+        for i in range(3):
+            del array[0]
+        assert array.capacity == 8
+
+        del array[0]
+        assert array.capacity == 4
+        assert list(array) == [4, 5, 6, 7]
+
+    def test_40_compact_should_remove_tombstones_explicitly(self):
+        array = Array(size=4, typecode='i', lazy_delete=True, compact_ratio=1)
+        array[0:4] = [1, 2, 3, 4]
+        del array[1]
+        array.compact()
+
+        assert array == Array(1, 3, 4, typecode='i')
+        assert array.capacity == 3
+
+        with self.assertRaises(ValueError):
+            Array(indexed=True, lazy_delete=True)
+
+    def test_41_delete_many_should_remove_all_indices_at_once(self):
+        self._array.delete_many([0, 9, -2, 4, 4])
+
+        assert list(self._array) == [1, 2, 3, 5, 6, 7]
+
+        with self.assertRaises(IndexError):
+            self._array.delete_many([1, 20])
+        assert len(self._array) == 6
+
+    def test_42_dump_and_load_should_round_trip_typed_arrays(self):
+        array = Array(1.5, 2.5, 3.5, typecode='d')
+        array.reserve(10)
+        file = io.BytesIO()
+        array.dump(file)
+        file.seek(0)
+
+        loaded = Array.load(file)
+        assert loaded == array
+        assert loaded.typecode == 'd'
+        assert len(file.getvalue()) == 15 + 3 * 8
+
+    def test_43_dump_and_load_should_round_trip_object_arrays(self):
+        array = Array('A', bytearray(b'BC'), None, [1, 2])
+        file = io.BytesIO()
+        array.dump(file)
+        file.seek(0)
+
+        assert list(Array.load(file)) == ['A', bytearray(b'BC'), None, 1, 2]
+
+    def test_44_load_should_reject_bad_data(self):
+        with self.assertRaises(ValueError):
+            Array.load(io.BytesIO(b'NOPE' + bytes(12)))
+
+        file = io.BytesIO()
+        Array(1, 2, 3, typecode='i').dump(file)
+        with self.assertRaises(EOFError):
+            Array.load(io.BytesIO(file.getvalue()[:-1]))
+
+    def test_45_pickle_should_round_trip_every_protocol(self):
+        typed = Array(1, 2, 3, typecode='i', growth_factor=3)
+        indexed = Array('A', 'B', indexed=True)
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            assert pickle.loads(pickle.dumps(typed, protocol)) == typed
+            assert pickle.loads(pickle.dumps(indexed, protocol)).index_of('B') == 1
+
+        buffers = []
+        data = pickle.dumps(typed, protocol=5, buffer_callback=buffers.append)
+        assert len(buffers) == 1
+        assert pickle.loads(data, buffers=buffers) == typed
+
+    def test_46_str_should_summarise_large_arrays(self):
+        array = Array(range(250))
+        text = str(array)
+
+        assert text.startswith('[0, 1, 2, ')
+        assert text.endswith(', 99, ... 150 more]')
+        assert str(Array()) == '[]'
+
+    def test_47_write_to_should_stream_the_full_rendering(self):
+        array = Array(range(250))
+        stream = io.StringIO()
+        array.write_to(stream, chunk_size=7)
+
+        assert stream.getvalue() == '[' + ', '.join(str(i) for i in range(250)) + ']'
+
+        with self.assertRaises(ValueError):
+            array.write_to(stream, chunk_size=0)
+
+    def test_48_parallel_map_should_match_a_serial_map(self):
+        typed = Array(range(100), typecode='q')
+        boxed = Array(range(100))
+
+        assert list(typed.parallel_map(square, workers=2)) == [i * i for i in range(100)]
+        assert list(boxed.parallel_map(square, workers=2)) == [i * i for i in range(100)]
+        assert list(typed) == list(range(100))
+
+    def test_49_parallel_map_in_place_should_update_the_array(self):
+        typed = Array(range(10), typecode='d')
+
+        assert typed.parallel_map(square, workers=2, in_place=True) is typed
+        assert typed[9] == 81.0
+        assert len(Array(typecode='d').parallel_map(square, workers=2)) == 0
+
+    def test_50_parallel_reduce_should_match_a_serial_reduce(self):
+        assert Array(range(1000), typecode='i').parallel_reduce(operator.add, 0, workers=3) == 499500
+        assert Array('A', 'B', 'C').parallel_reduce(operator.add, '', workers=2) == 'ABC'
+        assert Array().parallel_reduce(operator.add, 0, workers=2) == 0
+
+    def test_51_sort_should_reorder_the_storage_in_place(self):
+        boxed = Array('pear', 'fig', 'apple')
+        boxed.sort()
+        assert list(boxed) == ['apple', 'fig', 'pear']
+        boxed.sort(key=len, reverse=True)
+        assert list(boxed) == ['apple', 'pear', 'fig']
+
+        narrow = Array([3, -7, 3, 0, 32767], typecode='h')
+        narrow.sort()
+        assert list(narrow) == [-7, 0, 3, 3, 32767]
+        narrow.sort(reverse=True)
+        assert list(narrow) == [32767, 3, 3, 0, -7]
+
+        counted = Array([i * 7 % 256 for i in range(2000)], typecode='B')
+        counted.sort(reverse=True)
+        assert list(counted) == sorted((i * 7 % 256 for i in range(2000)), reverse=True)
+
+        wide = Array([2.5, -1.0, 0.0], typecode='d')
+        wide.sort()
+        assert list(wide) == [-1.0, 0.0, 2.5]
+
+    def test_52_sort_should_keep_clones_index_and_tombstones_consistent(self):
+        indexed = Array(3, 1, 2, indexed=True)
+        copy = Array.clone(indexed)
+        indexed.sort()
+
+        assert indexed.index_of(1) == 0 and indexed.index_of(3) == 2
+        assert list(copy) == [3, 1, 2]
+
+        typed = Array(3, 1, 2, typecode='i', indexed=True)
+        typed.sort(reverse=True)
+        assert list(typed) == [3, 2, 1]
+        assert typed.index_of(1) == 2 and typed.index_of(3) == 0
+
+        lazy = Array(5, 4, 3, 2, 1, lazy_delete=True)
+        del lazy[0]
+        lazy.sort()
+        assert list(lazy) == [1, 2, 3, 4]
+
+    def test_53_nth_element_and_partial_sort_should_settle_the_front(self):
+        values = [9, 4, 7, 1, 8, 2, 6, 3, 5, 0]
+        array = Array(values, typecode='i')
+        array.nth_element(4)
+
+        assert array[4] == 4
+        assert set(array[0:4]) == {0, 1, 2, 3}
+        assert set(array[5:10]) == {5, 6, 7, 8, 9}
+
+        array = Array(values)
+        array.partial_sort(3, reverse=True)
+        assert list(array[0:3]) == [9, 8, 7]
+        assert sorted(array) == sorted(values)
+
+        array.partial_sort(10)
+        assert list(array) == sorted(values)
+
+        with self.assertRaises(ValueError):
+            array.partial_sort(11)
+        with self.assertRaises(IndexError):
+            array.nth_element(10)
+
+    def test_54_iter_chunks_should_slice_the_storage(self):
+        typed = Array(range(10), typecode='i')
+        chunks = list(typed.iter_chunks(4))
+
+        assert [chunk.tolist() for chunk in chunks] == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+        assert all(isinstance(chunk, memoryview) and chunk.readonly for chunk in chunks)
+        assert list(Array('A', 'B', 'C').iter_chunks(2)) == [['A', 'B'], ['C']]
+
+        clone = Array.clone(typed)
+        with self.assertRaises(TypeError):
+            next(clone.iter_chunks(4))[0] = 100
+        assert typed[0] == 0
+
+        with self.assertRaises(ValueError):
+            list(typed.iter_chunks(0))
+
+    def test_55_write_into_should_stream_whole_chunks(self):
+        typed = Array(range(1000), typecode='q')
+        stream = io.BytesIO()
+        typed.write_into(stream, chunk_size=300)
+        assert stream.getvalue() == typed._items[:1000].tobytes()
+
+        lines = Array('a\n', 'b\n')
+        text = io.StringIO()
+        lines.write_into(text, chunk_size=1)
+        assert text.getvalue() == 'a\nb\n'
+
+    def test_56_mmap_should_never_truncate_bytes_it_does_not_map(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'data.bin')
+            array = Array.create_mmap(path, 'q', 100)
+            array[99] = 42
+            array.close()
+
+            head = Array.open_mmap(path, 'q', size=10)
+            head.resize(11)
+            del head[0]
+            head.delete_many([0, 1])
+            head.close()
+            assert os.path.getsize(path) == 800
+
+            whole = Array.open_mmap(path, 'q')
+            assert whole[99] == 42
+            whole.close()
+
+            with self.assertRaises(ValueError):
+                Array.create_mmap(path, 'X', 10)
+            with self.assertRaises(ValueError):
+                Array.open_mmap(path, 'u')
+            assert os.path.getsize(path) == 800
+
+    def test_57_typed_indexed_array_should_keep_index_when_store_fails(self):
+        array = Array(1, 2, 1, typecode='i', indexed=True)
+        with self.assertRaises(TypeError):
+            array[0] = 'x'
+
+        assert list(array) == [1, 2, 1]
+        assert 'x' not in array
+        assert array.index_of(1) == 0
+        assert array.count(1) == 2
+
+        floats = Array(size=2, typecode='d', indexed=True)
+        floats[0] = 3
+        assert 3.0 in floats
+        assert floats.index_of(3) == 0
+
+    def test_58_append_after_lazy_delete_should_not_add_phantom_slots(self):
+        array = Array(1, 2, 3, 4, lazy_delete=True, compact_ratio=1)
+        del array[0]
+        del array[0]
+        array.append(5)
+
+        assert list(array) == [3, 4, 5]
+        assert len(array) == 3
+
+    @unittest.skipUnless(arrayadt.numpy, 'numpy is not installed')
+    def test_59_numpy_and_python_paths_should_agree(self):
+        cases = [
+            lambda: Array(250, 5, typecode='B').add(10),
+            lambda: Array(1, -2, typecode='b').add(1000),
+            lambda: Array(1, 2, typecode='i').add(1.5),
+            lambda: Array(2 ** 40, 3, typecode='q').multiply(2 ** 40),
+            lambda: Array(1, 2, typecode='i').add(Array(0.5, 1.0, typecode='d')),
+            lambda: Array(1.5, 2.5, typecode='f').add(0.1),
+            lambda: Array(1, 2, 3, typecode='h').less(2),
+            lambda: Array(1, 2, 3, typecode='i').where(Array(1, 0, 1, typecode='B'), 'z'),
+            lambda: Array(1, 2, 3, typecode='B').where(Array(1, 0, 1, typecode='B'), 300),
+            lambda: Array(2 ** 62, 2 ** 62, typecode='q').sum(),
+        ]
+        def typed_values(result):
+            if isinstance(result, Array):
+                return result.typecode, [(type(item), item) for item in result]
+            return type(result), result
+
+        for case in cases:
+            fast = typed_values(case())
+            with mock.patch.object(arrayadt, 'numpy', None):
+                slow = typed_values(case())
+            assert fast == slow
+
+        for value in (1.5, 300, 'x'):
+            raised = []
+            for backend in (arrayadt.numpy, None):
+                with mock.patch.object(arrayadt, 'numpy', backend):
+                    typed = Array(1, 2, typecode='B')
+                    with self.assertRaises((TypeError, OverflowError)) as context:
+                        typed.fill(value)
+                    raised.append(type(context.exception))
+                    assert list(typed) == [1, 2]
+            assert raised[0] == raised[1]
+
+    def test_60_character_arrays_should_compare_equal(self):
+        array = Array('a', 'b', typecode='u')
+
+        assert array == array
+        assert array == Array('a', 'b', typecode='u')
+        assert array == Array.clone(array)
+        assert array != Array('a', 'c', typecode='u')
+
+    def test_61_mmap_resize_should_survive_an_exported_chunk(self):
+        with tempfile.TemporaryDirectory() as directory:
+            array = Array.create_mmap(os.path.join(directory, 'data.bin'), 'i', 4)
+            array[0] = 7
+            chunks = array.iter_chunks(2)
+            chunk = next(chunks)
+            with self.assertRaises(BufferError):
+                array.resize(8)
+
+            assert array[0] == 7 and len(array) == 4
+            chunk.release()
+            chunks.close()
+            array.resize(8)
+            assert array[0] == 7 and len(array) == 8
+            array.close()
+
+    def test_62_empty_mmap_should_leave_an_empty_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'data.bin')
+            array = Array.create_mmap(path, 'i', 3)
+            array.resize(0)
+            array.close()
+            assert os.path.getsize(path) == 0
+            empty = Array.open_mmap(path, 'i')
+            assert len(empty) == 0
+            empty.close()
+
+            array = Array.create_mmap(path, 'i', 0)
+            assert list(array) == [] and 1 not in array
+            array.append(5)
+            del array[0]
+            array.resize(2)
+            array[1] = 5
+            array.close()
+
+            reopened = Array.open_mmap(path, 'i')
+            assert list(reopened) == [0, 5]
+            reopened.close()
+
+    def test_63_rejected_append_should_not_grow_the_array(self):
+        typed = Array(1, typecode='i')
+        with self.assertRaises(TypeError):
+            typed.append('x')
+        with self.assertRaises(OverflowError):
+            typed.append(2 ** 40)
+        assert list(typed) == [1]
+
+        indexed = Array(1, indexed=True)
+        with self.assertRaises(TypeError):
+            indexed.append([2])
+        assert list(indexed) == [1]
+        assert None not in indexed
+
+    @unittest.skipUnless(arrayadt.numpy, 'numpy is not installed')
+    def test_64_numpy_and_python_reductions_should_agree(self):
+        nan = float('nan')
+        cases = [
+            lambda: Array(0.1, 0.2, 0.3, typecode='f').sum(),
+            lambda: Array(3.0, nan, 1.0, typecode='d').min(),
+            lambda: Array(nan, 3.0, 1.0, typecode='d').min(),
+            lambda: Array(1.0, nan, 3.0, typecode='f').max(),
+            lambda: Array(3.0, nan, 1.0, typecode='d').argmin(),
+        ]
+        for case in cases:
+            fast = case()
+            with mock.patch.object(arrayadt, 'numpy', None):
+                slow = case()
+            assert repr(fast) == repr(slow)
@@ -0,0 +1,108 @@
+import unittest
+
+from array2d import Array2D
+from range_index import RangeIndex
+
+
+class Array2DTest(unittest.TestCase):
+
+    def setUp(self):
+        self._matrix = Array2D.from_rows([[0, 1, 2, 3], [4, 5, 6, 7], [8, 9, 10, 11]])
+
+    def test_01_constructor_should_allocate_empty_cells(self):
+        matrix = Array2D(2, 3, typecode='d')
+
+        assert matrix.shape == (2, 3)
+        assert matrix[1, 2] == 0.0
+        assert Array2D(2, 2)[0, 0] is None
+
+        with self.assertRaises(ValueError):
+            Array2D(-1, 2)
+
+    def test_02_indexing_should_read_and_write_cells(self):
+        self._matrix[1, 2] = 60
+
+        assert self._matrix[1, 2] == 60
+        assert self._matrix[-1, -1] == 11
+
+        with self.assertRaises(IndexError):
+            self._matrix[3, 0]
+        with self.assertRaises(IndexError):
+            self._matrix[0, 4] = 1
+
+    def test_03_row_and_column_should_be_views(self):
+        assert list(self._matrix.row(1)) == [4, 5, 6, 7]
+        assert list(self._matrix.column(2)) == [2, 6, 10]
+
+        self._matrix.column(0)[1] = 40
+        assert self._matrix[1, 0] == 40
+
+    def test_04_slicing_should_return_strided_submatrix_views(self):
+        sub_matrix = self._matrix[0:3:2, 1:]
+        assert sub_matrix.shape == (2, 3)
+        assert sub_matrix == Array2D.from_rows([[1, 2, 3], [9, 10, 11]])
+
+        sub_matrix[1, 0] = 90
+        assert self._matrix[2, 1] == 90
+
+    def test_05_slice_assignment_should_write_blocks(self):
+        self._matrix[1:, 2:] = [[0, 0], [0, 0]]
+
+        assert list(self._matrix.row(2)) == [8, 9, 0, 0]
+
+        with self.assertRaises(ValueError):
+            self._matrix[1:, 2:] = [[0, 0]]
+
+    def test_06_transpose_should_be_a_view(self):
+        transposed = self._matrix.transpose()
+
+        assert transposed.shape == (4, 3)
+        assert list(transposed.row(1)) == [1, 5, 9]
+
+        transposed[3, 0] = 30
+        assert self._matrix[0, 3] == 30
+
+    def test_07_iteration_should_be_row_wise_or_in_blocks(self):
+        assert [list(row) for row in self._matrix][1] == [4, 5, 6, 7]
+
+        blocks = list(self._matrix.blocks(2, 3))
+        assert [block.shape for block in blocks] == [(2, 3), (2, 1), (1, 3), (1, 1)]
+        assert blocks[3][0, 0] == 11
+
+    def test_08_clone_should_copy_views_into_new_storage(self):
+        clone = Array2D.clone(self._matrix.transpose())
+        clone[0, 0] = 100
+
+        assert clone.shape == (4, 3)
+        assert self._matrix[0, 0] == 0
+        assert list(clone.row(3)) == [3, 7, 11]
+
+        with self.assertRaises(TypeError):
+            Array2D.clone([[1]])
+
+    def test_09_failed_store_should_leave_range_index_unchanged(self):
+        matrix = Array2D.from_rows([[1, 2], [3, 4]], typecode='b')
+        ranges = RangeIndex(matrix._array, min_max=True)
+        ranges.sum()
+        with self.assertRaises(TypeError):
+            matrix[0, 0] = 1.5
+        with self.assertRaises(OverflowError):
+            matrix[0, 0] = 1000
+
+        assert ranges.sum() == 10
+        assert ranges.max() == 4
+
+        matrix[1, 1] = 9
+        assert ranges.sum() == 15
+
+    def test_10_from_rows_should_reject_cells_outside_the_typecode(self):
+        assert Array2D.from_rows([[1, 2]], typecode='d').typecode == 'd'
+
+        with self.assertRaises(TypeError):
+            Array2D.from_rows([[1, 'x']], typecode='d')
+        with self.assertRaises(OverflowError):
+            Array2D.from_rows([[1, 300]], typecode='b')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+
+from bit_array import BitArray
+
+
+class BitArrayTest(unittest.TestCase):
+
+    def setUp(self):
+        self._bits = BitArray(1, 0, 1, 1, 0)
+
+    def test_01_constructor_should_store_truth_values(self):
+        assert list(self._bits) == [True, False, True, True, False]
+        assert list(BitArray([0, 2, None])) == [False, True, False]
+        assert len(BitArray(size=1000)) == 1000
+        assert len(BitArray(size=1000)._bits) == 128
+
+    def test_02_get_and_set_should_touch_one_bit(self):
+        self._bits[1] = True
+        self._bits[-1] = 1
+        self._bits[0] = False
+        assert list(self._bits) == [False, True, True, True, True]
+
+        with self.assertRaises(IndexError):
+            self._bits[5]
+
+    def test_03_bulk_operators_should_combine_every_bit(self):
+        other = BitArray(0, 1, 1, 0, 0)
+        assert list(self._bits & other) == [False, False, True, False, False]
+        assert list(self._bits | other) == [True, True, True, True, False]
+        assert list(self._bits ^ other) == [True, True, False, True, False]
+        assert list(~self._bits) == [False, True, False, False, True]
+        assert (~self._bits).popcount() == 2
+
+        with self.assertRaises(ValueError):
+            self._bits & BitArray(1, 0)
+
+    def test_04_popcount_should_count_set_bits(self):
+        assert self._bits.popcount() == 3
+        assert BitArray(size=1000).popcount() == 0
+
+    def test_05_find_first_set_should_skip_clear_words(self):
+        bits = BitArray(size=1000)
+        assert bits.find_first_set() == -1
+
+        bits[700] = bits[900] = True
+        assert bits.find_first_set() == 700
+        assert bits.find_first_set(701) == 900
+        assert bits.find_first_set(901) == -1
+
+    def test_06_set_range_should_fill_partial_and_whole_bytes(self):
+        bits = BitArray(size=100)
+        bits.set_range(3, 90)
+        assert [i for i, bit in enumerate(bits) if bit] == list(range(3, 90))
+
+        bits.set_range(4, 6, False)
+        assert bits.popcount() == 85
+        assert not bits[4] and not bits[5] and bits[6]
+
+        with self.assertRaises(IndexError):
+            bits.set_range(0, 101)
+
+    def test_07_resize_should_clear_dropped_bits(self):
+        bits = BitArray(size=100)
+        bits.set_range(0, 100)
+        bits.resize(3)
+        bits.resize(100)
+        assert bits.popcount() == 3
+        assert len(bits._bits) == 16
+
+    def test_08_contains_clone_and_equality(self):
+        assert True in self._bits
+        assert False in self._bits
+        assert False not in BitArray(1, 1)
+
+        copy = BitArray.clone(self._bits)
+        assert copy == self._bits
+
+        copy[1] = True
+        assert copy != self._bits
+        assert str(self._bits) == '[1, 0, 1, 1, 0]'
+
+
+if __name__ == '__main__':
+    unittest.main()
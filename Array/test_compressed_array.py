@@ -0,0 +1,105 @@
+import unittest
+
+from arrayadt import Array
+from compressed_array import CompressedArray
+
+
+class CompressedArrayTest(unittest.TestCase):
+
+    def setUp(self):
+        self._array = CompressedArray(range(1000), typecode='i', chunk_size=100, cache_size=2)
+
+    def test_01_items_should_round_trip(self):
+        assert len(self._array) == 1000
+        assert self._array[0] == 0
+        assert self._array[-1] == 999
+        assert list(self._array) == list(range(1000))
+        assert self._array.cache_stats()['chunks'] == 10
+
+        with self.assertRaises(IndexError):
+            self._array[1000]
+
+    def test_02_object_storage_and_lzma_should_round_trip(self):
+        array = CompressedArray('A', ['B', ('C', 1)], chunk_size=2, codec='lzma')
+        assert list(array) == ['A', 'B', 'C', 1]
+
+        array[3] = None
+        assert array[3] is None
+
+    def test_03_setitem_should_survive_eviction(self):
+        self._array[5] = -5
+        self._array[250] = -250
+        self._array[950] = -950
+        assert self._array.cache_stats()['cached'] == 2
+
+        assert self._array[5] == -5
+        assert self._array[250] == -250
+        assert self._array[950] == -950
+
+    def test_04_counters_should_track_the_cache(self):
+        self._array[0]
+        self._array[1]
+        self._array[500]
+        stats = self._array.cache_stats()
+
+        assert stats['hits'] == 1
+        assert stats['misses'] == 2
+        assert stats['hit_ratio'] == 1 / 3
+
+    def test_05_iteration_should_not_evict_hot_chunks(self):
+        self._array[0]
+        list(self._array)
+        assert list(self._array._cache) == [0]
+
+    def test_06_resize_should_keep_and_clear_slots(self):
+        self._array[150] = -1
+        self._array.resize(160)
+        assert list(self._array)[150:] == [-1] + list(range(151, 160))
+
+        self._array.resize(420)
+        assert len(self._array) == 420
+        assert list(self._array)[158:] == [158, 159] + [0] * 260
+        assert self._array.cache_stats()['chunks'] == 5
+
+    def test_07_conversions_and_equality(self):
+        array = Array([1.5, 2.5, 3.5], typecode='d')
+        compressed = CompressedArray.from_array(array, chunk_size=2)
+
+        assert compressed.to_array() == array
+        assert compressed == CompressedArray([1.5, 2.5, 3.5], typecode='d')
+        assert compressed != CompressedArray([1.5, 2.5], typecode='d')
+        assert 2.5 in compressed
+        assert str(compressed) == '[1.5, 2.5, 3.5]'
+
+    def test_08_bad_arguments_should_raise(self):
+        with self.assertRaises(ValueError):
+            CompressedArray(codec='gzip')
+        with self.assertRaises(ValueError):
+            CompressedArray(chunk_size=0)
+        with self.assertRaises(ValueError):
+            self._array.resize(-1)
+        with self.assertRaises(TypeError):
+            CompressedArray.from_array([1, 2])
+
+
+    def test_09_from_array_should_keep_iterable_items_whole(self):
+        array = Array(size=2)
+        array[0] = [1, 2]
+        array[1] = 'x'
+        compressed = CompressedArray.from_array(array, chunk_size=1)
+
+        assert len(compressed) == 2
+        assert list(compressed) == [[1, 2], 'x']
+
+    def test_10_construction_should_chunk_as_it_goes(self):
+        array = CompressedArray(size=10 ** 7, typecode='d', chunk_size=10 ** 5)
+        assert len(array) == 10 ** 7
+        assert array.cache_stats()['chunks'] == 100
+        assert array[-1] == 0.0
+
+        nested = CompressedArray(1, [2, (3, 4)], range(5, 8), chunk_size=3)
+        assert list(nested) == list(range(1, 8))
+        assert nested.cache_stats()['chunks'] == 3
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import random
+import unittest
+
+from arrayadt import Array
+from range_index import RangeIndex
+
+
+class RangeIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self._values = [5, 3, 8, 1, 9, 2, 7]
+        self._array = Array(self._values, typecode='i')
+        self._ranges = RangeIndex(self._array, min_max=True)
+
+    def test_01_queries_should_match_a_scan(self):
+        for lo in range(len(self._values) + 1):
+            for hi in range(lo, len(self._values) + 1):
+                assert self._ranges.sum(lo, hi) == sum(self._values[lo:hi])
+                if lo < hi:
+                    assert self._ranges.min(lo, hi) == min(self._values[lo:hi])
+                    assert self._ranges.max(lo, hi) == max(self._values[lo:hi])
+
+        assert self._ranges.sum() == 35
+
+    def test_02_setitem_should_update_incrementally(self):
+        self._ranges.sum()
+        self._array[3] = 10
+        self._array[-1] = 0
+
+        assert not self._ranges._stale
+        assert self._ranges.sum(2, 5) == 27
+        assert self._ranges.max() == 10
+        assert self._ranges.min(4, 7) == 0
+
+    def test_03_random_updates_should_stay_consistent(self):
+        values = [random.randint(-100, 100) for _ in range(100)]
+        array = Array(values)
+        ranges = RangeIndex(array, min_max=True)
+        for _ in range(200):
+            index = random.randrange(100)
+            values[index] = array[index] = random.randint(-100, 100)
+            lo = random.randrange(100)
+            hi = random.randint(lo + 1, 100)
+            assert ranges.sum(lo, hi) == sum(values[lo:hi])
+            assert ranges.min(lo, hi) == min(values[lo:hi])
+            assert ranges.max(lo, hi) == max(values[lo:hi])
+
+    def test_04_structural_changes_should_rebuild(self):
+        self._ranges.sum()
+        self._array.resize(9)
+        assert self._ranges._stale
+        assert self._ranges.sum() == 35
+        assert self._ranges.min() == 0
+
+        del self._array[0]
+        assert self._ranges.sum(0, 2) == 11
+
+        self._array.sort()
+        assert self._ranges.max(0, 3) == 1
+
+        self._array[0:2] = [50, 60]
+        assert self._ranges.sum(0, 2) == 110
+
+    def test_05_bad_ranges_should_raise(self):
+        with self.assertRaises(IndexError):
+            self._ranges.sum(3, 8)
+        with self.assertRaises(IndexError):
+            self._ranges.sum(4, 3)
+        with self.assertRaises(ValueError):
+            self._ranges.min(3, 3)
+        with self.assertRaises(ValueError):
+            RangeIndex(self._array).max()
+        with self.assertRaises(TypeError):
+            RangeIndex([1, 2, 3])
+
+    def test_06_detach_should_stop_updates(self):
+        self._ranges.detach()
+        self._array[0] = 100
+        assert self._array._range_indexes == []
+
+        clone = Array.clone(self._array)
+        clone_ranges = RangeIndex(clone)
+        self._array[1] = 100
+        assert clone_ranges.sum() == 130
+
+    def test_07_failed_store_should_leave_trees_unchanged(self):
+        self._ranges.sum()
+        with self.assertRaises(TypeError):
+            self._array[0] = 1.5
+
+        assert self._ranges.sum() == sum(self._values)
+        assert self._ranges.max(0, 1) == 5
+
+
+if __name__ == '__main__':
+    unittest.main()
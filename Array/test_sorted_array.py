@@ -0,0 +1,104 @@
+import pickle
+import unittest
+
+from sorted_array import SortedArray
+
+
+class SortedArrayTest(unittest.TestCase):
+
+    def setUp(self):
+        self._array = SortedArray(5, [1, 9], (3, 7), 3)
+
+    def test_01_constructor_should_sort_items(self):
+        assert list(self._array) == [1, 3, 3, 5, 7, 9]
+        assert list(SortedArray([3, 1, 2], typecode='i')) == [1, 2, 3]
+
+    def test_02_contains_should_find_present_items_only(self):
+        assert 7 in self._array
+        assert 4 not in self._array
+        assert 10 not in self._array
+
+    def test_03_index_of_should_return_first_occurrence(self):
+        assert self._array.index_of(3) == 1
+
+        with self.assertRaises(KeyError):
+            self._array.index_of(4)
+
+    def test_04_count_and_bounds_should_cover_equal_items(self):
+        assert self._array.count(3) == 2
+        assert self._array.count(4) == 0
+        assert self._array.lower_bound(3) == 1
+        assert self._array.upper_bound(3) == 3
+
+    def test_05_range_should_yield_half_open_range(self):
+        assert list(self._array.range(3, 7)) == [3, 3, 5]
+        assert list(self._array.range(8, 2)) == []
+
+    def test_06_insert_should_keep_order_and_capacity(self):
+        self._array.reserve(10)
+        self._array.insert(4)
+        self._array.insert(0)
+        self._array.insert(10)
+
+        assert list(self._array) == [0, 1, 3, 3, 4, 5, 7, 9, 10]
+        assert self._array.capacity == 10
+
+    def test_07_remove_should_delete_first_occurrence(self):
+        self._array.remove(3)
+        self._array.remove(9)
+
+        assert list(self._array) == [1, 3, 5, 7]
+
+        with self.assertRaises(KeyError):
+            self._array.remove(9)
+
+    def test_08_assignment_and_growth_should_be_rejected(self):
+        with self.assertRaises(TypeError):
+            self._array[0] = 100
+        with self.assertRaises(TypeError):
+            self._array[0:2][0:1] = [2]
+        with self.assertRaises(ValueError):
+            self._array.resize(10)
+        with self.assertRaises(TypeError):
+            self._array.sort(reverse=True)
+
+        self._array.resize(2)
+        assert list(self._array) == [1, 3]
+
+    def test_09_pickle_should_round_trip_as_a_sorted_array(self):
+        typed = SortedArray(5, 1, 3, typecode='i')
+        for instance in (self._array, typed):
+            for protocol in (2, pickle.HIGHEST_PROTOCOL):
+                restored = pickle.loads(pickle.dumps(instance, protocol=protocol))
+
+                assert type(restored) is SortedArray
+                assert list(restored) == list(instance)
+                assert restored.typecode == instance.typecode
+
+        restored.insert(2)
+        assert list(restored) == [1, 2, 3, 5]
+
+    def test_10_incomparable_items_should_not_be_found(self):
+        typed = SortedArray(1, 2, typecode='i')
+
+        assert None not in self._array
+        assert 'x' not in typed
+        assert self._array.count(None) == 0
+        with self.assertRaises(KeyError):
+            typed.index_of('x')
+
+    def test_11_clone_should_stay_a_sorted_array(self):
+        for deep in (False, True):
+            clone = SortedArray.clone(self._array, deep)
+
+            assert type(clone) is SortedArray
+            assert list(clone) == list(self._array)
+            with self.assertRaises(TypeError):
+                clone[0] = 100
+
+            clone.insert(4)
+            assert 4 in clone and 4 not in self._array
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+
+from sparse_array import SparseArray
+
+
+class SparseArrayTest(unittest.TestCase):
+
+    def setUp(self):
+        self._array = SparseArray(1000000, fill=0)
+        self._array[3] = 7
+        self._array[-1] = 9
+
+    def test_01_unset_slots_should_return_fill(self):
+        assert self._array[0] == 0
+        assert self._array[3] == 7
+        assert self._array[999999] == 9
+        assert len(self._array) == 1000000
+        assert self._array.occupied == 2
+
+        with self.assertRaises(IndexError):
+            self._array[1000000]
+
+    def test_02_setting_fill_should_free_slot(self):
+        self._array[3] = 0
+        assert self._array.occupied == 1
+        assert self._array[3] == 0
+
+    def test_03_items_should_yield_occupied_pairs_in_order(self):
+        self._array[1] = 5
+        assert list(self._array.items()) == [(1, 5), (3, 7), (999999, 9)]
+
+    def test_04_resize_should_keep_occupied_slots_in_range(self):
+        self._array.resize(10)
+        assert len(self._array) == 10
+        assert list(self._array.items()) == [(3, 7)]
+
+        self._array.resize(10 ** 12)
+        assert self._array[10 ** 12 - 1] == 0
+        assert self._array.occupied == 1
+
+        with self.assertRaises(ValueError):
+            self._array.resize(-1)
+
+    def test_05_delitem_should_shift_occupied_slots_down(self):
+        del self._array[0]
+        assert len(self._array) == 999999
+        assert list(self._array.items()) == [(2, 7), (999998, 9)]
+
+    def test_06_contains_should_account_for_fill(self):
+        assert 7 in self._array
+        assert 0 in self._array
+        assert 8 not in self._array
+
+        full = SparseArray(1, fill=0)
+        full[0] = 1
+        assert 0 not in full
+
+    def test_07_clone_and_equality(self):
+        copy = SparseArray.clone(self._array)
+        assert copy == self._array
+
+        copy[5] = 1
+        assert copy != self._array
+        assert self._array[5] == 0
+
+        other_fill = SparseArray(3, fill=None)
+        other_fill[0] = other_fill[1] = other_fill[2] = 0
+        assert other_fill == SparseArray(3, fill=0)
+
+        with self.assertRaises(TypeError):
+            SparseArray.clone([1, 2])
+
+    def test_08_str_should_be_bounded(self):
+        assert str(SparseArray(3, fill=0)) == '[0, 0, 0]'
+        assert str(self._array).endswith(', ... 999900 more]')
+
+
+if __name__ == '__main__':
+    unittest.main()
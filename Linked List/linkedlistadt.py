@@ -1,4 +1,5 @@
 from typing import Any
+from itertools import islice
 
 
 class LinkedList:
@@ -105,6 +106,9 @@ class LinkedList:
             """
             return f'LinkedList._Node with Item: {self._item}, Previous: {self._previous}, Next: {self._next}'
 
+    #Number of items __str__ shows before summarising the rest, use write_to for the full rendering
+    _STR_LIMIT = 100
+
     def __init__(self, python_list_instance: list = None) -> None:
         """ Constructor for the LinkedList
             Usage:  1. linked_list = LinkedList()
@@ -420,21 +424,40 @@ class LinkedList:
         return self._count
 
     def __str__(self) -> str:
-        """ Return a string representation of the data and structure
+        """ Return a string representation of the data and structure. Only the first _STR_LIMIT items
+            are shown, followed by a count of the rest.
             Usage: print(linked_list):
             @:return str the string representation of the data and structure
         """
-
-        if self._count == 0:
-            return '[]'
-
-        string: str = '['
         sep: str = ' <-> '
+        string: str = '[' + sep.join([str(item) for item in islice(self, LinkedList._STR_LIMIT)])
 
-        for item in self:
-            string += str(item) + sep
+        hidden = self._count - LinkedList._STR_LIMIT
+        if hidden > 0:
+            string += f'{sep}... {hidden} more'
 
-        string = string[:len(string) - len(sep)]
-        string += ']'
+        return string + ']'
 
-        return string
\ No newline at end of file
+    def write_to(self, stream, chunk_size: int = 1024) -> None:
+        """ Write the full string representation to a text stream, rendering chunk_size items at a time
+            so the whole string is never built in memory
+            Usage: linked_list.write_to(sys.stdout)
+            @:param stream a text stream with a write method
+            @:param chunk_size the number of items rendered per write
+            @:return none
+            @:raises ValueError if chunk_size is less than 1
+        """
+        if chunk_size < 1:
+            raise ValueError('Chunk size must be at least 1')
+
+        sep: str = ' <-> '
+        items = iter(self)
+        separator = ''
+        stream.write('[')
+        while True:
+            chunk = [str(item) for item in islice(items, chunk_size)]
+            if not chunk:
+                break
+            stream.write(separator + sep.join(chunk))
+            separator = sep
+        stream.write(']')
\ No newline at end of file
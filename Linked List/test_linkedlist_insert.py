@@ -1,3 +1,4 @@
+import io
 import unittest
 import pytest
 from linkedlistadt import LinkedList
@@ -249,4 +250,17 @@ class LinkedListTest(unittest.TestCase):
 
         assert old_tail_node != small_linked_list.tail
         assert small_linked_list.tail.item == 1
-        
\ No newline at end of file
+        
+
+    def test_21_str_should_summarise_large_lists(self):
+        linked_list = LinkedList(list(range(105)))
+
+        assert str(self._linked_list) == '[' + ' <-> '.join(str(i) for i in range(10)) + ']'
+        assert str(linked_list).endswith('98 <-> 99 <-> ... 5 more]')
+        assert str(LinkedList()) == '[]'
+
+    def test_22_write_to_should_stream_the_full_rendering(self):
+        stream = io.StringIO()
+        self._linked_list.write_to(stream, chunk_size=3)
+
+        assert stream.getvalue() == str(self._linked_list)
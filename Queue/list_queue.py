@@ -108,3 +108,17 @@ class ListQueue:
             @:return str the string representation of the data and structure
         """
         return f'ListQueue: Top at front.  Queue: {self._queue}'
+
+    def write_to(self, stream, chunk_size: int = 1024) -> None:
+        """ Write the full string representation to a text stream in chunks
+            Usage: queue.write_to(sys.stdout)
+            @:param stream a text stream with a write method
+            @:param chunk_size the number of items rendered per write
+            @:return none
+            @:raises ValueError if chunk_size is less than 1
+        """
+        if chunk_size < 1:
+            raise ValueError('Chunk size must be at least 1')
+
+        stream.write('ListQueue: Top at front.  Queue: ')
+        self._queue.write_to(stream, chunk_size)
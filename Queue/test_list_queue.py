@@ -1,3 +1,4 @@
+import io
 import unittest
 
 from list_queue import ListQueue
@@ -68,5 +69,14 @@ class ListQueueTest(unittest.TestCase):
         for i in range(5):
             assert i == self._queue.dequeue()
 
+    def test_10_str_should_summarise_large_queues_and_write_to_should_not(self):
+        for i in range(150):
+            self._queue.enqueue(i)
+        stream = io.StringIO()
+        self._queue.write_to(stream, chunk_size=10)
+
+        assert str(self._queue).endswith(' <-> 99 <-> ... 50 more]')
+        assert stream.getvalue() == 'ListQueue: Top at front.  Queue: [' + ' <-> '.join(str(i) for i in range(150)) + ']'
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
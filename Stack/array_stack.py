@@ -1,10 +1,12 @@
 from typing import Any
+from collections.abc import Iterable
+from itertools import islice, repeat
 
 from arrayadt import Array
 
 
 class ArrayStack:
-    """ Class ArrayStack - representing a fixed-size stack using a 1D Array
+    """ Class ArrayStack - representing a fixed-size (or optionally growable) stack using a 1D Array
                 Stipulations:
                 1. Must use an Array object as the internal data structure from the Array assignment.
                 2. Must adhere to the docstring requirements per method, including raising
@@ -12,14 +14,36 @@ class ArrayStack:
                 3. Must achieve a minimum of 92% code coverage through unit testing.
     """
 
-    def __init__(self, max_size: int = 0) -> None:
+    def __init__(self, max_size: int = 0, typecode: str = None, growable: bool = False,
+                 low_water: float = 0.25) -> None:
         """ Constructor
-            Usage:  stack = ArrayStack(10)
-            @:param max_size the desired max size of the stack
+            Usage:  1. stack = ArrayStack(10)
+                    2. stack = ArrayStack(10, typecode='d')
+                    3. stack = ArrayStack(16, growable=True)
+            @:param max_size the desired max size of the stack, or the starting (and smallest) capacity
+                     when growable
+            @:param typecode optional array module typecode for compact, typed storage of the items
+            @:param growable use True to double the capacity when a push finds the stack full, instead of
+                     raising IndexError, and halve it when pops leave it sparse
+            @:param low_water a growable stack halves its capacity once fewer than this fraction of the
+                     slots are in use (use 0 to never shrink)
             @:return none
+            @:raises ValueError if low_water is not in [0, 0.5)
         """
-        self._stack = Array(size=max_size)
+        #Below a half, a halved stack is never immediately full again, so push and pop stay amortized O(1)
+        if not 0 <= low_water < 0.5:
+            raise ValueError('Low water ratio must be at least 0 and less than 0.5')
+
+        self._stack = Array(size=max_size, typecode=typecode)
         self._size = 0
+        #Value popped slots are reset to, so the stack stops referencing the items it no longer holds
+        self._empty = Array._allocate(1, typecode)[0]
+        self._growable = growable
+        self._low_water = low_water
+        self._min_size = max_size
+        self._growth_events = 0
+        self._shrink_events = 0
+        self._peak_depth = 0
 
     @staticmethod
     def clone(array_stack_instance: 'ArrayStack') -> 'ArrayStack':
@@ -32,9 +56,16 @@ class ArrayStack:
         if array_stack_instance is not None and not isinstance(array_stack_instance, ArrayStack):
                 raise TypeError('Instance is not a ArrayStack')
         
-        stack = ArrayStack(array_stack_instance.max_size)
+        #Built as the instance's own class, so subclasses clone to their own type
+        stack = type(array_stack_instance)(typecode=array_stack_instance._stack.typecode,
+                                           growable=array_stack_instance._growable,
+                                           low_water=array_stack_instance._low_water)
         stack._stack = Array.clone(array_stack_instance._stack)
+        stack._min_size = array_stack_instance._min_size
         stack._size = array_stack_instance._size
+        stack._growth_events = array_stack_instance._growth_events
+        stack._shrink_events = array_stack_instance._shrink_events
+        stack._peak_depth = array_stack_instance._peak_depth
 
         return stack
 
@@ -43,13 +74,18 @@ class ArrayStack:
                 Usage:   stack.push(item)
                 @:param item to enqueue
                 @:return none
-                @:raises IndexError if the stack is full
+                @:raises IndexError if the stack is full and not growable
         """
-        if self.full:
-            raise IndexError('Stack is full')
+        if self._size == len(self._stack):
+            if not self._growable:
+                raise IndexError('Stack is full')
+            self._stack.resize(max(1, 2 * len(self._stack)))
+            self._growth_events += 1
 
         self._stack[self._size] = item
         self._size += 1
+        if self._size > self._peak_depth:
+            self._peak_depth = self._size
 
     def pop(self) -> Any:
         """ Pop an item from the stack and return the item
@@ -61,14 +97,123 @@ class ArrayStack:
             raise IndexError('Stack is empty')
 
         self._size -= 1
-        return self._stack[self._size]
+        item = self._stack[self._size]
+        self._stack[self._size] = self._empty
+        if self._growable and self._size < len(self._stack) * self._low_water:
+            self._shrink()
+
+        return item
+
+    def _shrink(self) -> None:
+        """ This is a private helper function that halves the capacity of a growable stack until it is
+            no longer sparse, never going below the capacity it started with, and releases the freed
+            storage in one resize.
+        """
+        capacity = len(self._stack)
+        while capacity // 2 >= self._min_size and self._size < capacity * self._low_water:
+            capacity //= 2
+        capacity = max(capacity, self._min_size)
+        if capacity < len(self._stack):
+            self._stack.resize(capacity)
+            self._stack.shrink_to_fit()
+            self._shrink_events += 1
+
+    def push_many(self, items: Iterable) -> None:
+        """ Push several items, the last one ending up on top. Capacity is checked once and the items
+            are copied into the storage with one slice assignment.
+                Usage:   stack.push_many(frames)
+                @:param items an iterable of items to push in order
+                @:return none
+                @:raises IndexError if they do not all fit and the stack is not growable, in which case
+                         none are pushed
+        """
+        items = list(items)
+        end = self._size + len(items)
+        if end > len(self._stack):
+            if not self._growable:
+                raise IndexError('Stack is full')
+            capacity = max(1, len(self._stack))
+            while capacity < end:
+                capacity *= 2
+            self._stack.resize(capacity)
+            self._growth_events += 1
+
+        self._stack[self._size:end] = items
+        self._size = end
+        if end > self._peak_depth:
+            self._peak_depth = end
+
+    def _top(self, n: int) -> list:
+        """ This is a private helper function that bounds checks n and copies the top n items, top first,
+            with one slice of the storage.
+        """
+        if not 0 <= n <= self._size:
+            raise IndexError(f'Cannot take {n} items from a stack of {self._size}')
 
-    def clear(self) -> None:
-        """ Clear the stack
-                Usage: stack.clear():
+        items = self._stack._items[self._size - n:self._size]
+        items = items.tolist() if self._stack.typecode is not None else items
+        items.reverse()
+        return items
+
+    def pop_many(self, n: int) -> list:
+        """ Pop several items at once
+                Usage:   items = stack.pop_many(100)
+                @:param n the number of items to pop
+                @:return a list of the popped items, top first, in the order pop would return them
+                @:raises IndexError if n is negative or more than the number of items on the stack
+        """
+        items = self._top(n)
+        self._size -= n
+        self._stack[self._size:self._size + n] = repeat(self._empty, n)
+        if self._growable and self._size < len(self._stack) * self._low_water:
+            self._shrink()
+
+        return items
+
+    def peek_n(self, n: int) -> list:
+        """ Get the top items without popping them
+                Usage:   items = stack.peek_n(3)
+                @:param n the number of items to get
+                @:return a list of the top n items, top first
+                @:raises IndexError if n is negative or more than the number of items on the stack
+        """
+        return self._top(n)
+
+    def clear(self, shrink: bool = False) -> None:
+        """ Clear the stack, releasing every item it held
+                Usage: 1. stack.clear():
+                       2. stack.clear(shrink=True):
+                @:param shrink use True to also return a growable stack to the capacity it started with
+                         and release the backing Array's spare storage
                 @:return none
         """
+        self._stack[0:self._size] = repeat(self._empty, self._size)
         self._size = 0
+        if shrink:
+            if self._growable and len(self._stack) > self._min_size:
+                self._stack.resize(self._min_size)
+                self._shrink_events += 1
+            self._stack.shrink_to_fit()
+
+    def memory_report(self) -> dict:
+        """ Report how the slots of the backing Array are being used
+                Usage: report = stack.memory_report()
+                @:return a dict with the 'capacity', the 'live' slots holding items on the stack, the
+                         'retained' slots above the top that still hold a popped item (or a non-zero
+                         value when typed) and the 'free' empty slots above the top
+        """
+        dead = islice(self._stack, self._size, None)
+        if self._stack.typecode is None:
+            retained = sum(item is not None for item in dead)
+        else:
+            retained = sum(map(bool, dead))
+
+        return {
+            'capacity': len(self._stack),
+            'live': self._size,
+            'retained': retained,
+            'free': len(self._stack) - self._size - retained,
+        }
 
     @property
     def top(self) -> Any:
@@ -90,13 +235,53 @@ class ArrayStack:
         """
         return len(self._stack)
 
+    @property
+    def capacity(self) -> int:
+        """ Get the number of items the stack can hold before it is full, or before it grows
+                Usage:   capacity = stack.capacity
+                @:return the current capacity of the stack
+        """
+        return len(self._stack)
+
+    @property
+    def growable(self) -> bool:
+        """ Check whether the stack grows instead of becoming full
+                Usage:   growable = stack.growable
+                @:return true if the stack was made with growable=True
+        """
+        return self._growable
+
+    @property
+    def growth_events(self) -> int:
+        """ Get the number of times a growable stack has doubled its capacity
+                Usage:   grown = stack.growth_events
+                @:return the number of growth events
+        """
+        return self._growth_events
+
+    @property
+    def shrink_events(self) -> int:
+        """ Get the number of times a growable stack has halved its capacity
+                Usage:   shrunk = stack.shrink_events
+                @:return the number of shrink events
+        """
+        return self._shrink_events
+
+    @property
+    def peak_depth(self) -> int:
+        """ Get the most items the stack has held at once
+                Usage:   deepest = stack.peak_depth
+                @:return the peak depth of the stack
+        """
+        return self._peak_depth
+
     @property
     def full(self) -> bool:
         """ Check whether the stack is full
                 Usage:   full = stack.full
-                @:return full boolean as to whether the stack is full
+                @:return full boolean as to whether the stack is full (never true for a growable stack)
         """
-        return self.max_size == self._size
+        return not self._growable and self.max_size == self._size
 
     @property
     def empty(self) -> bool:
@@ -128,8 +313,23 @@ class ArrayStack:
         return self._size
 
     def __str__(self) -> str:
-        """ Return a string representation of the data and structure
+        """ Return a string representation of the data and structure. Large stacks are summarised
+            as for Array.
                 Usage: print(stack):
                 @:return str the string representation of the data and structure
         """
         return f'ArrayStack size: {self._size}, Elements (top is last): {str(self._stack)}'
+
+    def write_to(self, stream, chunk_size: int = 1024) -> None:
+        """ Write the full string representation to a text stream in chunks
+                Usage: stack.write_to(sys.stdout)
+                @:param stream a text stream with a write method
+                @:param chunk_size the number of items rendered per write
+                @:return none
+                @:raises ValueError if chunk_size is less than 1
+        """
+        if chunk_size < 1:
+            raise ValueError('Chunk size must be at least 1')
+
+        stream.write(f'ArrayStack size: {self._size}, Elements (top is last): ')
+        self._stack.write_to(stream, chunk_size)
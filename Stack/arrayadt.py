@@ -1,5 +1,24 @@
 from typing import Any
 from copy import deepcopy
+from array import array
+from bisect import bisect_right, insort
+from collections import Counter
+from collections.abc import Iterable
+from functools import reduce
+from itertools import islice, repeat
+from multiprocessing import Pool, shared_memory
+import mmap
+import operator
+import os
+import pickle
+import random
+import struct
+import sys
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
 
 
 class Array:
@@ -11,84 +30,1245 @@ class Array:
             3. Must achieve a minimum of 92% code coverage through unit testing.
     """
 
-    def __init__(self, *items, size=0) -> None:
+    #Header written by dump: magic, typecode (NUL for object storage), little endian flag, item size
+    #and length. Typed data follows as the raw buffer, object data as a protocol 5 pickle.
+    _DUMP_MAGIC = b'ARRY'
+    _DUMP_HEADER = struct.Struct('<4scBBQ')
+    _DUMP_SIZE = struct.Struct('<Q')
+    #Number of items __str__ shows before summarising the rest, use write_to for the full rendering
+    _STR_LIMIT = 100
+    #Typecodes of integers at most 16 bits wide, which sort counts in O(n) instead of comparing
+    _COUNTING_TYPECODES = ('b', 'B', 'h', 'H')
+    #Typecodes numpy can view, as it has no dtype for the 'u' and 'w' characters
+    _NUMPY_TYPECODES = ('b', 'B', 'h', 'H', 'i', 'I', 'l', 'L', 'q', 'Q', 'f', 'd')
+
+    def __init__(self, *items, size=0, typecode: str = None, growth_factor: float = 2.0,
+                 shrink_ratio: float = 0.25, indexed: bool = False, lazy_delete: bool = False,
+                 compact_ratio: float = 0.25) -> None:
         """ Constructor
             Usages:  1. array = Array(size=10)
                      2. array = Array('A', 'B', 'C') 
                      3. array = Array(['A', 'B', 'C'])
                      4. array = Array(('A', 'B', 'C'))
+                     5. array = Array(size=10, typecode='d')
+                     6. array = Array(row for row in batch)
             @:param *items a variable list of arguments that contain the items to be deep copied into the Array.
             @:param size the desired size of the Array (use 0 if providing initialization items)
-                     Note: An Array can be initialized using a list or tuple, which must be flattened.
+                     Note: An Array can be initialized using a list, tuple or any other iterable (strings
+                     excepted), which must be flattened. Iterables are streamed in without a copy.
+            @:param typecode optional array module typecode (e.g. 'i', 'd'); when given the items are
+                     stored unboxed in a contiguous array.array buffer and empty slots hold 0 instead of None
+            @:param growth_factor how much the capacity is multiplied by when resize outgrows it
+            @:param shrink_ratio resize releases spare capacity once the length drops below this fraction
+                     of the capacity (use 0 to never shrink automatically)
+            @:param indexed use True to keep a hash index of item positions, making in, index_of and
+                     count O(1) on average (every item must then be hashable)
+            @:param lazy_delete use True to make del leave a tombstone instead of shifting the later
+                     items, with all tombstones removed in one pass by compact()
+            @:param compact_ratio with lazy_delete, compact automatically once this fraction of the
+                     slots are tombstones
             @:return none
-            @:raises TypeError if instance is provided and it is not an Array instance
+            @:raises TypeError if instance is provided and it is not an Array instance, or indexed is
+                     True and an item is not hashable
+            @:raises ValueError if typecode is not a valid array module typecode, growth_factor is not
+                     greater than 1, shrink_ratio is not in [0, 1), compact_ratio is not in (0, 1] or
+                     both indexed and lazy_delete are True
         """
+        if growth_factor <= 1:
+            raise ValueError('Growth factor must be greater than 1')
+        if not 0 <= shrink_ratio < 1:
+            raise ValueError('Shrink ratio must be at least 0 and less than 1')
+        if not 0 < compact_ratio <= 1:
+            raise ValueError('Compact ratio must be greater than 0 and at most 1')
+        if indexed and lazy_delete:
+            raise ValueError('An indexed Array cannot use lazy deletion')
+
+        self._typecode = typecode
+        self._growth_factor = growth_factor
+        self._shrink_ratio = shrink_ratio
+        #Only set for file-backed Arrays made by create_mmap/open_mmap
+        self._file = None
+        self._mapping = None
+        #Number of Arrays sharing _items after clone, held in a list that the sharers all reference
+        self._share_count = [1]
+        #Sorted storage positions of items deleted lazily but not yet compacted away. The storage up to
+        #_length includes these, so the length of the Array is _length - len(_tombstones)
+        self._lazy_delete = lazy_delete
+        self._compact_ratio = compact_ratio
+        self._tombstones = []
         if len(items) == 0:
-            self._items = [None] * size
+            self._items = Array._allocate(size, typecode)
         else:
-            list(Array._flatten_helper(items))
+            self._items = Array._allocate(0, typecode)
+            Array._flatten_into(self._items, items)
+        #Slots from _length up to the capacity (len(self._items)) are spare and always kept empty
+        self._length = len(self._items)
+        #Maps each item to the set of positions holding it, when indexed
+        self._index = None
+        if indexed:
+            self._build_index()
+        #RangeIndex instances attached to this Array, told about every change
+        self._range_indexes = []
+
+    @staticmethod
+    def _allocate(size: int, typecode: str = None):
+        """ This is a private helper function that allocates the backing storage for size empty slots.
+            Object storage is a list of None, typed storage is a zero filled array.array.
+        """
+        if typecode is None:
+            return [None] * size
+
+        buffer = array(typecode)
+        buffer.frombytes(bytes(buffer.itemsize * size))
+        return buffer
+
+    @staticmethod
+    def _is_nested(item: Any) -> bool:
+        """ This is a private helper function that checks whether an item is an iterable that
+            should be flattened rather than stored. Strings and bytes are stored whole.
+        """
+        return isinstance(item, Iterable) and not isinstance(item, (str, bytes, bytearray))
 
     @staticmethod
-    def _flatten_helper(items):
-        """ This is a private helper function that flattens items down to individual items.
+    def _flatten_into(storage, items: tuple) -> None:
+        """ This is a private helper function that flattens items down to individual items and
+            appends them to storage. It keeps an explicit stack of iterators instead of recursing,
+            so nesting depth is not limited by the recursion limit.
             This is not part of the public methods that are provided to students.
         """
-        #check if items is an instance of tuple or list
-        if isinstance(items, tuple) or isinstance(items, list):
-            for item in items:
-                yield from Array._flatten_helper(item)
+        stack = [iter((items,))]
+        while stack:
+            for item in stack[-1]:
+                if not Array._is_nested(item):
+                    storage.append(item)
+                #A list or tuple holding no iterables at all is copied in with one call
+                elif isinstance(item, (list, tuple)) and not any(map(isinstance, item, repeat(Iterable))):
+                    storage.extend(item)
+                else:
+                    stack.append(iter(item))
+                    break
+            else:
+                stack.pop()
+
+    @staticmethod
+    def clone(array_instance: 'Array', deep: bool = False) -> 'Array':
+        """ Clone the Array. By default this is O(1): the clone shares the storage of the instance
+            and whichever of them is mutated first copies the storage then.
+            Usage:  1. array = Array.clone(instance)
+                    2. array = Array.clone(instance, deep=True)
+            @:param array_instance an Array instance to copy data from.
+            @:param deep use True to deep copy the storage and the items in it up front
+            @:return a copy of the Array (file-backed Arrays are always copied into memory)
+            @:raises TypeError if instance is provided and it is not an Array instance
+        """
+        if not isinstance(array_instance, Array):
+            raise TypeError('Instance is not an Array')
+
+        if array_instance._file is not None:
+            return array_instance._copy_range(range(array_instance._length))
+
+        array_instance.compact()
+        #Built as the instance's own class, so subclasses such as SortedArray keep their rules
+        instance = type(array_instance)(typecode=array_instance._typecode, **array_instance._options())
+        instance._length = array_instance._length
+        if deep:
+            instance._items = deepcopy(array_instance._items)
+            if array_instance._index is not None:
+                instance._build_index()
         else:
-            yield items
+            instance._items = array_instance._items
+            instance._index = array_instance._index
+            instance._share_count = array_instance._share_count
+            instance._share_count[0] += 1
+
+        return instance
+
+    def _own(self) -> None:
+        """ This is a private helper function that every mutation calls first. If the storage is shared
+            with a clone it copies the storage, so the other sharers keep seeing the old contents.
+        """
+        if self._share_count[0] > 1:
+            #Copy before giving up the share, so no other sharer counts itself the only owner and
+            #writes in place while the storage is still being copied
+            items = self._items[:]
+            index = None
+            if self._index is not None:
+                index = {item: set(positions) for item, positions in self._index.items()}
+            self._share_count[0] -= 1
+            self._share_count = [1]
+            self._items = items
+            self._index = index
+
+    def _build_index(self) -> None:
+        """ This is a private helper function that builds the position index from scratch in one pass.
+        """
+        self._index = {}
+        for position, item in enumerate(self._live()):
+            self._index.setdefault(item, set()).add(position)
+
+    def _index_add(self, position: int, item: Any) -> None:
+        """ This is a private helper function that records item at position in the index.
+        """
+        self._index.setdefault(item, set()).add(position)
+
+    def _index_discard(self, position: int, item: Any) -> None:
+        """ This is a private helper function that forgets item at position in the index.
+        """
+        positions = self._index[item]
+        positions.discard(position)
+        if not positions:
+            del self._index[item]
+
+    def _update_ranges(self, index: int, old: Any, item: Any) -> None:
+        """ This is a private helper function that tells the attached RangeIndex instances that item
+            replaced old at index.
+        """
+        for range_index in self._range_indexes:
+            range_index._update(index, old, item)
+
+    def _invalidate_ranges(self) -> None:
+        """ This is a private helper function that marks the attached RangeIndex instances stale after a
+            change too broad to update them item by item, so their next query rebuilds them.
+        """
+        for range_index in self._range_indexes:
+            range_index._stale = True
+
+    def _check_index(self, index: int) -> int:
+        """ This is a private helper function that bounds checks an index against the length (not the
+            capacity) and returns its storage position, with negative indices counted back from the end
+            and lazily deleted slots skipped.
+        """
+        length = self._length - len(self._tombstones)
+        position = index + length if index < 0 else index
+        if not 0 <= position < length:
+            raise IndexError(f'Array index {index} is out of range')
+
+        if self._tombstones:
+            position = self._skip_tombstones(position)
+
+        return position
+
+    def _skip_tombstones(self, index: int) -> int:
+        """ This is a private helper function that maps an index to the storage position holding it.
+            The position is index plus the number of tombstones up to the position, so the count is
+            refined with binary searches over the sorted tombstones until it stops changing.
+        """
+        skipped = bisect_right(self._tombstones, index)
+        while True:
+            now_skipped = bisect_right(self._tombstones, index + skipped)
+            if now_skipped == skipped:
+                return index + skipped
+            skipped = now_skipped
 
     def __getitem__(self, index: int) -> Any:
         """ Bracket operator for getting an item
-            Usage: val = array[0]
-            @:param index the desired index
-            @:return the item at the index
+            Usage: 1. val = array[0]
+                   2. view = array[2:10:2]
+            @:param index the desired index, or a slice to get a view sharing the Array's storage
+            @:return the item at the index, or an ArrayView over the sliced range
             @:raises IndexError if the index is out of bounds
         """
-        if index >= len(self):
-            raise IndexError(f'Array index {index} is out of range')
-        
-        return self._items[index]
+        if isinstance(index, slice):
+            return ArrayView(self, range(len(self))[index])
+
+        return self._items[self._check_index(index)]
+
 
     def __setitem__(self, index: int, item: Any) -> None:
         """ Bracket operator for setting an item
-            Usage: array[index] = val
-            @:param index the desired index to set
-            @:param item the desired item to set at index
+            Usage: 1. array[index] = val
+                   2. array[2:5] = [7, 8, 9]
+            @:param index the desired index to set, or a slice to assign a range of slots
+            @:param item the desired item to set at index, or an iterable with one item per sliced slot
             @:raises IndexError if the index is out of bounds
+            @:raises ValueError if a slice is assigned a different number of items than it covers
             @:return none
         """
-        if index >= len(self):
-            raise IndexError(f'Array index {index} is out of range')
+        if isinstance(index, slice):
+            self._assign_range(range(len(self))[index], item)
+            return
+
+        position = self._check_index(index)
+        self._own()
+        old = self._items[position]
+        if self._index is not None:
+            #Fail on an unhashable item before anything is changed
+            hash(item)
+        #Store first, so an item that does not fit the typecode leaves the index and ranges untouched
+        self._items[position] = item
+        #Typed storage may have converted the item (e.g. int to float), so track what was stored
+        item = self._items[position]
+        if self._index is not None:
+            self._index_discard(position, old)
+            self._index_add(position, item)
+        if self._range_indexes:
+            self._update_ranges(index + len(self) if index < 0 else index, old, item)
+
 
-        self._items[index] = item
+    @staticmethod
+    def _range_slice(indices: range) -> slice:
+        """ This is a private helper function that converts a normalized range of indices into the
+            equivalent slice of the backing storage.
+        """
+        #A descending range that runs to index 0 stops at -1, which a slice would read as the last slot
+        stop = indices.stop if indices.stop >= 0 else None
+        return slice(indices.start, stop, indices.step)
+
+    def _assign_range(self, indices: range, items: Any) -> None:
+        """ This is a private helper function that assigns an iterable of items to a range of slots,
+            through a memoryview of the buffer when the storage is typed.
+        """
+        self.compact()
+        self._own()
+        if self._typecode is None:
+            items = list(items)
+        else:
+            items = array(self._typecode, items)
+
+        if len(items) != len(indices):
+            raise ValueError(f'Cannot assign {len(items)} items to a range of {len(indices)} slots')
+
+        self._invalidate_ranges()
+
+        if self._index is not None:
+            #Fail on an unhashable item before the index is changed
+            for item in items:
+                hash(item)
+            for position in indices:
+                self._index_discard(position, self._items[position])
+            for position, item in zip(indices, items):
+                self._index_add(position, item)
+
+        if self._typecode is None:
+            self._items[Array._range_slice(indices)] = items
+        else:
+            with memoryview(self._items) as buffer:
+                buffer[Array._range_slice(indices)] = items
+
+    def _copy_range(self, indices: range) -> 'Array':
+        """ This is a private helper function that copies a range of slots into a new Array.
+        """
+        self.compact()
+        if self._typecode is None:
+            return Array._from_storage(self._items[Array._range_slice(indices)])
+
+        storage = array(self._typecode)
+        with memoryview(self._items) as buffer:
+            storage.frombytes(buffer[Array._range_slice(indices)].tobytes())
+        return Array._from_storage(storage, self._typecode)
+
+    @staticmethod
+    def from_view(view: 'ArrayView') -> 'Array':
+        """ Materialize a view into a new, independent Array
+            Usage: window = Array.from_view(array[10:20])
+            @:param view the ArrayView to copy the items from
+            @:return a new Array holding a copy of the view's items, with the parent's typecode
+            @:raises TypeError if view is not an ArrayView instance
+        """
+        if not isinstance(view, ArrayView):
+            raise TypeError('Instance is not an ArrayView')
+
+        return view._array._copy_range(view._indices)
 
     def __len__(self) -> int:
         """ len operator for getting length of the array
             Usage: for i in range(len(array))
             @:return the length of the Array
         """
-        return len(self._items)
+        return self._length - len(self._tombstones)
+
+    def _set_capacity(self, capacity: int) -> None:
+        """ This is a private helper function that grows or truncates the backing storage in place
+            to exactly capacity slots. It never truncates below the length.
+        """
+        #A mapped file always holds exactly the live items, see resize
+        if self._file is not None:
+            return
+
+        current_capacity = len(self._items)
+        if capacity > current_capacity:
+            self._items.extend(Array._allocate(capacity - current_capacity, self._typecode))
+        elif capacity < current_capacity:
+            del self._items[max(capacity, self._length):]
+
+    def _clear_range(self, start: int, stop: int) -> None:
+        """ This is a private helper function that empties the slots from start up to stop, so
+            truncated items are released and do not reappear when the Array grows again.
+        """
+        self._items[start:stop] = Array._allocate(stop - start, self._typecode)
+
+    def _shrink_if_sparse(self) -> None:
+        """ This is a private helper function that releases spare capacity once the length has dropped
+            below shrink_ratio of it, keeping growth_factor times the length as headroom.
+        """
+        if self._length < len(self._items) * self._shrink_ratio:
+            self._set_capacity(int(self._length * self._growth_factor))
 
     def resize(self, new_size: int) -> None:
-        """ Resize an Array
+        """ Resize an Array. Growing past the capacity multiplies the capacity by growth_factor, so
+            growing one slot at a time costs amortized O(1) per slot.
             Usage: array.resize(5)
             @:param new_size the desired new size
             @:return none
+            @:raises ValueError if new_size is negative
         """
+        self.compact()
         #Ensure new size isn't negative
         if new_size < 0:
             raise ValueError('Size cannot be negative')
+        self._own()
+        self._invalidate_ranges()
         #Get current size of the array
-        current_size = len(self)
-        #Truncate array to fit new size if smaller than current size
-        if new_size < current_size:
-            self._items = self._items[:new_size]
-        #Extend array to fit new size if larger than current size
+        current_size = self._length
+        if self._index is not None:
+            for position in range(new_size, current_size):
+                self._index_discard(position, self._items[position])
+            empty = Array._allocate(1, self._typecode)[0]
+            for position in range(current_size, new_size):
+                self._index_add(position, empty)
+        #Resize the file to exactly the new size, so reopening it maps back to the same length
+        if self._file is not None:
+            self._remap(new_size)
+        #Grow the capacity geometrically if the new size does not fit
+        elif new_size > len(self._items):
+            self._set_capacity(max(new_size, int(len(self._items) * self._growth_factor)))
+        #Empty the truncated slots if smaller than current size
+        elif new_size < current_size:
+            self._clear_range(new_size, current_size)
+
+        self._length = new_size
+        self._shrink_if_sparse()
+
+    def append(self, item: Any) -> None:
+        """ Grow the Array by one slot and store an item in it
+            Usage: array.append(item)
+            @:param item the desired item to append
+            @:return none
+            @:raises TypeError if the item does not fit the typecode, or the Array is indexed and the item
+                     is not hashable
+        """
+        #Check the item before growing, so one that is rejected leaves no empty slot behind
+        if self._typecode is not None:
+            item = array(self._typecode, [item])[0]
+        if self._index is not None:
+            hash(item)
+        #Counted without tombstones, as resize compacts them away before growing
+        self.resize(len(self) + 1)
+        self[len(self) - 1] = item
+
+    def reserve(self, capacity: int) -> None:
+        """ Make sure the Array can grow to capacity slots without reallocating
+            Usage: array.reserve(1000)
+            @:param capacity the minimum desired capacity
+            @:return none
+            @:raises ValueError if capacity is negative
+        """
+        self.compact()
+        if capacity < 0:
+            raise ValueError('Capacity cannot be negative')
+
+        if capacity > len(self._items):
+            self._own()
+            self._set_capacity(capacity)
+
+    def shrink_to_fit(self) -> None:
+        """ Release all spare capacity
+            Usage: array.shrink_to_fit()
+            @:return none
+        """
+        self.compact()
+        self._own()
+        self._set_capacity(self._length)
+
+    @property
+    def capacity(self) -> int:
+        """ Get the number of allocated slots
+            Usage: capacity = array.capacity
+            @:return the capacity of the Array, which is never less than its length
+        """
+        return len(self._items)
+
+    @staticmethod
+    def _map(file, typecode: str, size: int) -> 'Array':
+        """ This is a private helper function that maps an open binary file as the typed storage of a
+            new Array of size items, extending the file if it is too short.
+        """
+        instance = Array(typecode=typecode)
+        instance._file = file
+        instance._remap(size)
+        instance._length = size
+        return instance
+
+    def _remap(self, size: int) -> None:
+        """ This is a private helper function that maps size items of the file and recasts the storage
+            over the new mapping. The file is extended when it is too short, and only truncated when the
+            old mapping reached its end, so bytes past the items this Array maps (which other processes
+            may be mapping) are never cut off. An empty Array maps nothing, as mmap cannot map zero
+            bytes, and uses an empty in-memory store instead.
+        """
+        nbytes = size * array(self._typecode).itemsize
+        file_size = os.fstat(self._file.fileno()).st_size
+        #mmap.resize would truncate the file to the new length, so the mapping is replaced instead
+        owns_tail = self._mapping is not None and len(self._mapping) >= file_size
+        if self._mapping is not None:
+            self._items.release()
+            try:
+                self._mapping.close()
+            except BufferError:
+                #A chunk or numpy view still exports the mapping, so keep using it unchanged
+                self._items = memoryview(self._mapping).cast(self._typecode)
+                raise
+            self._mapping = None
+
+        if file_size < nbytes or (owns_tail and file_size > nbytes):
+            self._file.truncate(nbytes)
+
+        if size == 0:
+            self._items = memoryview(bytearray()).cast(self._typecode)
+            return
+
+        self._mapping = mmap.mmap(self._file.fileno(), nbytes)
+        self._items = memoryview(self._mapping).cast(self._typecode)
+
+    @staticmethod
+    def _check_mappable(typecode: str) -> None:
+        """ This is a private helper function that checks a typecode can be cast over a mapping before
+            any file is touched.
+        """
+        try:
+            memoryview(bytes(array(typecode).itemsize)).cast(typecode)
+        except (TypeError, ValueError):
+            raise ValueError(f'Typecode {typecode!r} cannot be mapped') from None
+
+    @staticmethod
+    def create_mmap(path: str, typecode: str, size: int) -> 'Array':
+        """ Create a file-backed Array of zero filled slots
+            Usage: array = Array.create_mmap('data.bin', 'd', 1000000)
+            @:param path the file to create (an existing file is overwritten)
+            @:param typecode the array module typecode of the items
+            @:param size the number of slots
+            @:return a new Array whose storage is the memory mapped file
+            @:raises ValueError if size is negative or typecode cannot be mapped
+        """
+        if size < 0:
+            raise ValueError('Size cannot be negative')
+        Array._check_mappable(typecode)
+
+        file = open(path, 'w+b')
+        try:
+            return Array._map(file, typecode, size)
+        except BaseException:
+            file.close()
+            raise
+
+    @staticmethod
+    def open_mmap(path: str, typecode: str, size: int = None) -> 'Array':
+        """ Open an existing file as a file-backed Array. Writes go straight to the shared mapping, so
+            several processes can map the same file without each loading a copy.
+            Usage: array = Array.open_mmap('data.bin', 'd')
+            @:param path the file to open
+            @:param typecode the array module typecode of the items
+            @:param size the number of slots, which extends the file if it is larger (use None to
+                     map every whole item in the file)
+            @:return a new Array whose storage is the memory mapped file
+            @:raises ValueError if size is negative or typecode cannot be mapped
+        """
+        if size is not None and size < 0:
+            raise ValueError('Size cannot be negative')
+        Array._check_mappable(typecode)
+
+        file = open(path, 'r+b')
+        try:
+            if size is None:
+                size = os.fstat(file.fileno()).st_size // array(typecode).itemsize
+            return Array._map(file, typecode, size)
+        except BaseException:
+            file.close()
+            raise
+
+    def flush(self) -> None:
+        """ Write changes to a file-backed Array out to its file. Does nothing for in-memory Arrays.
+            Usage: array.flush()
+            @:return none
+        """
+        if self._mapping is not None:
+            self._mapping.flush()
+
+    def close(self) -> None:
+        """ Flush and unmap a file-backed Array. The Array cannot be used afterwards.
+            Does nothing for in-memory Arrays.
+            Usage: array.close()
+            @:return none
+        """
+        if self._file is None:
+            return
+
+        self._items.release()
+        if self._mapping is not None:
+            self._mapping.flush()
+            self._mapping.close()
+        self._file.close()
+
+    def _live(self):
+        """ This is a private helper function that iterates the items up to the length, skipping the
+            spare capacity without copying the storage.
+        """
+        self.compact()
+        return islice(self._items, self._length)
+
+    def _options(self) -> dict:
+        """ This is a private helper function that collects the constructor options that clone, dump and
+            pickle carry over to the new Array.
+        """
+        return {'growth_factor': self._growth_factor, 'shrink_ratio': self._shrink_ratio,
+                'indexed': self._index is not None, 'lazy_delete': self._lazy_delete,
+                'compact_ratio': self._compact_ratio}
+
+    @staticmethod
+    def _rebuild(typecode: str, data: Any, options: dict, cls: type = None) -> 'Array':
+        """ This is a private helper function that rebuilds a pickled Array, or an instance of the
+            subclass cls, from its raw typed buffer or its list of items.
+        """
+        instance = (cls or Array)(typecode=typecode, **options)
+        if typecode is None:
+            instance._items = data
         else:
-            self._items.extend([None] * (new_size - current_size))
+            instance._items.frombytes(memoryview(data).cast('B'))
+        instance._length = len(instance._items)
+        if instance._index is not None:
+            instance._build_index()
+
+        return instance
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        """ Pickle support, so Arrays can be sent through multiprocessing. Typed storage is pickled as
+            one raw buffer instead of item by item, and out-of-band when protocol is 5 or higher.
+            Usage: data = pickle.dumps(array, protocol=5)
+            @:param protocol the pickle protocol in use
+            @:return the callable and arguments that rebuild the Array
+        """
+        self.compact()
+        if self._typecode is None:
+            data = self._items[:self._length]
+        elif protocol >= 5:
+            data = pickle.PickleBuffer(memoryview(self._items)[:self._length])
+        else:
+            data = self._items[:self._length].tobytes()
+
+        return Array._rebuild, (self._typecode, data, self._options(), type(self))
+
+    def dump(self, fileobj) -> None:
+        """ Write the Array to a binary file in a compact format. Typed storage is written as its raw
+            buffer, object storage as a protocol 5 pickle with out-of-band buffers written separately.
+            Usage: with open('array.bin', 'wb') as file: array.dump(file)
+            @:param fileobj a binary file object opened for writing
+            @:return none
+            @:raises pickle.PicklingError if an item of object storage cannot be pickled
+        """
+        self.compact()
+        typecode = (self._typecode or '\0').encode('ascii')
+        itemsize = array(self._typecode).itemsize if self._typecode else 0
+        fileobj.write(Array._DUMP_HEADER.pack(Array._DUMP_MAGIC, typecode, sys.byteorder == 'little',
+                                              itemsize, self._length))
+
+        if self._typecode is not None:
+            with memoryview(self._items) as buffer:
+                fileobj.write(buffer[:self._length])
+            return
+
+        buffers = []
+        payload = pickle.dumps(self._items[:self._length], protocol=5, buffer_callback=buffers.append)
+        fileobj.write(Array._DUMP_SIZE.pack(len(payload)))
+        fileobj.write(payload)
+        fileobj.write(Array._DUMP_SIZE.pack(len(buffers)))
+        for buffer in buffers:
+            raw = buffer.raw()
+            fileobj.write(Array._DUMP_SIZE.pack(raw.nbytes))
+            fileobj.write(raw)
+
+    @staticmethod
+    def _read_exact(fileobj, size: int) -> bytes:
+        """ This is a private helper function that reads exactly size bytes from fileobj.
+        """
+        data = fileobj.read(size)
+        if len(data) != size:
+            raise EOFError('Array dump is truncated')
+
+        return data
+
+    @staticmethod
+    def _read_size(fileobj) -> int:
+        """ This is a private helper function that reads one size field of an Array dump.
+        """
+        return Array._DUMP_SIZE.unpack(Array._read_exact(fileobj, Array._DUMP_SIZE.size))[0]
+
+    @staticmethod
+    def load(fileobj) -> 'Array':
+        """ Read an Array written by dump
+            Usage: with open('array.bin', 'rb') as file: array = Array.load(file)
+            @:param fileobj a binary file object opened for reading
+            @:return a new Array holding the dumped items
+            @:raises ValueError if the data does not start with an Array dump header
+            @:raises EOFError if the data ends before the whole Array is read
+        """
+        header = Array._read_exact(fileobj, Array._DUMP_HEADER.size)
+        magic, typecode, little_endian, itemsize, length = Array._DUMP_HEADER.unpack(header)
+        if magic != Array._DUMP_MAGIC:
+            raise ValueError('Data is not an Array dump')
+
+        if typecode != b'\0':
+            instance = Array(typecode=typecode.decode('ascii'))
+            if instance._items.itemsize != itemsize:
+                raise ValueError(f'Array dump item size {itemsize} does not match this platform')
+            instance._items.frombytes(Array._read_exact(fileobj, itemsize * length))
+            if little_endian != (sys.byteorder == 'little'):
+                instance._items.byteswap()
+            instance._length = length
+            return instance
+
+        payload = Array._read_exact(fileobj, Array._read_size(fileobj))
+        count = Array._read_size(fileobj)
+        buffers = [Array._read_exact(fileobj, Array._read_size(fileobj)) for _ in range(count)]
+
+        return Array._from_storage(pickle.loads(payload, buffers=buffers))
+
+    @property
+    def typecode(self) -> str:
+        """ Get the typecode of the backing storage
+            Usage: typecode = array.typecode
+            @:return the array module typecode, or None if the Array stores Python objects
+        """
+        return self._typecode
+
+    @staticmethod
+    def _from_storage(storage, typecode: str = None) -> 'Array':
+        """ This is a private helper function that wraps an already built backing store in a new Array.
+        """
+        instance = Array(typecode=typecode)
+        instance._items = storage
+        instance._length = len(storage)
+        return instance
+
+    @staticmethod
+    def _from_values(values: list, typecode: str = None) -> 'Array':
+        """ This is a private helper function that builds an Array from computed values, keeping
+            the typecode when every value fits it and falling back to object storage otherwise.
+        """
+        if typecode is not None:
+            try:
+                return Array._from_storage(array(typecode, values), typecode)
+            except (TypeError, OverflowError):
+                pass
+
+        return Array._from_storage(values)
+
+    @staticmethod
+    def _from_ndarray(result, typecode: str):
+        """ This is a private helper function that copies a numpy result into storage of typecode, or
+            returns None if a value does not fit it, where _from_values would fall back to objects.
+        """
+        target = numpy.dtype(typecode)
+        if target.kind in 'iu':
+            if result.dtype.kind not in 'iub':
+                return None
+            limits = numpy.iinfo(target)
+            if result.size and (int(result.min()) < limits.min or int(result.max()) > limits.max):
+                return None
+
+        storage = array(typecode)
+        storage.frombytes(result.astype(target, copy=False).tobytes())
+        return Array._from_storage(storage, typecode)
+
+    def _ndarray(self):
+        """ This is a private helper function that returns a zero-copy numpy view over typed storage,
+            or None when numpy is not installed or the Array stores Python objects or characters.
+        """
+        self.compact()
+        if numpy is None or self._typecode not in Array._NUMPY_TYPECODES:
+            return None
+
+        return numpy.frombuffer(self._items, dtype=self._typecode)[:self._length]
+
+    def _ordered_ndarray(self):
+        """ This is a private helper function that returns the numpy view for min, max and argmin, or
+            None if it holds NaN, which numpy propagates but Python's comparisons skip past.
+        """
+        view = self._ndarray()
+        if view is not None and view.dtype.kind == 'f' and numpy.isnan(view).any():
+            return None
+
+        return view
+
+    @staticmethod
+    def _widen(operand):
+        """ This is a private helper function that widens a numpy view to 64 bits, so results do not
+            wrap around in the narrow type. Returns None for unsigned 64 bit integers, which int64
+            cannot hold, and Python scalars unchanged.
+        """
+        if not isinstance(operand, numpy.ndarray):
+            return operand
+        if operand.dtype.kind == 'f':
+            return operand.astype(numpy.float64, copy=False)
+        if operand.dtype == numpy.uint64:
+            return None
+
+        return operand.astype(numpy.int64, copy=False)
+
+    @staticmethod
+    def _numpy_result(numpy_op, operands: tuple, typecode: str):
+        """ This is a private helper function that applies numpy_op to numpy views and Python numbers
+            and stores the result with typecode. Returns None whenever the pure Python path could
+            answer differently: for other operands, integers that may overflow 64 bits and results
+            that do not fit typecode, so the caller computes those with Python numbers instead.
+        """
+        if not all(isinstance(operand, (numpy.ndarray, int, float)) for operand in operands):
+            return None
+        operands = [Array._widen(operand) for operand in operands]
+        if any(operand is None for operand in operands):
+            return None
+
+        try:
+            result = numpy_op(*operands)
+        except OverflowError:
+            #A Python integer too wide for int64
+            return None
+
+        if result.dtype.kind == 'i':
+            #int64 wraps around silently, so bound the result with the same computation in floats
+            estimate = numpy_op(*[operand.astype(numpy.float64) if isinstance(operand, numpy.ndarray)
+                                  else float(operand) for operand in operands])
+            if not numpy.all(numpy.abs(estimate) < 2.0 ** 62):
+                return None
+
+        return Array._from_ndarray(result, typecode)
+
+    def _elementwise(self, other: Any, numpy_op, python_op, typecode: str = None) -> 'Array':
+        """ This is a private helper function that applies a binary operation between the Array and
+            a scalar or another Array of the same length, vectorized when both sides allow it.
+        """
+        if isinstance(other, Array):
+            if len(other) != len(self):
+                raise ValueError(f'Array lengths {len(self)} and {len(other)} do not match')
+            other_view = other._ndarray()
+        else:
+            other_view = other
+
+        typecode = typecode or self._typecode
+        view = self._ndarray()
+        if view is not None and other_view is not None:
+            result = Array._numpy_result(numpy_op, (view, other_view), typecode)
+            if result is not None:
+                return result
+
+        if isinstance(other, Array):
+            values = [python_op(a, b) for a, b in zip(self._live(), other._live())]
+        else:
+            values = [python_op(a, other) for a in self._live()]
+
+        return Array._from_values(values, typecode)
+
+    def add(self, other: Any) -> 'Array':
+        """ Elementwise addition
+            Usage: total = array.add(5) or total = array.add(other_array)
+            @:param other a scalar or an Array of the same length
+            @:return a new Array holding the sums
+            @:raises ValueError if other is an Array of a different length
+        """
+        return self._elementwise(other, operator.add, operator.add)
+
+    def multiply(self, other: Any) -> 'Array':
+        """ Elementwise multiplication
+            Usage: product = array.multiply(2) or product = array.multiply(other_array)
+            @:param other a scalar or an Array of the same length
+            @:return a new Array holding the products
+            @:raises ValueError if other is an Array of a different length
+        """
+        return self._elementwise(other, operator.mul, operator.mul)
+
+    def equal(self, other: Any) -> 'Array':
+        """ Elementwise equality comparison
+            Usage: mask = array.equal(5)
+            @:param other a scalar or an Array of the same length
+            @:return a new boolean mask Array (typecode 'B') with 1 where the items are equal
+            @:raises ValueError if other is an Array of a different length
+        """
+        return self._elementwise(other, operator.eq, operator.eq, 'B')
+
+    def less(self, other: Any) -> 'Array':
+        """ Elementwise less than comparison
+            Usage: mask = array.less(5)
+            @:param other a scalar or an Array of the same length
+            @:return a new boolean mask Array (typecode 'B') with 1 where the item is less than other
+            @:raises ValueError if other is an Array of a different length
+        """
+        return self._elementwise(other, operator.lt, operator.lt, 'B')
+
+    def greater(self, other: Any) -> 'Array':
+        """ Elementwise greater than comparison
+            Usage: mask = array.greater(5)
+            @:param other a scalar or an Array of the same length
+            @:return a new boolean mask Array (typecode 'B') with 1 where the item is greater than other
+            @:raises ValueError if other is an Array of a different length
+        """
+        return self._elementwise(other, operator.gt, operator.gt, 'B')
+
+    def sum(self) -> Any:
+        """ Sum of all items
+            Usage: total = array.sum()
+            @:return the sum of the items (0 for an empty Array)
+        """
+        view = self._ndarray()
+        if view is not None:
+            #Python adds floats in double precision, so 'f' items must not be summed in single precision
+            if view.dtype.kind == 'f':
+                return view.sum(dtype=numpy.float64).item()
+            #Integer sums wrap around modulo 2**64, which is only the true sum while it fits
+            if abs(view.sum(dtype=numpy.float64)) < 2.0 ** 62:
+                return view.sum().item()
+
+        return sum(self._live())
+
+    def min(self) -> Any:
+        """ Smallest item
+            Usage: smallest = array.min()
+            @:return the smallest item
+            @:raises ValueError if the Array is empty
+        """
+        if len(self) == 0:
+            raise ValueError('min of an empty Array')
+
+        view = self._ordered_ndarray()
+        if view is not None:
+            return view.min().item()
+
+        return min(self._live())
+
+    def max(self) -> Any:
+        """ Largest item
+            Usage: largest = array.max()
+            @:return the largest item
+            @:raises ValueError if the Array is empty
+        """
+        if len(self) == 0:
+            raise ValueError('max of an empty Array')
+
+        view = self._ordered_ndarray()
+        if view is not None:
+            return view.max().item()
+
+        return max(self._live())
+
+    def argmin(self) -> int:
+        """ Index of the smallest item
+            Usage: index = array.argmin()
+            @:return the index of the first occurrence of the smallest item
+            @:raises ValueError if the Array is empty
+        """
+        self.compact()
+        if len(self) == 0:
+            raise ValueError('argmin of an empty Array')
+
+        view = self._ordered_ndarray()
+        if view is not None:
+            return int(view.argmin())
+
+        return min(range(self._length), key=self._items.__getitem__)
+
+    def fill(self, value: Any) -> None:
+        """ Set every slot to the same value
+            Usage: array.fill(0)
+            @:param value the value to store in every slot
+            @:return none
+        """
+        self.compact()
+        if self._typecode is not None:
+            #Convert once up front, so a value that does not fit fails the same way with or without numpy
+            filler = array(self._typecode, [value])
+            value = filler[0]
+        if self._index is not None:
+            #Fail on an unhashable value before the index is changed
+            hash(value)
+
+        self._own()
+        self._invalidate_ranges()
+        if self._index is not None:
+            self._index = {value: set(range(self._length))} if self._length else {}
+
+        view = self._ndarray()
+        if view is not None:
+            view[:] = value
+        elif self._typecode is None:
+            self._items[:self._length] = [value] * self._length
+        else:
+            self._items[:self._length] = filler * self._length
+
+    def mask(self, mask: 'Array') -> 'Array':
+        """ Boolean masking
+            Usage: selected = array.mask(array.greater(5))
+            @:param mask an Array of the same length whose truthy slots select items
+            @:return a new Array holding the selected items in order
+            @:raises ValueError if mask is a different length
+        """
+        if len(mask) != len(self):
+            raise ValueError(f'Array lengths {len(self)} and {len(mask)} do not match')
+
+        view = self._ndarray()
+        mask_view = mask._ndarray()
+        if view is not None and mask_view is not None:
+            return Array._from_ndarray(view[mask_view.astype(bool)], self._typecode)
+
+        return Array._from_values([a for a, m in zip(self._live(), mask._live()) if m], self._typecode)
+
+    def where(self, mask: 'Array', other: Any) -> 'Array':
+        """ Choose items from self where mask is truthy and from other elsewhere
+            Usage: clipped = array.where(array.less(10), 10)
+            @:param mask an Array of the same length
+            @:param other a scalar or an Array of the same length supplying the remaining items
+            @:return a new Array holding the chosen items
+            @:raises ValueError if mask or other is a different length
+        """
+        if len(mask) != len(self):
+            raise ValueError(f'Array lengths {len(self)} and {len(mask)} do not match')
+
+        if isinstance(other, Array):
+            if len(other) != len(self):
+                raise ValueError(f'Array lengths {len(self)} and {len(other)} do not match')
+            other_view = other._ndarray()
+            others = other._live()
+        else:
+            other_view = other
+            others = [other] * self._length
+
+        view = self._ndarray()
+        mask_view = mask._ndarray()
+        if view is not None and mask_view is not None and other_view is not None:
+            result = Array._numpy_result(numpy.where, (mask_view.astype(bool), view, other_view),
+                                         self._typecode)
+            if result is not None:
+                return result
+
+        return Array._from_values([a if m else b for a, m, b in zip(self._live(), mask._live(), others)],
+                                  self._typecode)
+
+    def _write_live(self, values: Any) -> None:
+        """ This is a private helper function that stores reordered values over the items in one slice
+            assignment and rebuilds the index, as every position may have changed.
+        """
+        if self._typecode is not None and not isinstance(values, array):
+            values = array(self._typecode, values)
+
+        self._items[:self._length] = values
+        self._invalidate_ranges()
+        if self._index is not None:
+            self._build_index()
+
+    def _counting_sort(self, reverse: bool) -> array:
+        """ This is a private helper function that sorts narrow typed integers by counting each distinct
+            value once and writing out the runs, which is O(n) as there are at most 65536 of them.
+        """
+        counts = Counter(islice(self._items, self._length))
+        values = array(self._typecode)
+        for value in sorted(counts, reverse=reverse):
+            values.extend(array(self._typecode, (value,)) * counts[value])
+
+        return values
+
+    def sort(self, key=None, reverse: bool = False) -> None:
+        """ Sort the items in place on the backing storage. Large typed arrays of integers up to 16 bits
+            wide are sorted in O(n) by counting, other items with the built in stable sort.
+            Usage: 1. array.sort()
+                   2. array.sort(key=len, reverse=True)
+            @:param key optional function of one item whose result is compared instead of the item
+            @:param reverse use True to sort in descending order
+            @:return none
+            @:raises TypeError if the items or their keys cannot be compared
+        """
+        self.compact()
+        self._own()
+        view = self._ndarray()
+        if view is not None and key is None:
+            #numpy's stable sort is itself a radix sort for narrow integers
+            view.sort(kind='stable')
+            if reverse:
+                view[:] = view[::-1].copy()
+            self._invalidate_ranges()
+            if self._index is not None:
+                self._build_index()
+            return
+
+        #Counting only pays off once there are several items per possible value
+        if (key is None and self._typecode in Array._COUNTING_TYPECODES
+                and self._length >= 4 << 8 * self._items.itemsize):
+            self._write_live(self._counting_sort(reverse))
+        else:
+            self._write_live(sorted(islice(self._items, self._length), key=key, reverse=reverse))
+
+    @staticmethod
+    def _select(values: list, n: int, reverse: bool) -> list:
+        """ This is a private helper function that reorders values so the item at n is the one a full
+            sort would put there, with no item before it ordered after it and none after it ordered
+            before it. Each round partitions around a random pivot and keeps only the side holding n,
+            so it is O(n) on average.
+        """
+        before, after = [], []
+        while True:
+            pivot = random.choice(values)
+            if reverse:
+                lows = [value for value in values if value > pivot]
+                highs = [value for value in values if value < pivot]
+            else:
+                lows = [value for value in values if value < pivot]
+                highs = [value for value in values if value > pivot]
+            #Items comparing neither way, such as NaN, stay next to the pivot rather than being lost
+            equal = [value for value in values if not (value < pivot or value > pivot)]
+
+            if n < len(lows):
+                after = equal + highs + after
+                values = lows
+            elif n < len(lows) + len(equal):
+                return before + lows + equal + highs + after
+            else:
+                before += lows + equal
+                n -= len(lows) + len(equal)
+                values = highs
+
+    def _selected(self, n: int, key, reverse: bool) -> list:
+        """ This is a private helper function that returns the items reordered by _select. With a key
+            the keys are computed once and paired with the item positions, which also breaks ties.
+        """
+        values = list(islice(self._items, self._length))
+        if key is None:
+            return Array._select(values, n, reverse)
+
+        decorated = Array._select([(k, i) for i, k in enumerate(map(key, values))], n, reverse)
+        return [values[i] for _, i in decorated]
+
+    def nth_element(self, n: int, key=None, reverse: bool = False) -> None:
+        """ Partially reorder the items in place so the item at n is the one sort would put there, every
+            item before it sorts no later and every item after it sorts no earlier. O(n) on average.
+            Usage: array.nth_element(len(array) // 2)
+            @:param n the index to settle
+            @:param key optional function of one item whose result is compared instead of the item
+            @:param reverse use True to order descending, so the items before n are the largest
+            @:return none
+            @:raises IndexError if n is out of bounds
+            @:raises TypeError if the items or their keys cannot be compared
+        """
+        self.compact()
+        n = self._check_index(n)
+        self._own()
+        self._write_live(self._selected(n, key, reverse))
+
+    def partial_sort(self, k: int, key=None, reverse: bool = False) -> None:
+        """ Sort only the first k items in place, for top-k queries. The k items that sort first are
+            selected in O(n) on average and only they are sorted; the rest follow in no particular order.
+            Usage: array.partial_sort(10, reverse=True)
+            @:param k the number of leading items to sort
+            @:param key optional function of one item whose result is compared instead of the item
+            @:param reverse use True to sort descending, so the first k are the largest
+            @:return none
+            @:raises ValueError if k is negative or greater than the length
+            @:raises TypeError if the items or their keys cannot be compared
+        """
+        self.compact()
+        if not 0 <= k <= self._length:
+            raise ValueError(f'Cannot partially sort {k} items of an Array of {self._length}')
+
+        self._own()
+        if 0 < k < self._length:
+            values = self._selected(k - 1, key, reverse)
+        else:
+            values = list(islice(self._items, self._length))
+
+        values[:k] = sorted(values[:k], key=key, reverse=reverse)
+        self._write_live(values)
+
+    def _chunk_bounds(self, chunks: int) -> list:
+        """ This is a private helper function that splits the indices into at most chunks contiguous
+            (start, stop) ranges of nearly equal size.
+        """
+        size = -(-self._length // chunks)
+        return [(start, min(start + size, self._length)) for start in range(0, self._length, size)]
+
+    def _to_shared_memory(self) -> shared_memory.SharedMemory:
+        """ This is a private helper function that copies typed storage into a new shared memory block.
+            The caller must close and unlink the block.
+        """
+        nbytes = self._length * array(self._typecode).itemsize
+        block = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+        with memoryview(self._items) as buffer, buffer.cast('B') as raw:
+            block.buf[:nbytes] = raw[:nbytes]
+
+        return block
+
+    def parallel_map(self, fn, workers: int = None, in_place: bool = False) -> 'Array':
+        """ Apply a function to every item using a pool of worker processes. Typed storage is placed in
+            shared memory once and each worker maps its own chunk there, so items are never pickled.
+            Object storage is pickled to the workers chunk by chunk.
+            Usage: doubled = array.parallel_map(double, workers=8)
+            @:param fn a picklable (module level) function of one item; for typed Arrays its results
+                     must fit the typecode
+            @:param workers the number of processes (use None for one per CPU)
+            @:param in_place use True to store the results in this Array instead of a new one
+            @:return a new Array of the results, or this Array if in_place is True
+            @:raises TypeError if a result does not fit the typecode of a typed Array
+        """
+        self.compact()
+        workers = workers or os.cpu_count()
+        #Several chunks per worker keep the pool busy when some chunks are slower than others
+        bounds = self._chunk_bounds(workers * 4) if self._length else []
+
+        if self._typecode is None:
+            with Pool(workers) as pool:
+                parts = pool.map(_map_chunk, [(fn, self._items[start:stop]) for start, stop in bounds])
+            results = [item for part in parts for item in part]
+        else:
+            block = self._to_shared_memory()
+            try:
+                with Pool(workers) as pool:
+                    pool.map(_map_shared_chunk, [(fn, block.name, self._typecode, start, stop)
+                                                 for start, stop in bounds])
+                results = array(self._typecode)
+                results.frombytes(block.buf[:self._length * results.itemsize])
+            finally:
+                block.close()
+                block.unlink()
+
+        if in_place:
+            self._assign_range(range(self._length), results)
+            return self
+
+        return Array._from_storage(results, self._typecode)
+
+    def parallel_reduce(self, fn, init: Any, workers: int = None) -> Any:
+        """ Reduce the items with a pool of worker processes. Each worker reduces its own chunk starting
+            from init, then the chunk results are reduced in order, so fn must be associative and init
+            must be its identity (e.g. operator.add with 0). Typed storage is shared as for parallel_map.
+            Usage: total = array.parallel_reduce(operator.add, 0, workers=8)
+            @:param fn a picklable (module level) function of two arguments
+            @:param init the identity value of fn
+            @:param workers the number of processes (use None for one per CPU)
+            @:return the reduced value (init for an empty Array)
+        """
+        self.compact()
+        workers = workers or os.cpu_count()
+        bounds = self._chunk_bounds(workers) if self._length else []
+
+        if self._typecode is None:
+            with Pool(workers) as pool:
+                parts = pool.map(_reduce_chunk, [(fn, init, self._items[start:stop])
+                                                 for start, stop in bounds])
+        else:
+            block = self._to_shared_memory()
+            try:
+                with Pool(workers) as pool:
+                    parts = pool.map(_reduce_shared_chunk, [(fn, init, block.name, self._typecode, start, stop)
+                                                            for start, stop in bounds])
+            finally:
+                block.close()
+                block.unlink()
+
+        return reduce(fn, parts, init)
 
     def __eq__(self, other: 'Array') -> bool:
         """ Equality operator ==
@@ -96,17 +1276,21 @@ class Array:
             @:param other the instance to compare self to
             @:return true if the arrays are equal (deep check)
         """
+        self.compact()
         if type(other) != type(self):
             return False
 
         if len(self) != len(other):
             return False
 
-        for i in range(len(self)):
-            if self[i] != other[i]:
-                return False
+        other.compact()
+        #Both backing stores hold numbers, so compare the live part of the buffers in one call. memoryview
+        #cannot compare the character typecodes, which are compared item by item below
+        if self._typecode in Array._NUMPY_TYPECODES and other._typecode in Array._NUMPY_TYPECODES:
+            with memoryview(self._items) as mine, memoryview(other._items) as theirs:
+                return mine[:self._length] == theirs[:other._length]
 
-        return True
+        return all(map(operator.eq, self._live(), other._live()))
     
     def __ne__(self, other: 'Array') -> bool:
         """ Non-equality operator !=
@@ -121,8 +1305,7 @@ class Array:
             Usage: for item in array:
             @:return yields the item at index
         """
-        for item in self._items:
-            yield item
+        yield from self._live()
 
     def __delitem__(self, index: int) -> None:
         """ Delete an item in the array. Copies the array contents from index + 1 down
@@ -132,10 +1315,104 @@ class Array:
             @:raises IndexError if the index is out of bounds
             @:return none
         """
-        if index >= len(self):
-            raise IndexError(f'Array index {index} is out of range')
+        position = self._check_index(index)
+        self._own()
+        self._invalidate_ranges()
+        if self._lazy_delete:
+            insort(self._tombstones, position)
+            self._clear_range(position, position + 1)
+            if len(self._tombstones) >= self._length * self._compact_ratio:
+                self.compact()
+            return
+
+        if self._index is not None:
+            #Every later item moves down one position
+            self._index_discard(position, self._items[position])
+            for later in range(position + 1, self._length):
+                item = self._items[later]
+                self._index_discard(later, item)
+                self._index_add(later - 1, item)
+
+        if self._file is None:
+            del self._items[position]
+        else:
+            #Shift the later items down within the mapping, then drop the last slot from the file
+            self._items[position:self._length - 1] = self._items[position + 1:self._length]
+            self._remap(self._length - 1)
+
+        self._length -= 1
+        self._shrink_if_sparse()
+
+    def _find(self, item: Any) -> int:
+        """ This is a private helper function that returns the first position of item, or -1.
+        """
+        self.compact()
+        if self._index is not None:
+            try:
+                positions = self._index.get(item)
+            except TypeError:
+                #Unhashable items can never have been stored in an indexed Array
+                return -1
+            return min(positions) if positions else -1
+
+        #A memoryview over a mapped file has no index method
+        if self._file is not None:
+            return next((position for position, candidate in enumerate(self._items[:self._length])
+                         if candidate == item), -1)
 
-        del self._items[index]
+        try:
+            return self._items.index(item, 0, self._length)
+        except ValueError:
+            return -1
+
+    def _remove_positions(self, positions: list) -> None:
+        """ This is a private helper function that removes the slots at the sorted storage positions in
+            one pass, copying each run of kept items once.
+        """
+        self._invalidate_ranges()
+        kept = Array._allocate(0, self._typecode)
+        start = 0
+        for position in positions:
+            kept.extend(self._items[start:position])
+            start = position + 1
+        kept.extend(self._items[start:self._length])
+
+        if self._file is None:
+            self._items[:self._length] = kept
+        else:
+            self._items[:len(kept)] = kept
+            self._remap(len(kept))
+
+        self._length = len(kept)
+        if self._index is not None:
+            self._build_index()
+        self._shrink_if_sparse()
+
+    def compact(self) -> None:
+        """ Remove the tombstones left by lazy deletion in one pass. Does nothing if there are none.
+            Usage: array.compact()
+            @:return none
+        """
+        if not self._tombstones:
+            return
+
+        self._own()
+        positions = self._tombstones
+        self._tombstones = []
+        self._remove_positions(positions)
+
+    def delete_many(self, indices: Iterable) -> None:
+        """ Delete several items in one pass over the Array
+            Usage: array.delete_many([0, 5, 9])
+            @:param indices the indices to delete, all counted before any item is deleted
+            @:return none
+            @:raises IndexError if any index is out of bounds, in which case nothing is deleted
+        """
+        self.compact()
+        positions = sorted({self._check_index(index) for index in indices})
+        if positions:
+            self._own()
+            self._remove_positions(positions)
 
     def __contains__(self, item: Any) -> bool:
         """ Contains operator (in)
@@ -143,11 +1420,266 @@ class Array:
             @:param item the desired item to check whether it's in the array
             @:return true if the array contains the item
         """
-        return item in self._items
+        if self._index is not None:
+            try:
+                return item in self._index
+            except TypeError:
+                #Unhashable items can never have been stored in an indexed Array
+                return False
+
+        return self._find(item) != -1
+
+    def index_of(self, item: Any) -> int:
+        """ Find the index of the first occurrence of an item
+            Usage: index = array.index_of(5)
+            @:param item the item to search for
+            @:return the index of the first occurrence of item
+            @:raises KeyError if item is not found
+        """
+        position = self._find(item)
+        if position == -1:
+            raise KeyError(f'Item {item} not found in the array.')
+
+        return position
+
+    def count(self, item: Any) -> int:
+        """ Count the occurrences of an item
+            Usage: occurrences = array.count(5)
+            @:param item the item to count
+            @:return the number of items equal to item
+        """
+        if self._index is not None:
+            try:
+                return len(self._index.get(item, ()))
+            except TypeError:
+                return 0
+
+        return operator.countOf(self._live(), item)
+
+    @property
+    def indexed(self) -> bool:
+        """ Check whether the Array keeps a position index
+            Usage: indexed = array.indexed
+            @:return true if the Array was created with indexed=True
+        """
+        return self._index is not None
+
+    def index_stats(self) -> dict:
+        """ Report the size and approximate memory overhead of the position index
+            Usage: stats = array.index_stats()
+            @:return a dict with the number of distinct items, the number of indexed positions and
+                     the approximate bytes used by the index (items boxed only for the index are
+                     counted for typed Arrays)
+            @:raises ValueError if the Array is not indexed
+        """
+        if self._index is None:
+            raise ValueError('Array is not indexed')
+
+        size = sys.getsizeof(self._index)
+        positions = 0
+        for item, item_positions in self._index.items():
+            positions += len(item_positions)
+            size += sys.getsizeof(item_positions) + sum(map(sys.getsizeof, item_positions))
+            if self._typecode is not None:
+                size += sys.getsizeof(item)
+
+        return {'distinct': len(self._index), 'positions': positions, 'bytes': size}
 
     def __str__(self) -> str:
-        """ Return a string representation of the data and structure
+        """ Return a string representation of the data and structure. Only the first _STR_LIMIT items
+            are shown, followed by a count of the rest.
             Usage: print(array):
             @:return str the string representation of the data and structure
         """
-        return '[' + ', '.join([str(i) for i in self._items]) + ']'
+        shown = ', '.join([str(i) for i in islice(self._live(), Array._STR_LIMIT)])
+        hidden = len(self) - Array._STR_LIMIT
+        if hidden > 0:
+            return '[' + shown + f', ... {hidden} more]'
+
+        return '[' + shown + ']'
+
+    def iter_chunks(self, chunk_size: int = 65536) -> Any:
+        """ Iterate the items in contiguous chunks without copying typed storage. Typed chunks are
+            read-only memoryview slices of the buffer, which must be released (or the iteration finished)
+            before the Array is resized; object chunks are list slices.
+            Usage: for chunk in array.iter_chunks(4096):
+            @:param chunk_size the number of items per chunk (the last chunk may be shorter)
+            @:return yields read-only memoryview slices for typed storage, or lists for object storage
+            @:raises ValueError if chunk_size is less than 1
+        """
+        if chunk_size < 1:
+            raise ValueError('Chunk size must be at least 1')
+
+        self.compact()
+        if self._typecode is None:
+            for start in range(0, self._length, chunk_size):
+                yield self._items[start:min(start + chunk_size, self._length)]
+            return
+
+        with memoryview(self._items) as buffer:
+            for start in range(0, self._length, chunk_size):
+                #Read-only, as writing through the slice would bypass copy-on-write and the index
+                yield buffer[start:min(start + chunk_size, self._length)].toreadonly()
+
+    def write_into(self, fileobj, chunk_size: int = 65536) -> None:
+        """ Write the items to a file, socket file or compression stream a chunk at a time. Typed items
+            are written as their raw buffer; object items are passed to writelines, so they must be str
+            or bytes to suit the stream.
+            Usage: 1. array.write_into(open('data.bin', 'wb'))
+                   2. lines.write_into(sys.stdout)
+            @:param fileobj a stream with write and writelines methods
+            @:param chunk_size the number of items per write
+            @:return none
+            @:raises ValueError if chunk_size is less than 1
+        """
+        if self._typecode is None:
+            for chunk in self.iter_chunks(chunk_size):
+                fileobj.writelines(chunk)
+        else:
+            for chunk in self.iter_chunks(chunk_size):
+                fileobj.write(chunk)
+
+    def write_to(self, stream, chunk_size: int = 1024) -> None:
+        """ Write the full string representation to a text stream, rendering chunk_size items at a time
+            so the whole string is never built in memory
+            Usage: array.write_to(sys.stdout)
+            @:param stream a text stream with a write method
+            @:param chunk_size the number of items rendered per write
+            @:return none
+            @:raises ValueError if chunk_size is less than 1
+        """
+        if chunk_size < 1:
+            raise ValueError('Chunk size must be at least 1')
+
+        items = self._live()
+        separator = ''
+        stream.write('[')
+        while True:
+            chunk = [str(i) for i in islice(items, chunk_size)]
+            if not chunk:
+                break
+            stream.write(separator + ', '.join(chunk))
+            separator = ', '
+        stream.write(']')
+
+
+class ArrayView:
+    """ Class ArrayView - representing a range of slots of an Array without copying them
+            Created by slicing an Array (view = array[start:stop:step]). Reads and writes go
+            straight to the parent Array's storage. Resizing the parent invalidates its views.
+    """
+
+    def __init__(self, array: Array, indices: range) -> None:
+        """ Constructor
+            Usage:  view = ArrayView(array, range(2, 10, 2))
+            @:param array the parent Array whose storage is shared
+            @:param indices the parent indices covered by the view, in view order
+            @:return none
+        """
+        self._array = array
+        self._indices = indices
+
+    def __getitem__(self, index: int) -> Any:
+        """ Bracket operator for getting an item
+            Usage: 1. val = view[0]
+                   2. sub_view = view[1:3]
+            @:param index the desired index within the view, or a slice to get a narrower view
+            @:return the item at the index, or an ArrayView over the sliced range
+            @:raises IndexError if the index is out of bounds
+        """
+        if isinstance(index, slice):
+            return ArrayView(self._array, self._indices[index])
+
+        if index >= len(self):
+            raise IndexError(f'ArrayView index {index} is out of range')
+
+        return self._array[self._indices[index]]
+
+    def __setitem__(self, index: int, item: Any) -> None:
+        """ Bracket operator for setting an item in the parent Array
+            Usage: 1. view[0] = val
+                   2. view[:] = [1, 2, 3]
+            @:param index the desired index within the view, or a slice of the view
+            @:param item the item to set, or an iterable with one item per sliced slot
+            @:raises IndexError if the index is out of bounds
+            @:raises ValueError if a slice is assigned a different number of items than it covers
+            @:return none
+        """
+        if isinstance(index, slice):
+            self._array._assign_range(self._indices[index], item)
+            return
+
+        if index >= len(self):
+            raise IndexError(f'ArrayView index {index} is out of range')
+
+        self._array[self._indices[index]] = item
+
+    def __len__(self) -> int:
+        """ len operator for getting length of the view
+            Usage: length = len(view)
+            @:return the number of slots covered by the view
+        """
+        return len(self._indices)
+
+    def __iter__(self) -> Any:
+        """ Iterator operator
+            Usage: for item in view:
+            @:return yields the items covered by the view, in view order
+        """
+        self._array.compact()
+        yield from map(self._array._items.__getitem__, self._indices)
+
+    def __contains__(self, item: Any) -> bool:
+        """ Contains operator (in)
+            Usage: if 3 in view:
+            @:param item the desired item to check whether it's in the view
+            @:return true if the view covers the item
+        """
+        return any(candidate == item for candidate in self)
+
+    def __str__(self) -> str:
+        """ Return a string representation of the data and structure
+            Usage: print(view):
+            @:return str the string representation of the data and structure
+        """
+        return '[' + ', '.join([str(i) for i in self]) + ']'
+
+
+def _map_chunk(task: tuple) -> list:
+    """ This is a private helper function run by Array.parallel_map workers on a pickled chunk.
+    """
+    fn, items = task
+    return [fn(item) for item in items]
+
+
+def _map_shared_chunk(task: tuple) -> None:
+    """ This is a private helper function run by Array.parallel_map workers. It maps the chunk from start
+        up to stop of a typed shared memory block in place.
+    """
+    fn, name, typecode, start, stop = task
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        with block.buf.cast(typecode) as items:
+            items[start:stop] = array(typecode, map(fn, items[start:stop]))
+    finally:
+        block.close()
+
+
+def _reduce_chunk(task: tuple) -> Any:
+    """ This is a private helper function run by Array.parallel_reduce workers on a pickled chunk.
+    """
+    fn, init, items = task
+    return reduce(fn, items, init)
+
+
+def _reduce_shared_chunk(task: tuple) -> Any:
+    """ This is a private helper function run by Array.parallel_reduce workers. It reduces the chunk from
+        start up to stop of a typed shared memory block.
+    """
+    fn, init, name, typecode, start, stop = task
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        with block.buf.cast(typecode) as items, items[start:stop] as chunk:
+            return reduce(fn, chunk, init)
+    finally:
+        block.close()
@@ -0,0 +1,194 @@
+from typing import Any
+from collections import deque
+from collections.abc import Iterable
+import asyncio
+
+from array_stack import ArrayStack
+
+
+class AsyncArrayStack(ArrayStack):
+    """ Class AsyncArrayStack - representing a bounded stack for coroutines using a 1D Array
+                Stipulations:
+                1. await push suspends while the stack is full and await pop while it is empty, so
+                   coroutines never poll full or empty
+                2. Must adhere to the docstring requirements per method, including raising
+                   raising appropriate exceptions where indicated.
+                3. Waiters are woken in the order they started waiting, and a cancelled waiter passes
+                   on any wake up it was given, so no item or slot is stranded.
+    """
+
+    def __init__(self, max_size: int = 0, typecode: str = None, growable: bool = False,
+                 low_water: float = 0.25) -> None:
+        """ Constructor
+            Usage:  1. stack = AsyncArrayStack(10)
+                    2. stack = AsyncArrayStack(16, growable=True)
+            @:param max_size the desired max size of the stack, or the starting capacity when growable
+            @:param typecode optional array module typecode for compact, typed storage of the items
+            @:param growable use True to grow instead of suspending pushes (see ArrayStack)
+            @:param low_water a growable stack halves its capacity below this fraction in use
+            @:return none
+            @:raises ValueError if low_water is not in [0, 0.5)
+        """
+        super().__init__(max_size, typecode, growable, low_water)
+        #Futures of the coroutines waiting to pop and to push, oldest first
+        self._getters = deque()
+        self._putters = deque()
+        #Items pushed but not yet marked done with task_done, which join waits for
+        self._unfinished = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+
+    @staticmethod
+    def clone(array_stack_instance: 'AsyncArrayStack') -> 'AsyncArrayStack':
+        """ Clone the stack. The copied items count as pushed but not yet done, for join
+                Usage:  stack = AsyncArrayStack.clone(instance)
+                @:param instance an AsyncArrayStack instance to deep copy data from.
+                @:return a deep object copy of the stack, with no waiters of its own
+                @:raises TypeError if instance is not an AsyncArrayStack instance
+        """
+        if not isinstance(array_stack_instance, AsyncArrayStack):
+            raise TypeError('Instance is not an AsyncArrayStack')
+
+        stack = ArrayStack.clone(array_stack_instance)
+        if stack._size:
+            stack._unfinished = stack._size
+            stack._finished.clear()
+
+        return stack
+
+    @staticmethod
+    def _wakeup_next(waiters: deque) -> None:
+        """ This is a private helper function that wakes the oldest waiter that is still waiting.
+        """
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    @staticmethod
+    async def _wait(waiters: deque, blocked) -> None:
+        """ This is a private helper function that suspends until blocked() is false, queuing behind the
+            earlier waiters. If cancelled after being woken, the wake up is passed on to the next waiter.
+        """
+        while blocked():
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                if not blocked() and not waiter.cancelled():
+                    AsyncArrayStack._wakeup_next(waiters)
+                raise
+
+    async def push(self, item: Any) -> None:
+        """ Push an item onto the stack, suspending while it is full
+                Usage:   await stack.push(item)
+                @:param item to push
+                @:return none
+        """
+        await AsyncArrayStack._wait(self._putters, lambda: self.full)
+        self.push_nowait(item)
+
+    async def pop(self) -> Any:
+        """ Pop an item from the stack and return the item, suspending while it is empty
+                Usage:   item = await stack.pop()
+                @:return item that is popped
+        """
+        await AsyncArrayStack._wait(self._getters, lambda: self.empty)
+        return self.pop_nowait()
+
+    def _pushed(self, n: int) -> None:
+        """ This is a private helper function that records n pushed items and wakes up to n poppers.
+        """
+        self._unfinished += n
+        self._finished.clear()
+        for _ in range(min(n, len(self._getters))):
+            AsyncArrayStack._wakeup_next(self._getters)
+
+    def _popped(self, n: int) -> None:
+        """ This is a private helper function that wakes up to n pushers after n slots were freed.
+        """
+        for _ in range(min(n, len(self._putters))):
+            AsyncArrayStack._wakeup_next(self._putters)
+
+    def push_nowait(self, item: Any) -> None:
+        """ Push an item onto the stack without suspending
+                Usage:   stack.push_nowait(item)
+                @:param item to push
+                @:return none
+                @:raises IndexError if the stack is full
+        """
+        super().push(item)
+        self._pushed(1)
+
+    def pop_nowait(self) -> Any:
+        """ Pop an item from the stack without suspending
+                Usage:   item = stack.pop_nowait()
+                @:return item that is popped
+                @:raises IndexError if the stack is empty
+        """
+        item = super().pop()
+        self._popped(1)
+        return item
+
+    def push_many(self, items: Iterable) -> None:
+        """ Push several items without suspending, the last one ending up on top (see ArrayStack)
+                Usage:   stack.push_many(items)
+                @:param items an iterable of items to push in order
+                @:return none
+                @:raises IndexError if they do not all fit, in which case none are pushed
+        """
+        items = list(items)
+        super().push_many(items)
+        self._pushed(len(items))
+
+    def pop_many(self, n: int) -> list:
+        """ Pop several items without suspending (see ArrayStack)
+                Usage:   items = stack.pop_many(100)
+                @:param n the number of items to pop
+                @:return a list of the popped items, top first
+                @:raises IndexError if n is negative or more than the number of items on the stack
+        """
+        items = super().pop_many(n)
+        self._popped(n)
+        return items
+
+    def clear(self, shrink: bool = False) -> None:
+        """ Clear the stack, counting the discarded items as done and waking the waiting pushers
+                Usage: stack.clear():
+                @:param shrink use True to also return a growable stack to the capacity it started with
+                @:return none
+        """
+        discarded = self._size
+        super().clear(shrink)
+        if discarded:
+            self.task_done(discarded)
+            self._popped(discarded)
+
+    def task_done(self, n: int = 1) -> None:
+        """ Mark popped items as fully processed, for join
+                Usage:   stack.task_done()
+                @:param n the number of items to mark done
+                @:return none
+                @:raises ValueError if more items are marked done than were pushed
+        """
+        if n > self._unfinished:
+            raise ValueError('task_done() called more times than there were items pushed')
+
+        self._unfinished -= n
+        if self._unfinished == 0:
+            self._finished.set()
+
+    async def join(self) -> None:
+        """ Wait until every pushed item has been popped and marked done with task_done
+                Usage:   await stack.join()
+                @:return none
+        """
+        if self._unfinished:
+            await self._finished.wait()
@@ -0,0 +1,238 @@
+from typing import Any
+from collections.abc import Iterable
+import threading
+
+from array_stack import ArrayStack
+
+
+class ConcurrentArrayStack(ArrayStack):
+    """ Class ConcurrentArrayStack - representing a thread-safe stack using a 1D Array
+                Stipulations:
+                1. Must guard every change to the stack with one lock, so concurrent pushes and pops
+                   never lose updates
+                2. Must adhere to the docstring requirements per method, including raising
+                   raising appropriate exceptions where indicated.
+                3. push blocks while the stack is full and pop blocks while it is empty, each up to an
+                   optional timeout; batch operations take the lock once per batch.
+    """
+
+    def __init__(self, max_size: int = 0, typecode: str = None, growable: bool = False,
+                 low_water: float = 0.25) -> None:
+        """ Constructor
+            Usage:  1. stack = ConcurrentArrayStack(10)
+                    2. stack = ConcurrentArrayStack(16, growable=True)
+            @:param max_size the desired max size of the stack, or the starting capacity when growable
+            @:param typecode optional array module typecode for compact, typed storage of the items
+            @:param growable use True to grow instead of blocking pushes (see ArrayStack)
+            @:param low_water a growable stack halves its capacity below this fraction in use
+            @:return none
+            @:raises ValueError if low_water is not in [0, 0.5)
+        """
+        super().__init__(max_size, typecode, growable, low_water)
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+        self._not_empty = threading.Condition(self._lock)
+        #Threads waiting for room for, or for, more than one item. While there are any, a single wake up
+        #could go to a waiter that still cannot proceed, so every waiter is woken instead
+        self._batch_pushers = 0
+        self._batch_poppers = 0
+
+    @staticmethod
+    def clone(array_stack_instance: 'ConcurrentArrayStack') -> 'ConcurrentArrayStack':
+        """ Clone the stack from a snapshot taken under its lock
+                Usage:  stack = ConcurrentArrayStack.clone(instance)
+                @:param instance a ConcurrentArrayStack instance to deep copy data from.
+                @:return a deep object copy of the stack, with a lock of its own
+                @:raises TypeError if instance is not a ConcurrentArrayStack instance
+        """
+        if not isinstance(array_stack_instance, ConcurrentArrayStack):
+            raise TypeError('Instance is not a ConcurrentArrayStack')
+
+        with array_stack_instance._lock:
+            stack = ArrayStack.clone(array_stack_instance)
+            #Take a copy of the storage now, as the two stacks will change it under different locks
+            stack._stack._own()
+
+        return stack
+
+    def _has_room(self, n: int) -> bool:
+        """ This is a private helper function, called with the lock held, that checks whether n more
+            items fit.
+        """
+        return self._growable or self._size + n <= len(self._stack)
+
+    def _wake_pushers(self, n: int) -> None:
+        """ This is a private helper function, called with the lock held, that wakes threads waiting
+            for the n slots just freed.
+        """
+        if self._batch_pushers:
+            self._not_full.notify_all()
+        else:
+            self._not_full.notify(n)
+
+    def _wake_poppers(self, n: int) -> None:
+        """ This is a private helper function, called with the lock held, that wakes threads waiting
+            for the n items just pushed.
+        """
+        if self._batch_poppers:
+            self._not_empty.notify_all()
+        else:
+            self._not_empty.notify(n)
+
+    def push(self, item: Any, timeout: float = None) -> None:
+        """ Push an item onto the stack, waiting while it is full
+                Usage:   1. stack.push(item)
+                         2. stack.push(item, timeout=0.5)
+                @:param item to push
+                @:param timeout the most seconds to wait for room (use None to wait indefinitely)
+                @:return none
+                @:raises IndexError if the stack is still full when the timeout expires
+        """
+        with self._lock:
+            if not self._not_full.wait_for(lambda: self._has_room(1), timeout):
+                raise IndexError('Stack is full')
+            super().push(item)
+            self._wake_poppers(1)
+
+    def pop(self, timeout: float = None) -> Any:
+        """ Pop an item from the stack and return the item, waiting while it is empty
+                Usage:   1. item = stack.pop()
+                         2. item = stack.pop(timeout=0.5)
+                @:param timeout the most seconds to wait for an item (use None to wait indefinitely)
+                @:return item that is popped
+                @:raises IndexError if the stack is still empty when the timeout expires
+        """
+        with self._lock:
+            if not self._not_empty.wait_for(lambda: self._size > 0, timeout):
+                raise IndexError('Stack is empty')
+            item = super().pop()
+            self._wake_pushers(1)
+            return item
+
+    def try_push(self, item: Any) -> bool:
+        """ Push an item onto the stack only if there is room, without waiting
+                Usage:   pushed = stack.try_push(item)
+                @:param item to push
+                @:return true if the item was pushed, false if the stack was full
+        """
+        with self._lock:
+            if not self._has_room(1):
+                return False
+            super().push(item)
+            self._wake_poppers(1)
+            return True
+
+    def try_pop(self, default: Any = None) -> Any:
+        """ Pop an item from the stack only if there is one, without waiting
+                Usage:   item = stack.try_pop()
+                @:param default the value to return if the stack is empty
+                @:return item that is popped, or default if the stack was empty
+        """
+        with self._lock:
+            if self._size == 0:
+                return default
+            item = super().pop()
+            self._wake_pushers(1)
+            return item
+
+    def push_many(self, items: Iterable, timeout: float = None) -> None:
+        """ Push several items under one acquisition of the lock, the last one ending up on top. Waits
+            until they all fit, so they are never interleaved with another thread's items.
+                Usage:   stack.push_many(tasks)
+                @:param items an iterable of items to push in order
+                @:param timeout the most seconds to wait for room (use None to wait indefinitely)
+                @:return none
+                @:raises IndexError if they can never fit, or still do not fit when the timeout expires
+        """
+        items = list(items)
+        with self._lock:
+            if not self._growable and len(items) > len(self._stack):
+                raise IndexError('Stack is full')
+            self._batch_pushers += 1
+            try:
+                if not self._not_full.wait_for(lambda: self._has_room(len(items)), timeout):
+                    raise IndexError('Stack is full')
+            finally:
+                self._batch_pushers -= 1
+            super().push_many(items)
+            self._wake_poppers(len(items))
+
+    def pop_many(self, n: int, timeout: float = None) -> list:
+        """ Pop several items under one acquisition of the lock, waiting until there are n
+                Usage:   items = stack.pop_many(100)
+                @:param n the number of items to pop
+                @:param timeout the most seconds to wait for the items (use None to wait indefinitely)
+                @:return a list of the popped items, top first
+                @:raises IndexError if n is negative or can never be met, or there are still too few
+                         items when the timeout expires
+        """
+        with self._lock:
+            if n < 0 or not self._growable and n > len(self._stack):
+                raise IndexError(f'Cannot take {n} items from a stack of {self._size}')
+            self._batch_poppers += 1
+            try:
+                if not self._not_empty.wait_for(lambda: self._size >= n, timeout):
+                    raise IndexError('Stack is empty')
+            finally:
+                self._batch_poppers -= 1
+            items = super().pop_many(n)
+            self._wake_pushers(n)
+            return items
+
+    def peek_n(self, n: int) -> list:
+        """ Get the top items without popping them
+                Usage:   items = stack.peek_n(3)
+                @:param n the number of items to get
+                @:return a list of the top n items, top first
+                @:raises IndexError if n is negative or more than the number of items on the stack
+        """
+        with self._lock:
+            return super().peek_n(n)
+
+    def clear(self, shrink: bool = False) -> None:
+        """ Clear the stack, releasing every item it held and waking every waiting pusher
+                Usage: stack.clear():
+                @:param shrink use True to also return a growable stack to the capacity it started with
+                @:return none
+        """
+        with self._lock:
+            super().clear(shrink)
+            self._not_full.notify_all()
+
+    @property
+    def top(self) -> Any:
+        """ Get the item at the top of the stack
+                Usage:   item = stack.top
+                @:return item that is at the top of the stack
+                @:raises IndexError if the stack is empty
+        """
+        with self._lock:
+            return super().top
+
+    def memory_report(self) -> dict:
+        """ Report how the slots of the backing Array are being used (see ArrayStack)
+                Usage: report = stack.memory_report()
+                @:return a dict with the 'capacity' and the 'live', 'retained' and 'free' slots
+        """
+        with self._lock:
+            return super().memory_report()
+
+    def __str__(self) -> str:
+        """ Return a string representation of the data and structure, taken under the lock
+                Usage: print(stack):
+                @:return str the string representation of the data and structure
+        """
+        with self._lock:
+            return super().__str__()
+
+    def write_to(self, stream, chunk_size: int = 1024) -> None:
+        """ Write the full string representation to a text stream in chunks, holding the lock
+            throughout so the output is one consistent snapshot (see ArrayStack)
+                Usage: stack.write_to(sys.stdout)
+                @:param stream a text stream with a write method
+                @:param chunk_size the number of items rendered per write
+                @:return none
+                @:raises ValueError if chunk_size is less than 1
+        """
+        with self._lock:
+            super().write_to(stream, chunk_size)
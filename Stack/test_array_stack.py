@@ -1,3 +1,4 @@
+import io
 import unittest
 
 from array_stack import ArrayStack
@@ -78,5 +79,146 @@ class ArrayStackTest(unittest.TestCase):
         for i in range(4, -1, -1):
             assert i == self._stack.pop()
 
+    def test_11_typed_stack_should_maintain_data_integrity(self):
+        stack = ArrayStack(5, typecode='d')
+        for i in range(5):
+            stack.push(i / 2)
+
+        assert stack.full
+        for i in range(4, -1, -1):
+            assert i / 2 == stack.pop()
+
+    def test_12_clone_should_copy_items_independently(self):
+        for i in range(3):
+            self._stack.push(i)
+
+        clone = ArrayStack.clone(self._stack)
+        clone.pop()
+        clone.push(10)
+
+        assert clone.max_size == 5
+        assert clone == ArrayStack.clone(clone)
+        assert self._stack.top == 2
+
+    def test_13_write_to_should_match_str_for_small_stacks(self):
+        self._stack.push('A')
+        stream = io.StringIO()
+        self._stack.write_to(stream, chunk_size=2)
+
+        assert stream.getvalue() == str(self._stack)
+
+    def test_14_growable_stack_should_double_instead_of_raising(self):
+        stack = ArrayStack(2, growable=True)
+        for i in range(9):
+            stack.push(i)
+
+        assert not stack.full
+        assert stack.capacity == 16
+        assert stack.growth_events == 3
+        assert stack.peak_depth == 9
+        assert [stack.pop() for _ in range(9)] == list(range(8, -1, -1))
+
+    def test_15_growable_stack_should_halve_below_low_water(self):
+        stack = ArrayStack(2, growable=True, low_water=0.25)
+        for i in range(32):
+            stack.push(i)
+        while len(stack) > 1:
+            stack.pop()
+
+        assert stack.capacity == 4
+        assert stack.shrink_events == 3
+        assert stack.top == 0
+
+        stack.pop()
+        assert stack.capacity == 2
+        assert stack.peak_depth == 32
+
+        with self.assertRaises(ValueError):
+            ArrayStack(4, growable=True, low_water=0.5)
+
+    def test_16_clone_should_keep_growable_settings(self):
+        stack = ArrayStack(1, growable=True)
+        stack.push(1)
+        stack.push(2)
+        clone = ArrayStack.clone(stack)
+        clone.push(3)
+
+        assert clone.growable and clone.growth_events == 2
+        assert clone.peak_depth == 3
+        assert stack.peak_depth == 2
+
+    def test_17_push_many_should_check_capacity_once(self):
+        self._stack.push(0)
+        self._stack.push_many(range(1, 5))
+        assert list(self._stack.peek_n(5)) == [4, 3, 2, 1, 0]
+
+        with self.assertRaises(IndexError):
+            self._stack.push_many([5])
+        assert len(self._stack) == 5
+
+        stack = ArrayStack(2, growable=True)
+        stack.push_many(range(11))
+        assert stack.capacity == 16 and stack.growth_events == 1
+        assert stack.peak_depth == 11
+
+    def test_18_pop_many_should_return_items_top_first(self):
+        stack = ArrayStack(6, typecode='i')
+        stack.push_many(range(6))
+
+        assert stack.pop_many(4) == [5, 4, 3, 2]
+        assert len(stack) == 2 and stack.top == 1
+        assert stack.pop_many(0) == []
+
+        with self.assertRaises(IndexError):
+            stack.pop_many(3)
+        with self.assertRaises(IndexError):
+            stack.peek_n(-1)
+
+    def test_19_pop_many_should_shrink_a_growable_stack_once(self):
+        stack = ArrayStack(2, growable=True)
+        stack.push_many(range(64))
+        stack.pop_many(63)
+
+        assert stack.capacity == 4
+        assert stack.shrink_events == 1
+        assert stack.top == 0
+
+    def test_20_pop_should_release_the_slot(self):
+        payload = object()
+        self._stack.push(payload)
+        self._stack.push(1)
+        self._stack.pop()
+        self._stack.pop()
+
+        assert payload not in list(self._stack._stack)
+        assert self._stack.memory_report() == {'capacity': 5, 'live': 0, 'retained': 0, 'free': 5}
+
+        self._stack.push_many(['A', 'B', 'C'])
+        self._stack.pop_many(2)
+        assert self._stack.memory_report() == {'capacity': 5, 'live': 1, 'retained': 0, 'free': 4}
+
+    def test_21_clear_should_release_and_optionally_shrink(self):
+        self._stack.push_many('ABC')
+        self._stack.clear()
+        assert list(self._stack._stack) == [None] * 5
+        assert self._stack.max_size == 5
+
+        stack = ArrayStack(2, growable=True)
+        stack.push_many(range(1, 33))
+        stack.clear()
+        assert stack.capacity == 32
+
+        stack.push_many(range(1, 33))
+        stack.clear(shrink=True)
+        assert stack.capacity == 2
+        assert stack._stack.capacity == 2
+        assert stack.memory_report()['retained'] == 0
+
+    def test_22_character_stack_should_equal_its_clone(self):
+        stack = ArrayStack(2, typecode='u')
+        stack.push('a')
+
+        assert stack == ArrayStack.clone(stack)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,92 @@
+import asyncio
+import unittest
+
+from async_array_stack import AsyncArrayStack
+
+
+class AsyncArrayStackTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self._stack = AsyncArrayStack(2)
+
+    async def test_01_push_and_pop_should_keep_lifo_order(self):
+        await self._stack.push(1)
+        await self._stack.push(2)
+
+        assert await self._stack.pop() == 2
+        assert await self._stack.pop() == 1
+
+    async def test_02_nowait_variants_should_raise_IndexError(self):
+        with self.assertRaises(IndexError):
+            self._stack.pop_nowait()
+
+        self._stack.push_nowait(1)
+        self._stack.push_nowait(2)
+        with self.assertRaises(IndexError):
+            self._stack.push_nowait(3)
+
+    async def test_03_pop_should_suspend_until_a_push(self):
+        popper = asyncio.create_task(self._stack.pop())
+        await asyncio.sleep(0)
+        assert not popper.done()
+
+        self._stack.push_nowait('task')
+        assert await asyncio.wait_for(popper, 1) == 'task'
+
+    async def test_04_waiters_should_be_woken_in_fifo_order(self):
+        self._stack.push_many([1, 2])
+        pushers = [asyncio.create_task(self._stack.push(i)) for i in (3, 4)]
+        await asyncio.sleep(0)
+
+        self._stack.pop_nowait()
+        await asyncio.sleep(0)
+        assert pushers[0].done() and not pushers[1].done()
+        assert self._stack.top == 3
+
+        self._stack.pop_nowait()
+        await asyncio.wait_for(pushers[1], 1)
+        assert self._stack.peek_n(2) == [4, 1]
+
+    async def test_05_cancelled_waiter_should_pass_on_its_wake_up(self):
+        poppers = [asyncio.create_task(self._stack.pop()) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        self._stack.push_nowait('item')
+        poppers[0].cancel()
+        assert await asyncio.wait_for(poppers[1], 1) == 'item'
+        assert len(self._stack) == 0
+
+    async def test_06_join_should_wait_for_task_done(self):
+        await self._stack.push('a')
+        await self._stack.push('b')
+        joiner = asyncio.create_task(self._stack.join())
+
+        self._stack.pop_nowait()
+        self._stack.task_done()
+        await asyncio.sleep(0)
+        assert not joiner.done()
+
+        self._stack.clear()
+        await asyncio.wait_for(joiner, 1)
+
+        with self.assertRaises(ValueError):
+            self._stack.task_done()
+
+    async def test_07_clone_should_count_its_items_as_unfinished(self):
+        await self._stack.push('a')
+        clone = AsyncArrayStack.clone(self._stack)
+        joiner = asyncio.create_task(clone.join())
+        await asyncio.sleep(0)
+        assert type(clone) is AsyncArrayStack
+        assert not joiner.done()
+
+        assert clone.pop_nowait() == 'a'
+        clone.task_done()
+        await asyncio.wait_for(joiner, 1)
+        await asyncio.wait_for(AsyncArrayStack.clone(clone).join(), 1)
+
+        with self.assertRaises(TypeError):
+            AsyncArrayStack.clone([1])
+
+
+if __name__ == '__main__':
+    unittest.main()
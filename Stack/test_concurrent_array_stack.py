@@ -0,0 +1,128 @@
+import io
+import threading
+import time
+import unittest
+
+from concurrent_array_stack import ConcurrentArrayStack
+
+
+class ConcurrentArrayStackTest(unittest.TestCase):
+    def setUp(self):
+        self._stack = ConcurrentArrayStack(3)
+
+    def test_01_push_and_pop_should_keep_lifo_order(self):
+        self._stack.push(1)
+        self._stack.push(2)
+
+        assert self._stack.top == 2
+        assert self._stack.pop() == 2
+        assert self._stack.pop() == 1
+
+    def test_02_timeouts_should_raise_IndexError(self):
+        with self.assertRaises(IndexError):
+            self._stack.pop(timeout=0.01)
+
+        self._stack.push_many([1, 2, 3])
+        with self.assertRaises(IndexError):
+            self._stack.push(4, timeout=0.01)
+
+    def test_03_try_variants_should_never_wait(self):
+        assert self._stack.try_pop('none') == 'none'
+        assert self._stack.try_push(1)
+        self._stack.push_many([2, 3])
+
+        assert not self._stack.try_push(4)
+        assert self._stack.try_pop() == 3
+
+    def test_04_pop_should_wait_for_a_push(self):
+        popped = []
+        consumer = threading.Thread(target=lambda: popped.append(self._stack.pop(timeout=5)))
+        consumer.start()
+        time.sleep(0.05)
+        self._stack.push('task')
+        consumer.join()
+
+        assert popped == ['task']
+
+    def test_05_push_should_wait_for_a_pop(self):
+        self._stack.push_many([1, 2, 3])
+        producer = threading.Thread(target=self._stack.push, args=(4,), kwargs={'timeout': 5})
+        producer.start()
+        time.sleep(0.05)
+
+        assert self._stack.pop() == 3
+        producer.join()
+        assert self._stack.peek_n(3) == [4, 2, 1]
+
+    def test_06_batches_should_wait_for_room_and_items(self):
+        stack = ConcurrentArrayStack(4)
+        popped = []
+        consumer = threading.Thread(target=lambda: popped.extend(stack.pop_many(3, timeout=5)))
+        consumer.start()
+        stack.push(1)
+        time.sleep(0.05)
+        stack.push_many([2, 3])
+        consumer.join()
+
+        assert popped == [3, 2, 1]
+
+        with self.assertRaises(IndexError):
+            stack.push_many(range(5))
+        with self.assertRaises(IndexError):
+            stack.pop_many(5)
+
+    def test_07_concurrent_workers_should_not_lose_updates(self):
+        stack = ConcurrentArrayStack(8)
+        results = []
+        lock = threading.Lock()
+
+        def produce(start):
+            for i in range(start, start + 500):
+                stack.push(i, timeout=5)
+
+        def consume():
+            for _ in range(500):
+                item = stack.pop(timeout=5)
+                with lock:
+                    results.append(item)
+
+        threads = [threading.Thread(target=produce, args=(i * 500,)) for i in range(4)]
+        threads += [threading.Thread(target=consume) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(results) == list(range(2000))
+        assert len(stack) == 0
+
+    def test_08_clone_and_rendering_should_hold_the_lock(self):
+        self._stack.push_many([1, 2])
+        clone = ConcurrentArrayStack.clone(self._stack)
+        clone.push(3)
+
+        assert type(clone) is ConcurrentArrayStack
+        assert clone._lock is not self._stack._lock
+        assert clone._stack._items is not self._stack._stack._items
+        assert self._stack._stack._share_count == [1]
+        assert len(self._stack) == 2 and clone.pop() == 3
+
+        with self.assertRaises(TypeError):
+            ConcurrentArrayStack.clone([1, 2])
+
+        self._stack._lock.acquire()
+        rendered = []
+        reader = threading.Thread(target=lambda: rendered.append(str(self._stack)))
+        reader.start()
+        reader.join(0.05)
+        assert reader.is_alive()
+        self._stack._lock.release()
+        reader.join()
+
+        stream = io.StringIO()
+        self._stack.write_to(stream)
+        assert rendered == [stream.getvalue()]
+
+
+if __name__ == '__main__':
+    unittest.main()